@@ -0,0 +1,152 @@
+import datetime
+import zlib
+
+import storage
+from alert_sources import parse_cap_time
+from county_codes import zone_codes_for_counties
+from metrics import timed_job
+
+try:
+    from config import ALERT_HISTORY_RETENTION_DAYS
+except ImportError:
+    ALERT_HISTORY_RETENTION_DAYS = 400  # Long enough to answer "this year" on December 31st
+
+COMPACT_AFTER_DAYS = 30  # Alerts older than this keep their metadata but lose the summary text
+
+_archived = set()  # IDs of alerts in the last archived feed, so unchanged alerts aren't re-inserted
+
+def _unix(text, default=None):
+    moment = parse_cap_time(text)
+    return int(moment.timestamp()) if moment is not None else default
+
+def archive_alerts(alerts):
+    """Append alerts not yet archived to the history; the first version of each alert is kept."""
+    global _archived
+    new = [alert for alert in alerts if alert.id not in _archived]
+    _archived = {alert.id for alert in alerts}
+    if not new:
+        return 0
+
+    now = int(datetime.datetime.now(datetime.timezone.utc).timestamp())
+    conn = storage.get_connection()
+    conn.execute("BEGIN")
+    try:
+        added = 0
+        for alert in new:
+            issued = _unix(alert.issued, now)
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO alert_history "
+                "(alert_id, event, severity, issued, expires, title, areas, link, summary) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (alert.id, alert.event or alert.title, alert.severity, issued, _unix(alert.expires),
+                 alert.title, alert.areas, alert.link,
+                 zlib.compress(alert.summary.encode("utf-8")) if alert.summary else None)
+            )
+            if cursor.rowcount:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO alert_history_zones (code, issued, alert) VALUES (?, ?, ?)",
+                    [(code, issued, cursor.lastrowid) for code in alert.codes]
+                )
+                added += 1
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    if added:
+        print(f"🗄️ Archived {added} new alert(s).")
+    return added
+
+def _filters(codes=None, event=None, since=None, until=None):
+    """Return (FROM/WHERE clause, parameters) for a history query."""
+    clauses = []
+    params = []
+    if codes:
+        # Walk the (code, issued) primary key for each code instead of scanning every alert
+        zone_clauses = [f"code IN ({', '.join('?' * len(codes))})"]
+        params.extend(sorted(codes))
+        if since is not None:
+            zone_clauses.append("issued >= ?")
+            params.append(int(since.timestamp()))
+        if until is not None:
+            zone_clauses.append("issued < ?")
+            params.append(int(until.timestamp()))
+        clauses.append(f"h.id IN (SELECT alert FROM alert_history_zones WHERE {' AND '.join(zone_clauses)})")
+    if event:
+        clauses.append("h.event = ? COLLATE NOCASE")
+        params.append(event)
+    if since is not None:
+        clauses.append("h.issued >= ?")
+        params.append(int(since.timestamp()))
+    if until is not None:
+        clauses.append("h.issued < ?")
+        params.append(int(until.timestamp()))
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    return f"FROM alert_history h{where}", params
+
+def resolve_codes(counties, state):
+    """Return the SAME/UGC codes for a list of county names in a state."""
+    return zone_codes_for_counties(counties, state) if counties else None
+
+def query_history(counties=None, state="TX", event=None, since=None, until=None, limit=50, codes=None):
+    """Return archived alerts, newest first, matching every filter given.
+
+    counties/state (or explicit SAME/UGC codes) select the area, event is
+    matched case-insensitively, and since/until are aware datetimes.
+    """
+    codes = codes or resolve_codes(counties, state)
+    if counties and not codes:
+        return []
+    source, params = _filters(codes, event, since, until)
+    rows = storage.get_connection().execute(
+        f"SELECT h.* {source} ORDER BY h.issued DESC LIMIT ?", [*params, limit]
+    ).fetchall()
+    return [_row_to_alert(row) for row in rows]
+
+def count_history(counties=None, state="TX", event=None, since=None, until=None, codes=None):
+    """Return how many archived alerts match, with the same filters as query_history."""
+    codes = codes or resolve_codes(counties, state)
+    if counties and not codes:
+        return 0
+    source, params = _filters(codes, event, since, until)
+    return storage.get_connection().execute(f"SELECT COUNT(*) {source}", params).fetchone()[0]
+
+def _row_to_alert(row):
+    def moment(seconds):
+        return datetime.datetime.fromtimestamp(seconds, datetime.timezone.utc) if seconds is not None else None
+
+    return {
+        "id": row["alert_id"],
+        "event": row["event"],
+        "severity": row["severity"],
+        "issued": moment(row["issued"]),
+        "expires": moment(row["expires"]),
+        "title": row["title"],
+        "areas": row["areas"],
+        "link": row["link"],
+        "summary": zlib.decompress(row["summary"]).decode("utf-8") if row["summary"] is not None else None
+    }
+
+@timed_job("compact_history")
+async def compact_history():
+    """Drop alerts past retention and summaries past COMPACT_AFTER_DAYS.
+
+    Freed pages are reused by later inserts, so the database stops growing
+    once retention is reached without needing a VACUUM.
+    """
+    now = datetime.datetime.now(datetime.timezone.utc)
+    expired = int((now - datetime.timedelta(days=ALERT_HISTORY_RETENTION_DAYS)).timestamp())
+    compacted = int((now - datetime.timedelta(days=COMPACT_AFTER_DAYS)).timestamp())
+
+    conn = storage.get_connection()
+    conn.execute("BEGIN")
+    try:
+        conn.execute("DELETE FROM alert_history_zones WHERE issued < ?", (expired,))
+        removed = conn.execute("DELETE FROM alert_history WHERE issued < ?", (expired,)).rowcount
+        stripped = conn.execute(
+            "UPDATE alert_history SET summary = NULL WHERE issued < ? AND summary IS NOT NULL", (compacted,)
+        ).rowcount
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    print(f"🧹 Alert history compacted: {removed} expired alert(s) removed, {stripped} summary(ies) dropped.")
@@ -0,0 +1,139 @@
+import xml.etree.ElementTree as ET
+
+# CAP geocode names whose values we match on
+GEOCODE_NAMES = {"SAME", "UGC", "FIPS6"}
+
+ATOM_NS = "http://www.w3.org/2005/Atom"
+CAP_NS = "urn:oasis:names:tc:emergency:cap:1.2"
+ET.register_namespace("", ATOM_NS)
+ET.register_namespace("cap", CAP_NS)
+
+class Alert:
+    """Compact record holding only the alert fields Radarbot uses."""
+    __slots__ = ("id", "title", "event", "severity", "areas", "codes", "polygon", "issued", "expires", "link", "summary")
+
+    def __init__(self, id, title="", event="", severity="", areas="", codes=frozenset(), polygon=None,
+                 issued="", expires="", link="", summary=""):
+        self.id = id
+        self.title = title
+        self.event = event
+        self.severity = severity
+        self.areas = areas
+        self.codes = codes
+        self.polygon = polygon  # Tuple of (lat, lon) vertices for storm-based alerts
+        self.issued = issued  # Atom published time, when NWS issued the alert
+        self.expires = expires
+        self.link = link
+        self.summary = summary
+
+    def __repr__(self):
+        return f"Alert({self.id!r}, {self.event!r})"
+
+def _local_name(tag):
+    return tag.rsplit("}", 1)[-1]
+
+def parse_polygon(text):
+    """Parse a CAP polygon ("lat,lon lat,lon ...") into (lat, lon) tuples."""
+    try:
+        points = tuple(tuple(float(v) for v in pair.split(",")) for pair in text.split())
+    except ValueError:
+        return None
+    return points if len(points) >= 3 else None
+
+def _entry_to_alert(entry):
+    fields = {}
+    codes = set()
+    for child in entry:
+        name = _local_name(child.tag)
+        if name == "link":
+            fields["link"] = child.get("href", "")
+        elif name == "geocode":
+            value_name = None
+            for part in child:
+                if _local_name(part.tag) == "valueName":
+                    value_name = (part.text or "").strip().upper()
+                elif value_name in GEOCODE_NAMES:
+                    codes.update((part.text or "").split())
+        else:
+            fields[name] = (child.text or "").strip()
+
+    link = fields.get("link", "")
+    return Alert(
+        fields.get("id", link),
+        title=fields.get("title", ""),
+        event=fields.get("event", ""),
+        severity=fields.get("severity", ""),
+        areas=fields.get("areaDesc", ""),
+        codes=frozenset(codes),
+        polygon=parse_polygon(fields.get("polygon", "")),
+        issued=fields.get("published") or fields.get("sent", ""),
+        expires=fields.get("expires", ""),
+        link=link,
+        summary=fields.get("summary", "")
+    )
+
+class AlertFeedParser:
+    """Incremental parser for the api.weather.gov Atom alerts feed.
+
+    Feed it raw chunks as they arrive; each call yields the alerts whose
+    <entry> has been completed, and the parsed XML is discarded right away.
+    """
+
+    def __init__(self):
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._root = None
+
+    def feed(self, chunk):
+        self._parser.feed(chunk)
+        return self._drain()
+
+    def close(self):
+        self._parser.close()
+        return self._drain()
+
+    def _drain(self):
+        alerts = []
+        for event, elem in self._parser.read_events():
+            if event == "start":
+                if self._root is None:
+                    self._root = elem
+            elif _local_name(elem.tag) == "entry":
+                alerts.append(_entry_to_alert(elem))
+                if elem is not self._root:
+                    self._root.remove(elem)  # Keep memory flat on large feeds
+        return alerts
+
+def parse_alert_feed(data):
+    """Parse a complete Atom document, or a single <entry>, into Alert records."""
+    parser = AlertFeedParser()
+    return parser.feed(data) + parser.close()
+
+def _alert_to_entry(alert):
+    entry = ET.Element(f"{{{ATOM_NS}}}entry")
+    ET.SubElement(entry, f"{{{ATOM_NS}}}id").text = alert.id
+    ET.SubElement(entry, f"{{{ATOM_NS}}}title").text = alert.title
+    ET.SubElement(entry, f"{{{ATOM_NS}}}published").text = alert.issued
+    ET.SubElement(entry, f"{{{ATOM_NS}}}link", href=alert.link)
+    ET.SubElement(entry, f"{{{ATOM_NS}}}summary").text = alert.summary
+    ET.SubElement(entry, f"{{{CAP_NS}}}event").text = alert.event
+    ET.SubElement(entry, f"{{{CAP_NS}}}expires").text = alert.expires
+    ET.SubElement(entry, f"{{{CAP_NS}}}severity").text = alert.severity
+    ET.SubElement(entry, f"{{{CAP_NS}}}areaDesc").text = alert.areas
+    ET.SubElement(entry, f"{{{CAP_NS}}}polygon").text = " ".join(f"{lat},{lon}" for lat, lon in alert.polygon or ())
+
+    geocode = ET.SubElement(entry, f"{{{CAP_NS}}}geocode")
+    for code in sorted(alert.codes):
+        ET.SubElement(geocode, f"{{{ATOM_NS}}}valueName").text = "SAME" if code.isdigit() else "UGC"
+        ET.SubElement(geocode, f"{{{ATOM_NS}}}value").text = code
+    return entry
+
+def render_alert_entry(alert):
+    """Serialize an Alert as a standalone Atom <entry> (the inverse of parse_alert_feed)."""
+    return ET.tostring(_alert_to_entry(alert), encoding="unicode")
+
+def render_alert_feed(alerts, title="Current watches, warnings, and advisories"):
+    """Serialize Alerts as an Atom feed shaped like api.weather.gov's."""
+    feed = ET.Element(f"{{{ATOM_NS}}}feed")
+    ET.SubElement(feed, f"{{{ATOM_NS}}}title").text = title
+    feed.extend(_alert_to_entry(alert) for alert in alerts)
+    return ET.tostring(feed, encoding="unicode", xml_declaration=True)
@@ -0,0 +1,186 @@
+import asyncio
+import datetime
+
+import aiohttp
+
+from alert_parser import AlertFeedParser, parse_alert_feed, render_alert_feed
+from http_client import get_session, fetch_if_modified
+from sharding import fetch_shared
+
+try:
+    from config import ALERT_FEED_URL  # Point at alert_test_server.py for local testing
+except ImportError:
+    ALERT_FEED_URL = "https://api.weather.gov/alerts/active.atom"  # Nationwide, routed per guild
+
+FEED_CHUNK_SIZE = 64 * 1024  # Bytes handed to the streaming parser at a time
+STREAM_IDLE_TIMEOUT = 90     # Seconds without a byte (or keepalive) before reconnecting
+STREAM_MAX_BACKOFF = 60      # Seconds between reconnect attempts, at most
+SHARED_FEED_TTL = 20         # Seconds one worker's fetch of the feed serves every worker
+
+def parse_cap_time(text):
+    """Parse a CAP/Atom timestamp into an aware datetime (None if missing or malformed)."""
+    try:
+        moment = datetime.datetime.fromisoformat(text)
+    except (TypeError, ValueError):
+        return None
+    return moment if moment.tzinfo is not None else moment.replace(tzinfo=datetime.timezone.utc)
+
+def is_expired(alert, now=None):
+    """True once an alert's CAP expires time has passed (alerts without one never expire)."""
+    expires = parse_cap_time(alert.expires)
+    return expires is not None and expires <= (now or datetime.datetime.now(datetime.timezone.utc))
+
+async def parse_alert_response(resp):
+    """Stream the response body through the Atom parser as it downloads."""
+    parser = AlertFeedParser()
+    alerts = []
+    async for chunk in resp.content.iter_chunked(FEED_CHUNK_SIZE):
+        alerts.extend(parser.feed(chunk))
+    alerts.extend(parser.close())
+    return alerts
+
+async def read_events(lines):
+    """Yield (event, data) pairs from an async iterator of Server-Sent Events lines."""
+    event, data = "message", []
+    async for line in lines:
+        if isinstance(line, bytes):
+            line = line.decode("utf-8")
+        line = line.rstrip("\r\n")
+        if not line:
+            if data:
+                yield event, "\n".join(data)
+            event, data = "message", []
+        elif line.startswith(":"):
+            continue  # Comment / keepalive
+        else:
+            field, _, value = line.partition(":")
+            value = value[1:] if value.startswith(" ") else value
+            if field == "event":
+                event = value
+            elif field == "data":
+                data.append(value)
+    if data:
+        yield event, "\n".join(data)
+
+class AlertSource:
+    """Something that delivers alerts onto the shared alert queue.
+
+    Each item put on the queue is (source name, alerts), a snapshot of every
+    alert the source currently considers active; the consumer keeps the
+    latest snapshot per source and merges them.
+    """
+
+    name = "source"
+
+    def publish(self, queue, alerts):
+        queue.put_nowait((self.name, list(alerts)))
+
+class AtomFeedSource(AlertSource):
+    """Polls the api.weather.gov Atom feed with conditional GETs."""
+
+    name = "atom"
+
+    def __init__(self, url=ALERT_FEED_URL):
+        self.url = url
+
+    async def poll(self, queue, session=None):
+        """Fetch the feed once, publishing a snapshot only if it changed. Returns whether it did."""
+        alerts, changed = await fetch_shared(
+            f"alerts:{self.url}",
+            lambda: fetch_if_modified(self.url, parse_alert_response, session=session),
+            SHARED_FEED_TTL, encode=render_alert_feed, decode=parse_alert_feed
+        )
+        if changed:
+            self.publish(queue, alerts)
+        return changed
+
+class EventStreamSource(AlertSource):
+    """Base for sources speaking the alert event stream protocol.
+
+    Events (Server-Sent Events framing):
+      snapshot — data is an Atom feed holding every active alert
+      alert    — data is one Atom <entry>, new or updated
+      cancel   — data is the ID of an alert that is no longer active
+      delay    — data is seconds to wait (honoured by replays only)
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self._active = {}  # Alert ID -> Alert
+
+    async def handle_event(self, queue, event, data):
+        if event == "snapshot":
+            self._active = {alert.id: alert for alert in parse_alert_feed(data)}
+        elif event == "alert":
+            for alert in parse_alert_feed(data):
+                self._active[alert.id] = alert
+        elif event == "cancel":
+            self._active.pop(data.strip(), None)
+        else:
+            return
+        self.publish(queue, self._active.values())
+
+class StreamingSource(EventStreamSource):
+    """Holds a long-lived HTTP event stream open, reconnecting with backoff."""
+
+    def __init__(self, url, name="stream", session=None):
+        super().__init__(name)
+        self.url = url
+        self.session = session
+
+    async def run(self, queue):
+        backoff = 1
+        while True:
+            try:
+                session = self.session or get_session()
+                timeout = aiohttp.ClientTimeout(total=None, sock_read=STREAM_IDLE_TIMEOUT)
+                async with session.get(self.url, headers={"Accept": "text/event-stream"}, timeout=timeout) as resp:
+                    resp.raise_for_status()
+                    print(f"📶 Alert stream connected: {self.url}")
+                    backoff = 1
+                    async for event, data in read_events(resp.content):
+                        await self.handle_event(queue, event, data)
+                print("⚠️ Alert stream closed by server. Reconnecting...")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️ Alert stream error: {e}. Reconnecting in {backoff}s...")
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, STREAM_MAX_BACKOFF)
+
+class ReplaySource(EventStreamSource):
+    """Replays a recorded event stream from a file or a TCP socket.
+
+    `delay` events are scaled by 1/speed, so speed=10 plays back ten times faster.
+    """
+
+    def __init__(self, path=None, host=None, port=None, speed=1.0, name="replay"):
+        super().__init__(name)
+        self.path = path
+        self.host = host
+        self.port = port
+        self.speed = speed
+
+    async def _lines(self):
+        if self.path is not None:
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    yield line
+        else:
+            reader, writer = await asyncio.open_connection(self.host, self.port)
+            try:
+                async for line in reader:
+                    yield line
+            finally:
+                writer.close()
+
+    async def handle_event(self, queue, event, data):
+        if event == "delay":
+            await asyncio.sleep(float(data) / self.speed)
+        else:
+            await super().handle_event(queue, event, data)
+
+    async def run(self, queue):
+        async for event, data in read_events(self._lines()):
+            await self.handle_event(queue, event, data)
+        print(f"⏹️ Alert replay '{self.name}' finished.")
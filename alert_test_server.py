@@ -0,0 +1,141 @@
+"""Local stand-in for the NWS alert feed, for testing Radarbot without api.weather.gov.
+
+Serves:
+  GET    /alerts/active.atom  Atom feed of active alerts (ETag + Cache-Control, like the real feed)
+  GET    /alerts/stream       Server-Sent Events push stream (snapshot, then alert/cancel events)
+  POST   /alerts              Add or update an alert from JSON; pushed to every stream client
+  DELETE /alerts/{id}         Cancel an alert
+
+Point the bot at it in config.py:
+  ALERT_FEED_URL = "http://127.0.0.1:8081/alerts/active.atom"
+  ALERT_STREAM_URL = "http://127.0.0.1:8081/alerts/stream"
+
+Example:
+  curl -X POST localhost:8081/alerts -d '{"event": "Tornado Warning", "codes": ["048451", "TXC451"]}'
+"""
+import argparse
+import asyncio
+import datetime
+import itertools
+
+from aiohttp import web
+
+from alert_parser import Alert, render_alert_entry, render_alert_feed
+
+KEEPALIVE_INTERVAL = 15  # Seconds between SSE comments on an idle stream
+
+class AlertStore:
+    """Active alerts plus the queues of every connected stream client."""
+
+    def __init__(self):
+        self.alerts = {}
+        self.version = 0
+        self.subscribers = set()
+        self._ids = itertools.count(1)
+
+    def _broadcast(self, event, data):
+        for queue in self.subscribers:
+            queue.put_nowait((event, data))
+
+    def upsert(self, alert):
+        self.alerts[alert.id] = alert
+        self.version += 1
+        self._broadcast("alert", render_alert_entry(alert))
+
+    def cancel(self, alert_id):
+        if self.alerts.pop(alert_id, None) is None:
+            return False
+        self.version += 1
+        self._broadcast("cancel", alert_id)
+        return True
+
+    def alert_from_json(self, body):
+        alert_id = body.get("id") or f"urn:oid:2.49.0.1.840.0.test.{next(self._ids)}"
+        event = body.get("event", "Special Weather Statement")
+        now = datetime.datetime.now(datetime.timezone.utc)
+        issued = body.get("issued") or now.isoformat(timespec="milliseconds")
+        expires = body.get("expires") or (now + datetime.timedelta(hours=1)).isoformat(timespec="seconds")
+        polygon = body.get("polygon")
+        return Alert(
+            alert_id,
+            title=body.get("title", f"{event} issued by Radarbot test server"),
+            event=event,
+            severity=body.get("severity", "Severe"),
+            areas=body.get("areas", ""),
+            codes=frozenset(body.get("codes", [])),
+            polygon=tuple(tuple(point) for point in polygon) if polygon else None,
+            issued=issued,
+            expires=expires,
+            link=body.get("link", f"http://localhost/alerts/{alert_id}"),
+            summary=body.get("summary", f"Test {event}.")
+        )
+
+def sse(event, data):
+    lines = "".join(f"data: {line}\n" for line in data.splitlines() or [""])
+    return f"event: {event}\n{lines}\n".encode("utf-8")
+
+async def get_feed(request):
+    store = request.app["store"]
+    etag = f'"{store.version}"'
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={request.app['max_age']}"}
+    if request.headers.get("If-None-Match") == etag:
+        return web.Response(status=304, headers=headers)
+    return web.Response(
+        text=render_alert_feed(store.alerts.values()), content_type="application/atom+xml", headers=headers
+    )
+
+async def get_stream(request):
+    store = request.app["store"]
+    resp = web.StreamResponse(headers={"Content-Type": "text/event-stream", "Cache-Control": "no-cache"})
+    await resp.prepare(request)
+
+    queue = asyncio.Queue()
+    store.subscribers.add(queue)
+    try:
+        await resp.write(sse("snapshot", render_alert_feed(store.alerts.values())))
+        while True:
+            try:
+                event, data = await asyncio.wait_for(queue.get(), KEEPALIVE_INTERVAL)
+            except asyncio.TimeoutError:
+                await resp.write(b": keepalive\n\n")
+                continue
+            await resp.write(sse(event, data))
+    except ConnectionResetError:
+        pass  # Client went away
+    finally:
+        store.subscribers.discard(queue)
+    return resp
+
+async def post_alert(request):
+    store = request.app["store"]
+    alert = store.alert_from_json(await request.json())
+    store.upsert(alert)
+    print(f"➕ {alert.event} {alert.id}")
+    return web.json_response({"id": alert.id})
+
+async def delete_alert(request):
+    alert_id = request.match_info["alert_id"]
+    if not request.app["store"].cancel(alert_id):
+        raise web.HTTPNotFound()
+    print(f"➖ {alert_id}")
+    return web.json_response({"id": alert_id})
+
+def make_app(max_age=30):
+    app = web.Application()
+    app["store"] = AlertStore()
+    app["max_age"] = max_age
+    app.add_routes([
+        web.get("/alerts/active.atom", get_feed),
+        web.get("/alerts/stream", get_stream),
+        web.post("/alerts", post_alert),
+        web.delete("/alerts/{alert_id}", delete_alert)
+    ])
+    return app
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in for the NWS alert feed.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--max-age", type=int, default=30, help="Cache-Control max-age on the Atom feed")
+    args = parser.parse_args()
+    web.run_app(make_app(args.max_age), host=args.host, port=args.port)
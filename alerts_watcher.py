@@ -1,18 +1,39 @@
 import discord
-import aiohttp
 import asyncio
-import feedparser
 import datetime
+import zlib
+
+import storage
+
+from alert_history import archive_alerts
+from alert_sources import AtomFeedSource, is_expired, parse_cap_time
+from county_codes import zone_codes_for_counties
+from discord_dispatcher import dispatcher, alert_priority, PRIORITY_WARNING, PRIORITY_ALERT, PRIORITY_STATUS
+from message_cache import edit_or_post, ALERT_STATUS, ALERT_TIMESTAMP
+from http_client import seconds_until_stale
+from metrics import observe, timed_job
+from daily_spc_outlook import fetch_outlook, get_current_risk, RISK_LEVELS, SPC_TEXT_URL_DAY1
+from location_manager import get_city_state, get_lat_lon, has_saved_location
+from server_config_manager import get_server_config
+from sharding import owns_guild
+from spatial_index import PolygonGrid
 
 # --- CONFIGURATION ---
-from config import ALERTS_CHANNEL_ID, ALERT_STATUS_MESSAGE_ID, ALERT_TIMESTAMP_MESSAGE_ID
+from config import ALERTS_CHANNEL_ID, GUILD_ID
 
+# Default watch area for the home guild until it runs /setcounties; other guilds
+# without counties are matched by storm polygon only
 WATCHED_COUNTIES = [
     "Haskell", "Throckmorton", "Fisher", "Jones", "Shackleford", "Nolan", "Taylor", "Callahan",
     "Sterling", "Coke", "Runnels", "Coleman", "Brown", "Irion", "Tom Green", "Concho",
     "McCulloch", "San Saba", "Crockett", "Schleicher", "Menard", "Mason", "Sutton", "Kimble"
 ]
-NOAA_FEED_URL = "https://api.weather.gov/alerts/active.atom?area=TX"
+
+# --- ADAPTIVE POLLING (seconds between alert checks) ---
+POLL_INTERVAL_WARNING = 30    # A warning is active in a watched area
+POLL_INTERVAL_ELEVATED = 60   # Watches/advisories active, or SPC Day 1 risk of Slight or higher
+POLL_INTERVAL_MARGINAL = 120  # SPC Day 1 Marginal risk
+POLL_INTERVAL_QUIET = 300     # Nothing going on
 
 def get_alert_emoji(title):
     title = title.lower()
@@ -27,134 +48,370 @@ def get_alert_emoji(title):
 
 # Track posted alerts
 posted_alerts = set()
-last_alert_time = datetime.datetime.utcnow()
-alert_message_ids = []  # Messages created for alerts (to be deleted later)
+last_alert_times = {}  # Guild ID -> last time an alert matched that guild
+alert_messages = {}  # Guild ID -> {alert ID -> {"message_id": ..., "digest": CRC-32 of the posted content}}
+last_status_texts = {}  # Guild ID -> last content written to its status message
+
+NO_ALERTS_TEXT = "✅ **No Active Warnings**\nRadarbot - Enjoy the calm!"
+
+# --- ZONE CODE -> GUILD INDEX ---
+county_index_version = 0  # Bumped whenever a guild's watched counties or location change
+_county_index = {"key": None, "index": {}, "points": {}}
+_routing = {"key": None, "routed": {}}  # Routing result for the last parsed feed
+
+def get_alerts_channel_id(guild_id):
+    """Return the guild's alerts channel, falling back to config.py for the home guild."""
+    channel_id = get_server_config(guild_id).get("alerts_channel")
+    if channel_id is None and guild_id == GUILD_ID:
+        return ALERTS_CHANNEL_ID
+    return channel_id
+
+def get_watched_counties(guild_id):
+    """Return the guild's watched counties, falling back to WATCHED_COUNTIES for the home guild."""
+    counties = get_server_config(guild_id).get("watched_counties")
+    if not counties and guild_id == GUILD_ID:
+        return WATCHED_COUNTIES
+    return counties or []
+
+def get_guild_zone_codes(guild_id):
+    """Return the frozen set of SAME/UGC codes a guild watches."""
+    _, state = get_city_state(guild_id)
+    return zone_codes_for_counties(get_watched_counties(guild_id), state)
+
+def invalidate_county_index():
+    """Force the zone index to be rebuilt on the next alert check."""
+    global county_index_version
+    county_index_version += 1
+
+def get_county_index(guild_ids):
+    """Return (key, index, points) for routing alerts to guilds.
+
+    index maps a SAME/UGC code -> set of guild IDs; points maps a guild
+    location (lat, lon) -> set of guild IDs for polygon matching. Guilds
+    without a saved location other than the home guild get no point, since
+    the default location would match them to storms in San Angelo.
+    """
+    key = (county_index_version, tuple(sorted(guild_ids)))
+    if _county_index["key"] != key:
+        index = {}
+        points = {}
+        for guild_id in guild_ids:
+            for code in get_guild_zone_codes(guild_id):
+                index.setdefault(code, set()).add(guild_id)
+            if guild_id == GUILD_ID or has_saved_location(guild_id):
+                points.setdefault(tuple(get_lat_lon(guild_id)), set()).add(guild_id)
+        _county_index["key"] = key
+        _county_index["index"] = index
+        _county_index["points"] = points
+    return key, _county_index["index"], _county_index["points"]
+
+def route_alerts(alerts, index, points):
+    """Return guild ID -> [Alert], matching zone codes and alert polygons."""
+    matches = {}  # Alert position -> guild IDs, keeps feed order
+    grid = PolygonGrid()
+
+    for position, alert in enumerate(alerts):
+        guild_ids = set()
+        for code in alert.codes:
+            guild_ids.update(index.get(code, ()))
+        matches[position] = guild_ids
+        if alert.polygon:
+            grid.insert(alert.polygon, position)
+
+    # One pass over the distinct guild locations against the polygon grid
+    for point, positions in grid.query_points(points).items():
+        for position in positions:
+            matches[position].update(points[point])
+
+    routed = {}
+    for position, guild_ids in matches.items():
+        for guild_id in guild_ids:
+            routed.setdefault(guild_id, []).append(alerts[position])
+    return routed
+
+# --- PERSISTENCE ---
+# Each alert message is saved under its own key as soon as Discord confirms the
+# post/edit/delete, so a restart never reposts or orphans it and a busy guild
+# never re-encodes all of its messages; the rest is saved by checkpoint_alert_state.
+ALERT_MESSAGES_PREFIX = "alert_messages:"  # alert_messages:{guild ID}:{alert ID}
+LAST_ALERT_PREFIX = "last_alert_time:"
+STATUS_TEXT_PREFIX = "status_text:"
+
+def save_alert_message(guild_id, alert_id):
+    """Save (or forget, once it is no longer tracked) one guild's message for an alert."""
+    key = f"{ALERT_MESSAGES_PREFIX}{guild_id}:{alert_id}"
+    tracked = alert_messages.get(guild_id, {}).get(alert_id)
+    if tracked is None:
+        storage.delete_state(key)
+    else:
+        storage.set_state(key, tracked)
 
-async def fetch_alerts():
-    async with aiohttp.ClientSession() as session:
-        async with session.get(NOAA_FEED_URL) as resp:
-            text = await resp.text()
-            feed = feedparser.parse(text)
-            return feed.entries
+def checkpoint_alert_state():
+    """Save last-match times and status texts for this process's guilds in one transaction.
 
+    Guilds owned by other workers are skipped; their restored values here are
+    stale and would overwrite what those workers saved.
+    """
+    values = {f"{LAST_ALERT_PREFIX}{g}": moment.isoformat() for g, moment in last_alert_times.items() if owns_guild(g)}
+    values.update((f"{STATUS_TEXT_PREFIX}{g}", text) for g, text in last_status_texts.items() if owns_guild(g))
+    storage.set_states(values)
+
+def restore_alert_state():
+    """Load tracked alert messages and status state saved by earlier runs."""
+    for key, tracked in storage.get_states(ALERT_MESSAGES_PREFIX).items():
+        guild_id, _, alert_id = key.partition(":")  # Alert IDs contain colons; guild IDs don't
+        alert_messages.setdefault(int(guild_id), {})[alert_id] = tracked
+    for guild_id, moment in storage.get_states(LAST_ALERT_PREFIX).items():
+        last_alert_times[int(guild_id)] = datetime.datetime.fromisoformat(moment)
+    for guild_id, text in storage.get_states(STATUS_TEXT_PREFIX).items():
+        last_status_texts[int(guild_id)] = text
+    count = sum(len(tracked) for tracked in alert_messages.values())
+    print(f"♻️ Restored {count} tracked alert message(s) across {len(alert_messages)} guild(s).")
+
+# --- INGESTION ---
+# Every alert source publishes (source name, active alerts) snapshots onto this queue
+alert_queue = asyncio.Queue()
+atom_source = AtomFeedSource()
+_snapshots = {}         # Source name -> latest snapshot of active alerts
+_snapshot_version = 0   # Bumped whenever any source delivers a snapshot
+_withdrawn = set()      # Alert IDs a source dropped that another source's older snapshot still lists
+watch_started = datetime.datetime.now(datetime.timezone.utc)  # Alerts issued earlier don't count toward delivery latency
+_dispatch_lock = asyncio.Lock()
+
+def store_snapshot(source, alerts):
+    global _snapshot_version
+    current_ids = {alert.id for alert in alerts}
+    _withdrawn.update(alert.id for alert in _snapshots.get(source, ()) if alert.id not in current_ids)
+    _snapshots[source] = alerts
+    _snapshot_version += 1
+
+    # Forget withdrawals once no source lists the alert any more
+    listed = {alert.id for snapshot in _snapshots.values() for alert in snapshot}
+    _withdrawn.intersection_update(listed)
+
+def apply_snapshots():
+    """Move every snapshot waiting on the queue into _snapshots."""
+    while not alert_queue.empty():
+        store_snapshot(*alert_queue.get_nowait())
+
+def active_alerts():
+    """Merge the latest snapshot from every source, dropping duplicates, withdrawn and expired alerts."""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    merged = {}
+    for alerts in _snapshots.values():
+        for alert in alerts:
+            if alert.id not in _withdrawn and not is_expired(alert, now):
+                merged[alert.id] = alert
+    return list(merged.values())
+
+@timed_job("process_alerts")
 async def process_alerts(bot):
-    global last_alert_time, alert_message_ids
+    """Poll the Atom feed, then handle it along with anything else waiting in the queue."""
+    await atom_source.poll(alert_queue)
+    apply_snapshots()
+    await dispatch_alerts(bot)
 
-    channel = bot.get_channel(ALERTS_CHANNEL_ID)
+async def consume_alerts(bot):
+    """Handle snapshots from push sources the moment they arrive."""
+    await bot.wait_until_ready()
+    while not bot.is_closed():
+        store_snapshot(*await alert_queue.get())
+        apply_snapshots()  # Fold in anything that queued up behind it
+        try:
+            await dispatch_alerts(bot)
+        except Exception as e:
+            print(f"❌ Failed to handle pushed alerts: {e}")
+
+async def dispatch_alerts(bot):
+    """Route the merged active alerts to guilds and reconcile their channels."""
+    async with _dispatch_lock:
+        guild_ids = [guild.id for guild in bot.guilds if get_alerts_channel_id(guild.id) is not None]
+        alerts = active_alerts()
+        if owns_guild(GUILD_ID):  # One worker archives, the same one that compacts the history
+            try:
+                archive_alerts(alerts)
+            except Exception as e:
+                print(f"⚠️ Failed to archive alerts: {e}")
+        index_key, index, points = get_county_index(guild_ids)
+
+        routing_key = (index_key, _snapshot_version, len(alerts))
+        if _routing["key"] != routing_key:
+            _routing["key"] = routing_key
+            _routing["routed"] = route_alerts(alerts, index, points)
+        else:
+            print("🟰 Alert feed unchanged — reusing previous matches.")
+        routed = _routing["routed"]
+
+        now_str = datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+        results = await asyncio.gather(
+            *(update_guild_alerts(bot, guild_id, routed.get(guild_id, []), now_str) for guild_id in guild_ids),
+            return_exceptions=True
+        )
+        for error in results:
+            if isinstance(error, Exception):
+                print(f"❌ Failed to update alerts for a guild: {error}")
+
+async def next_poll_interval():
+    """Return how long to wait before the next alert check, based on the current hazard level."""
+    active = [alert for alerts in _routing["routed"].values() for alert in alerts]
+    if any((alert.event or alert.title).lower().endswith("warning") for alert in active):
+        interval = POLL_INTERVAL_WARNING
+    else:
+        try:
+            await fetch_outlook(SPC_TEXT_URL_DAY1, label="Day 1")  # Cached until the next issuance
+        except Exception as e:
+            print(f"⚠️ Failed to refresh SPC risk for alert polling: {e}")
+        risk = RISK_LEVELS.index(get_current_risk())
+        if active or risk >= RISK_LEVELS.index("SLIGHT"):
+            interval = POLL_INTERVAL_ELEVATED
+        elif risk >= RISK_LEVELS.index("MARGINAL"):
+            interval = POLL_INTERVAL_MARGINAL
+        else:
+            interval = POLL_INTERVAL_QUIET
+
+    # Polling before the feed's Cache-Control/Expires lifetime runs out would only return the cached copy
+    return max(interval, round(seconds_until_stale(atom_source.url)))
+
+async def update_guild_alerts(bot, guild_id, alerts, now_str):
+    channel = bot.get_channel(get_alerts_channel_id(guild_id))
     if not channel:
-        print("⚠️ Alert channel not found.")
+        print(f"⚠️ Alert channel not found for guild {guild_id}.")
         return
 
-    try:
-        status_msg = await channel.fetch_message(ALERT_STATUS_MESSAGE_ID)
-        timestamp_msg = await channel.fetch_message(ALERT_TIMESTAMP_MESSAGE_ID)
-    except Exception as e:
-        print(f"❌ Failed to fetch status or timestamp messages: {e}")
-        return
+    if alerts:
+        last_alert_times[guild_id] = datetime.datetime.utcnow()
 
-    # Always clear embed just in case
-    await status_msg.edit(content="🔄 Checking for new alerts...", embed=None)
+    await reconcile_alerts(channel, guild_id, alerts)
 
-    # Delete previously posted alert messages
-    for msg_id in alert_message_ids:
-        try:
-            msg = await channel.fetch_message(msg_id)
-            await msg.delete()
-        except Exception:
-            pass
-    alert_message_ids.clear()
-
-    entries = await fetch_alerts()
-    new_alerts = []
-
-    for entry in entries:
-        title = entry.title
-        summary = entry.summary
-        link = entry.link
-        area = entry.get("cap_areadesc", "")
-
-        # Split cap_areadesc into counties
-        alert_counties = [c.strip().lower() for c in area.split(";")] if area else []
-        fallback_text = f"{title} {summary}".lower()
-
-        # Use accurate county matching with fallback
-        if any(wc.lower() in alert_counties for wc in WATCHED_COUNTIES) or (
-            not alert_counties and any(wc.lower() in fallback_text for wc in WATCHED_COUNTIES)
-        ):
-            new_alerts.append((title, summary, link))
-            last_alert_time = datetime.datetime.utcnow()
-
-    now_str = datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
-
-    if new_alerts:
-        pointer_text = f"🔴 **{len(new_alerts)} Active Severe Weather Alert(s)**\n⚠️ See messages below ⬇️"
-        await status_msg.edit(content=pointer_text, embed=None)
-
-        chunks = []
-        current = ""
-
-        for title, summary, link in new_alerts:
-            emoji = get_alert_emoji(title)
-            alert_text = f"**{emoji} [{title}]({link})**\n*{summary.strip()}*\n\n"
-            if len(current) + len(alert_text) > 2000:
-                chunks.append(current)
-                current = alert_text
-            else:
-                current += alert_text
-
-        if current:
-            chunks.append(current)
-
-        for chunk in chunks:
-            msg = await channel.send(chunk)
-            alert_message_ids.append(msg.id)
-
-        print(f"✅ Posted {len(new_alerts)} alerts across {len(chunks)} messages.")
-    else:
-        last_alert_time = datetime.datetime.utcnow()
-        await status_msg.edit(content="✅ **No Active Warnings**\nRadarbot - Enjoy the calm!", embed=None)
-        print("🟢 No alerts found — status message cleared.")
+    # Only the home guild has pinned status/timestamp messages
+    if guild_id != GUILD_ID:
+        return
 
-    try:
-        await timestamp_msg.edit(content=f"📡 Last alert check: `{now_str} UTC`")
-    except Exception as e:
-        print(f"⚠️ Failed to update timestamp message: {e}")
+    status_channel = get_status_channel(bot)
+    if status_channel is None:
+        return
 
+    if alerts:
+        status_text = f"🔴 **{len(alerts)} Active Severe Weather Alert(s)**\n⚠️ See messages below ⬇️"
+    else:
+        status_text = NO_ALERTS_TEXT
 
-async def clear_status(bot):
-    global last_alert_time, alert_message_ids
+    await update_status(status_channel, guild_id, status_text)
+    await update_timestamp(status_channel, guild_id, now_str)
 
+def get_status_channel(bot):
+    """Return the channel holding the home guild's status/timestamp messages."""
     channel = bot.get_channel(ALERTS_CHANNEL_ID)
     if not channel:
+        print("⚠️ Alert status channel not found.")
+    return channel
+
+def content_digest(content):
+    return zlib.crc32(content.encode("utf-8"))
+
+def render_alert(alert):
+    emoji = get_alert_emoji(alert.title)
+    return f"**{emoji} [{alert.title}]({alert.link})**\n*{alert.summary.strip()}*"[:2000]
+
+async def reconcile_alerts(channel, guild_id, alerts):
+    """Post new alerts, edit changed ones and delete expired ones, keyed on alert ID."""
+    current = {alert.id: (alert, render_alert(alert)) for alert in alerts}
+    tracked_alerts = alert_messages.setdefault(guild_id, {})
+
+    async def delete(alert_id):
+        tracked = tracked_alerts.pop(alert_id)
+        try:
+            await dispatcher.delete(channel.get_partial_message(tracked["message_id"]), PRIORITY_ALERT)
+            result = "deleted"
+        except discord.NotFound:
+            result = None
+        except Exception as e:
+            tracked_alerts[alert_id] = tracked  # Retry on the next check instead of orphaning the message
+            print(f"⚠️ Failed to delete expired alert message: {e}")
+            return None
+        save_alert_message(guild_id, alert_id)
+        return result
+
+    async def post(alert, content):
+        priority = alert_priority(alert)
+        tracked = tracked_alerts.get(alert.id)
+        if tracked is not None:
+            try:
+                await dispatcher.edit(channel.get_partial_message(tracked["message_id"]), priority, content=content)
+                tracked["digest"] = content_digest(content)
+                save_alert_message(guild_id, alert.id)
+                return "edited"
+            except discord.NotFound:
+                pass  # Message was removed by hand — post it again
+
+        msg = await dispatcher.send(channel, priority, content=content)
+        tracked_alerts[alert.id] = {"message_id": msg.id, "digest": content_digest(content)}
+        save_alert_message(guild_id, alert.id)
+        if tracked is None:
+            record_delivery(alert, priority)
+        return "posted"
+
+    # Queue everything at once; the dispatcher puts warnings ahead of the rest
+    jobs = [delete(alert_id) for alert_id in tracked_alerts if alert_id not in current]
+    jobs.extend(
+        post(alert, content) for alert_id, (alert, content) in current.items()
+        if tracked_alerts.get(alert_id, {}).get("digest") != content_digest(content)
+    )
+    results = await asyncio.gather(*jobs, return_exceptions=True)
+    for error in (r for r in results if isinstance(r, Exception)):
+        print(f"❌ Failed to post alert in guild {guild_id}: {error}")
+
+    if any(r in ("posted", "edited", "deleted") for r in results):
+        print(
+            f"✅ Alerts reconciled for guild {guild_id}: {len(current)} active — {results.count('posted')} posted, "
+            f"{results.count('edited')} edited, {results.count('deleted')} deleted."
+        )
+
+def record_delivery(alert, priority):
+    """Record issued → posted latency for alerts issued while the bot was watching."""
+    issued = parse_cap_time(alert.issued)
+    if issued is None or issued < watch_started:
         return
+    latency = (datetime.datetime.now(datetime.timezone.utc) - issued).total_seconds()
+    label = "warning" if priority == PRIORITY_WARNING else "other"
+    observe("radarbot_alert_delivery_seconds", max(0.0, latency), priority=label)
 
+async def update_status(channel, guild_id, status_text):
+    if status_text == last_status_texts.get(guild_id):
+        return
+    await edit_or_post(channel, guild_id, ALERT_STATUS, PRIORITY_STATUS, content=status_text, embed=None)
+    last_status_texts[guild_id] = status_text
+
+async def update_timestamp(channel, guild_id, now_str):
     try:
-        status_msg = await channel.fetch_message(ALERT_STATUS_MESSAGE_ID)
-        timestamp_msg = await channel.fetch_message(ALERT_TIMESTAMP_MESSAGE_ID)
+        await edit_or_post(channel, guild_id, ALERT_TIMESTAMP, PRIORITY_STATUS, content=f"📡 Last alert check: `{now_str} UTC`")
     except Exception as e:
-        print(f"❌ Failed to fetch status or timestamp messages: {e}")
-        return
+        print(f"⚠️ Failed to update timestamp message: {e}")
 
+
+@timed_job("clear_status")
+async def clear_status(bot):
+    """Clear alert messages for guilds that haven't matched an alert in the last hour."""
     now = datetime.datetime.utcnow()
     now_str = now.strftime("%Y-%m-%d %H:%M:%S")
-    difference = (now - last_alert_time).total_seconds()
 
-    if difference > 3600:
-        for msg_id in alert_message_ids:
-            try:
-                msg = await channel.fetch_message(msg_id)
-                await msg.delete()
-            except Exception:
-                pass
-        alert_message_ids.clear()
-
-        await status_msg.edit(content="✅ **No Active Warnings**\nRadarbot - Enjoy the calm!", embed=None)
-        print("🟢 Cleared alert messages and updated status.")
-        last_alert_time = datetime.datetime.utcnow()
+    for guild_id in list(alert_messages):
+        last_alert_time = last_alert_times.get(guild_id, now)
+        if (now - last_alert_time).total_seconds() <= 3600 or not alert_messages[guild_id]:
+            continue
+
+        channel = bot.get_channel(get_alerts_channel_id(guild_id))
+        if channel:
+            await reconcile_alerts(channel, guild_id, [])
+            print(f"🟢 Cleared alert messages for guild {guild_id}.")
+
+    status_channel = get_status_channel(bot)
+    if status_channel is None:
+        return
+
+    if not alert_messages.get(GUILD_ID):
+        await update_status(status_channel, GUILD_ID, NO_ALERTS_TEXT)
     else:
         print("🕒 No need to clear status yet (recent alert).")
 
-    try:
-        await timestamp_msg.edit(content=f"📡 Last alert check: `{now_str} UTC`")
-    except Exception as e:
-        print(f"⚠️ Failed to update timestamp message during clear_status: {e}")
+    await update_timestamp(status_channel, GUILD_ID, now_str)
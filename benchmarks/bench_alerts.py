@@ -0,0 +1,221 @@
+"""Benchmark the alert pipeline stage by stage on quiet, regional and outbreak feeds.
+
+Stages, timed separately for each fixture:
+  parse      Atom bytes -> Alert records (streaming parser, 64 KiB chunks)
+  index      watched counties -> zone code / location index for every guild
+  match      route_alerts: zone codes plus storm polygons -> guilds
+  render     render_alert for every (guild, alert) pair
+  reconcile  reconcile_alerts into a fake Discord channel per guild, through
+             the dispatcher with rate limits lifted (CPU cost only)
+
+Usage (from the repo root):
+  python benchmarks/bench_alerts.py                       # JSON results to stdout
+  python benchmarks/bench_alerts.py --output results.json --fixture recorded.atom
+  python benchmarks/bench_alerts.py --baseline results.json --tolerance 0.25
+
+With --baseline, exits non-zero when any stage's best-of-N time is more
+than `tolerance` (and at least --min-delta-ms) slower than the baseline's;
+the minimum is compared because it is the least noisy on a shared machine.
+"""
+import argparse
+import asyncio
+import contextlib
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import config  # noqa: F401
+except ImportError:
+    # The pipeline reads channel/message IDs from config.py at import time; the
+    # benchmark never talks to Discord, so placeholder IDs are enough.
+    sys.modules["config"] = types.SimpleNamespace(
+        GUILD_ID=1, ALERTS_CHANNEL_ID=2, ALERT_STATUS_MESSAGE_ID=3, ALERT_TIMESTAMP_MESSAGE_ID=4,
+        FORECAST_CHANNEL_ID=5, FORECAST_MESSAGE_ID=6
+    )
+
+import storage
+storage.DB_FILE = ":memory:"  # Reconcile saves tracked alert messages; keep them out of radarbot.db
+
+import alerts_watcher
+from alert_parser import AlertFeedParser
+from alert_sources import FEED_CHUNK_SIZE
+from county_codes import zone_codes_for_counties
+from discord_dispatcher import dispatcher
+
+from fixtures import SCENARIOS, generate_feed, generate_guilds
+
+class FakeMessage:
+    def __init__(self, channel, message_id):
+        self.channel = channel
+        self.id = message_id
+
+    async def edit(self, **kwargs):
+        self.channel.calls += 1
+
+    async def delete(self):
+        self.channel.calls += 1
+
+class FakeChannel:
+    """Accepts sends/edits/deletes instantly and counts them."""
+
+    _ids = itertools.count(1)
+
+    def __init__(self, channel_id):
+        self.id = channel_id
+        self.calls = 0
+
+    async def send(self, content=None, **kwargs):
+        self.calls += 1
+        return FakeMessage(self, next(self._ids))
+
+    def get_partial_message(self, message_id):
+        return FakeMessage(self, message_id)
+
+def parse_feed(data):
+    parser = AlertFeedParser()
+    alerts = []
+    for start in range(0, len(data), FEED_CHUNK_SIZE):
+        alerts.extend(parser.feed(data[start:start + FEED_CHUNK_SIZE]))
+    alerts.extend(parser.close())
+    return alerts
+
+def build_index(guilds):
+    index = {}
+    points = {}
+    for guild_id, (counties, location) in guilds.items():
+        for code in zone_codes_for_counties(counties, "TX"):
+            index.setdefault(code, set()).add(guild_id)
+        points.setdefault(location, set()).add(guild_id)
+    return index, points
+
+async def reconcile_all(routed):
+    alerts_watcher.alert_messages.clear()
+    channels = [FakeChannel(guild_id) for guild_id in routed]
+    await asyncio.gather(*(
+        alerts_watcher.reconcile_alerts(channel, channel.id, alerts)
+        for channel, alerts in zip(channels, routed.values())
+    ))
+    return sum(channel.calls for channel in channels)
+
+def measure(func, repeats):
+    """Run func `repeats` times; return (last result, sorted timings in ms)."""
+    timings = []
+    result = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return result, sorted(timings)
+
+def stats(timings):
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 3),
+        "min_ms": round(timings[0], 3),
+    }
+
+def bench_fixture(name, data, guilds, repeats, loop):
+    stages = {}
+    alerts, timings = measure(lambda: parse_feed(data), repeats)
+    stages["parse"] = stats(timings)
+
+    (index, points), timings = measure(lambda: build_index(guilds), repeats)
+    stages["index"] = stats(timings)
+
+    routed, timings = measure(lambda: alerts_watcher.route_alerts(alerts, index, points), repeats)
+    stages["match"] = stats(timings)
+
+    pairs = [alert for guild_alerts in routed.values() for alert in guild_alerts]
+    _, timings = measure(lambda: [alerts_watcher.render_alert(alert) for alert in pairs], repeats)
+    stages["render"] = stats(timings)
+
+    # Per-guild log lines still cost a write, just not to the JSON on stdout
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        discord_calls, timings = measure(lambda: loop.run_until_complete(reconcile_all(routed)), repeats)
+    stages["reconcile"] = stats(timings)
+
+    return {
+        "fixture": name,
+        "bytes": len(data),
+        "alerts": len(alerts),
+        "guilds": len(guilds),
+        "routed_pairs": len(pairs),
+        "discord_calls": discord_calls,
+        "stages": stages,
+    }
+
+def compare(results, baseline, tolerance, min_delta_ms):
+    """Return human-readable regressions against a previous results file."""
+    previous = {r["fixture"]: r["stages"] for r in baseline["results"]}
+    regressions = []
+    for result in results:
+        for stage, current in result["stages"].items():
+            before = previous.get(result["fixture"], {}).get(stage)
+            if before is None:
+                continue
+            slower = current["min_ms"] - before["min_ms"]
+            if current["min_ms"] > before["min_ms"] * (1 + tolerance) and slower >= min_delta_ms:
+                regressions.append(
+                    f"{result['fixture']}/{stage}: {before['min_ms']} ms -> {current['min_ms']} ms"
+                )
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the alert parse-and-match pipeline.")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS),
+                        help="Generated scenario to run (default: all)")
+    parser.add_argument("--fixture", action="append", default=[], help="Recorded active.atom file to run as well")
+    parser.add_argument("--guilds", type=int, default=200, help="Number of simulated guilds")
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--output", help="Write JSON results here instead of stdout")
+    parser.add_argument("--baseline", help="Previous JSON results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown (0.25 = 25%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=0.5, help="Ignore slowdowns smaller than this")
+    args = parser.parse_args()
+
+    fixtures = [(name, generate_feed(name)) for name in args.scenario or SCENARIOS]
+    for path in args.fixture:
+        with open(path, "rb") as f:
+            fixtures.append((os.path.basename(path), f.read()))
+
+    guilds = generate_guilds(args.guilds)
+    dispatcher.set_limits(route_limit=(10 ** 9, 1.0), global_limit=(10 ** 9, 1.0))
+    loop = asyncio.new_event_loop()
+    try:
+        results = [bench_fixture(name, data, guilds, args.repeats, loop) for name, data in fixtures]
+        loop.run_until_complete(dispatcher.stop())
+    finally:
+        loop.close()
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeats": args.repeats,
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance, args.min_delta_ms)
+        for line in regressions:
+            print(f"❌ Regression: {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+        print("✅ No regressions against baseline.", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""In-process stand-ins for every upstream Radarbot calls, on one aiohttp app.
+
+Extends alert_test_server's NWS feed/stream app with:
+  GET       /spc/products/outlook/day{1,2}otlk.txt  SPC outlook text with a fixed issuance
+  GET       /open-meteo/v1/forecast                 Multi-location Open-Meteo forecast
+  GET/HEAD  /ridge/standard/{station}_loop.gif      RIDGE loop whose ETag changes every 5 simulated minutes
+"""
+import datetime
+import math
+
+from aiohttp import web
+
+from alert_test_server import make_app
+
+RADAR_LOOP_PERIOD = 300  # Simulated seconds between new RIDGE loops
+
+SPC_TEMPLATE = """
+SPC AC {stamp}
+
+Day {day} Convective Outlook
+NWS Storm Prediction Center Norman OK
+{issued}
+
+Valid {valid}
+
+...THERE IS {article} {risk} RISK OF SEVERE THUNDERSTORMS ACROSS PARTS OF TEXAS...
+
+...SUMMARY...
+Scattered severe thunderstorms are expected across simulated parts of
+Texas this afternoon and evening.
+
+...Simulation...
+Generated by the Radarbot load simulator.
+"""
+
+async def spc_text(request):
+    now = request.app["started_at"]
+    local = now - datetime.timedelta(hours=5)
+    text = SPC_TEMPLATE.format(
+        stamp=now.strftime("%d%H%M"),
+        day=request.match_info["day"],
+        issued=local.strftime("%I%M %p CDT %a %b %d %Y").lstrip("0"),
+        valid=now.strftime("%d%H%MZ"),
+        risk=request.app["risk"],
+        article="AN" if request.app["risk"][:1].upper() in "AEIOU" else "A",
+    )
+    return web.Response(text=text, headers={"Last-Modified": now.strftime("%a, %d %b %Y %H:%M:%S GMT")})
+
+def _forecast_for(lat, lon):
+    """Deterministic, plausible Open-Meteo payload for one location."""
+    base = 25 + 5 * math.sin(lat + lon)
+    start = datetime.date.today()
+    days = [start + datetime.timedelta(days=i) for i in range(7)]
+    return {
+        "latitude": lat,
+        "longitude": lon,
+        "current_weather": {"temperature": round(base, 1), "windspeed": 4.5, "winddirection": 190, "weathercode": 2},
+        "daily": {
+            "time": [day.isoformat() for day in days],
+            "weathercode": [(3, 61, 95, 2, 0, 1, 80)[i] for i in range(7)],
+            "temperature_2m_max": [round(base + 4 + i % 3, 1) for i in range(7)],
+            "temperature_2m_min": [round(base - 8 + i % 2, 1) for i in range(7)],
+            "precipitation_probability_max": [(20, 60, 80, 10, 0, 5, 40)[i] for i in range(7)],
+            "dewpoint_2m_min": [round(base - 10, 1)] * 7,
+            "windgusts_10m_max": [round(30 + 3 * i, 1) for i in range(7)],
+        },
+    }
+
+async def open_meteo(request):
+    lats = [float(v) for v in request.query["latitude"].split(",")]
+    lons = [float(v) for v in request.query["longitude"].split(",")]
+    results = [_forecast_for(lat, lon) for lat, lon in zip(lats, lons)]
+    return web.json_response(results if len(results) > 1 else results[0])
+
+async def ridge_loop(request):
+    loop_number = int(request.app["clock"]() // RADAR_LOOP_PERIOD)
+    etag = f'"{request.match_info["station"]}-{loop_number}"'
+    if request.headers.get("If-None-Match") == etag:
+        return web.Response(status=304, headers={"ETag": etag})
+    body = b"" if request.method == "HEAD" else b"GIF89a"
+    return web.Response(body=body, content_type="image/gif", headers={"ETag": etag})
+
+def make_upstream_app(clock, risk="SLIGHT"):
+    """Return the fake upstream app; `clock()` gives simulated seconds since the run started."""
+    app = make_app(max_age=0)  # Simulated time runs fast, so the alert feed is never cacheable
+    app["clock"] = clock
+    app["risk"] = risk
+    app["started_at"] = datetime.datetime.utcnow()
+    app.add_routes([
+        web.get("/spc/products/outlook/day{day}otlk.txt", spc_text),
+        web.get("/open-meteo/v1/forecast", open_meteo),
+        web.get("/ridge/standard/{station}_loop.gif", ridge_loop),
+    ])
+    return app
@@ -0,0 +1,110 @@
+"""Deterministic Atom alert feeds shaped like api.weather.gov's, for benchmarking.
+
+Recorded feeds can be used instead (or as well) by saving one with
+  curl -H "User-Agent: radarbot-bench" https://api.weather.gov/alerts/active.atom > outbreak.atom
+and passing it to bench_alerts.py with --fixture.
+"""
+import datetime
+import random
+
+from alert_parser import Alert, render_alert_feed
+from county_codes import COUNTY_FIPS, STATE_FIPS
+
+# Name -> (alert count, share of alerts inside the Texas watch area)
+SCENARIOS = {
+    "quiet": (5, 0.2),
+    "regional": (60, 0.5),
+    "outbreak": (500, 0.3),
+}
+
+EVENTS = [
+    ("Tornado Warning", "Extreme"),
+    ("Severe Thunderstorm Warning", "Severe"),
+    ("Flash Flood Warning", "Severe"),
+    ("Tornado Watch", "Severe"),
+    ("Severe Thunderstorm Watch", "Severe"),
+    ("Flood Advisory", "Minor"),
+    ("Special Weather Statement", "Moderate"),
+    ("Wind Advisory", "Moderate"),
+]
+
+# Other states on a busy national day: (postal code, state FIPS)
+OTHER_STATES = [("OK", 40), ("KS", 20), ("NE", 31), ("MO", 29), ("AR", 5), ("LA", 22), ("MS", 28), ("AL", 1)]
+
+TEXAS_BOUNDS = (29.0, 34.5, -104.0, -95.0)  # lat min, lat max, lon min, lon max
+
+def _storm_polygon(rng, lat, lon):
+    """A rough 4-6 vertex storm-based warning box around (lat, lon)."""
+    vertices = rng.randint(4, 6)
+    points = []
+    for i in range(vertices):
+        angle = 2 * 3.14159 * i / vertices
+        radius = rng.uniform(0.15, 0.4)
+        points.append((round(lat + radius * rng.uniform(0.6, 1.0) * (1 if i < vertices / 2 else -1), 2),
+                       round(lon + radius * (angle / 3.14159 - 1), 2)))
+    return tuple(points + points[:1])
+
+def _texas_codes(rng):
+    counties = rng.sample(sorted(COUNTY_FIPS["TX"].items()), rng.randint(1, 6))
+    codes = set()
+    for _, fips in counties:
+        codes.add(f"0{STATE_FIPS['TX']}{fips:03d}")
+        codes.add(f"TXC{fips:03d}")
+    return [name for name, _ in counties], codes
+
+def _other_codes(rng):
+    state, state_fips = rng.choice(OTHER_STATES)
+    numbers = rng.sample(range(1, 200, 2), rng.randint(1, 8))
+    codes = {f"0{state_fips:02d}{n:03d}" for n in numbers} | {f"{state}C{n:03d}" for n in numbers}
+    return [f"{state} County {n}" for n in numbers], codes
+
+def generate_alerts(count, local_share, seed=0):
+    """Return `count` Alerts, `local_share` of them inside the Texas watch area."""
+    rng = random.Random(seed)
+    issued = datetime.datetime(2026, 5, 6, 21, 0, tzinfo=datetime.timezone.utc)
+    alerts = []
+    for i in range(count):
+        event, severity = rng.choice(EVENTS)
+        local = rng.random() < local_share
+        areas, codes = _texas_codes(rng) if local else _other_codes(rng)
+
+        polygon = None
+        if event.endswith("Warning"):
+            if local:
+                lat = rng.uniform(*TEXAS_BOUNDS[:2])
+                lon = rng.uniform(*TEXAS_BOUNDS[2:])
+            else:
+                lat, lon = rng.uniform(34.5, 41.0), rng.uniform(-100.0, -86.0)
+            polygon = _storm_polygon(rng, lat, lon)
+
+        alert_id = f"urn:oid:2.49.0.1.840.0.bench.{seed}.{i}"
+        alerts.append(Alert(
+            alert_id,
+            title=f"{event} issued May 6 at 4:{i % 60:02d}PM CDT until May 6 at 5:{i % 60:02d}PM CDT by NWS",
+            event=event,
+            severity=severity,
+            areas="; ".join(areas),
+            codes=frozenset(codes),
+            polygon=polygon,
+            issued=(issued + datetime.timedelta(seconds=7 * i)).isoformat(),
+            expires=(issued + datetime.timedelta(hours=1, seconds=7 * i)).isoformat(),
+            link=f"https://api.weather.gov/alerts/{alert_id}",
+            summary=(f"At {4 + i % 3}:{i % 60:02d} PM CDT, a {event.lower()} was located near {areas[0]}. "
+                     "HAZARD...60 mph wind gusts and quarter size hail. SOURCE...Radar indicated. " * 3)
+        ))
+    return alerts
+
+def generate_feed(scenario, seed=0):
+    """Return the Atom feed for a named scenario as bytes."""
+    count, local_share = SCENARIOS[scenario]
+    return render_alert_feed(generate_alerts(count, local_share, seed)).encode("utf-8")
+
+def generate_guilds(count, seed=0):
+    """Return {guild_id: (counties, (lat, lon))} for `count` Texas guilds."""
+    rng = random.Random(seed + 1)
+    names = sorted(COUNTY_FIPS["TX"])
+    return {
+        1000 + i: (rng.sample(names, rng.randint(5, 30)),
+                   (round(rng.uniform(*TEXAS_BOUNDS[:2]), 4), round(rng.uniform(*TEXAS_BOUNDS[2:]), 4)))
+        for i in range(count)
+    }
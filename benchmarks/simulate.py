@@ -0,0 +1,392 @@
+"""End-to-end load simulation of Radarbot against fake Discord and fake upstreams.
+
+Runs the real bot modules (main, alerts_watcher, radar_updater, daily_forecast,
+daily_spc_outlook, the dispatcher and message cache) in one process:
+
+  - Discord is an in-process fake: N synthetic guilds whose channels accept
+    sends/edits/deletes after a simulated API latency. The real dispatcher
+    and its rate limits sit in front of it.
+  - NWS, SPC, Open-Meteo and RIDGE are served by fake_upstreams.py on a
+    local port, and the modules' upstream URLs are pointed at it.
+  - An outbreak timeline (generated, or a recorded event stream as written
+    for alert_sources.ReplaySource) is replayed into the fake NWS feed at
+    `--speed` times real time. Polling and radar intervals are compressed
+    by the same factor.
+
+Guild locations, configs and message IDs live in an in-memory SQLite
+database, so the real radarbot.db is never touched.
+
+Usage (from the repo root):
+  python benchmarks/simulate.py --guilds 500 --speed 60 --duration 180
+  python benchmarks/simulate.py --guilds 5000 --push --output sim.json --log sim.log
+  python benchmarks/simulate.py --timeline recorded.sse --speed 10
+
+Delivery latency is measured in real seconds from when an alert enters
+the fake feed. The wait for the next poll is compressed by --speed, so
+use --speed 1 (or --push) when the absolute number matters.
+"""
+import argparse
+import asyncio
+import collections
+import contextlib
+import datetime
+import itertools
+import json
+import math
+import os
+import random
+import statistics
+import sys
+import time
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import config  # noqa: F401
+except ImportError:
+    # Simulated guilds carry their own channel IDs; these only satisfy imports
+    sys.modules["config"] = types.SimpleNamespace(
+        DISCORD_TOKEN="simulation", GUILD_ID=1, SYSTEM_MESSAGES_CHANNEL_ID=2, RADAR_CHANNEL_ID=3,
+        ALERTS_CHANNEL_ID=4, ALERT_STATUS_MESSAGE_ID=5, ALERT_TIMESTAMP_MESSAGE_ID=6,
+        FORECAST_CHANNEL_ID=7, FORECAST_MESSAGE_ID=8
+    )
+
+import storage
+storage.DB_FILE = ":memory:"
+
+import location_manager
+import server_config_manager
+location_manager.LOCATION_FILE = server_config_manager.CONFIG_FILE = os.path.join(os.path.dirname(__file__), "none")
+
+from aiohttp import web
+
+import main  # Full bot wiring; the simulation drives its job functions directly
+import alerts_watcher
+import daily_forecast
+import daily_spc_outlook
+import metrics
+import radar_updater
+from alert_parser import Alert, parse_alert_feed
+from alert_sources import StreamingSource, read_events
+from discord_dispatcher import dispatcher
+from http_client import close_session
+
+from fake_upstreams import make_upstream_app
+from fixtures import generate_alerts, generate_guilds
+
+SAMPLE_INTERVAL = 0.1   # Seconds between queue depth samples
+MIN_POLL_SLEEP = 0.2    # Real seconds; keeps very high --speed values from spinning
+
+# --- FAKE DISCORD ---
+class FakeDiscord:
+    """Shared state for the fake REST API: simulated latency and a log of every call."""
+
+    def __init__(self, latency_ms, rng):
+        self.latency = latency_ms / 1000
+        self.rng = rng
+        self.calls = collections.Counter()
+        self.call_times = []
+        self._ids = itertools.count(1)
+
+    async def call(self, action):
+        await asyncio.sleep(self.rng.lognormvariate(math.log(self.latency), 0.4) if self.latency else 0)
+        self.calls[action] += 1
+        self.call_times.append(time.monotonic())
+
+    def next_id(self):
+        return next(self._ids)
+
+class FakeMessage:
+    def __init__(self, channel, message_id):
+        self.channel = channel
+        self.id = message_id
+
+    async def edit(self, **kwargs):
+        await self.channel.discord.call("edit")
+        return self
+
+    async def delete(self):
+        await self.channel.discord.call("delete")
+
+class FakeChannel:
+    def __init__(self, channel_id, discord):
+        self.id = channel_id
+        self.discord = discord
+
+    async def send(self, content=None, **kwargs):
+        await self.discord.call("send")
+        return FakeMessage(self, self.discord.next_id())
+
+    def get_partial_message(self, message_id):
+        return FakeMessage(self, message_id)
+
+class FakeBot:
+    """The slice of discord.Client the bot modules use."""
+
+    def __init__(self, guild_ids, discord):
+        self.guilds = [types.SimpleNamespace(id=guild_id) for guild_id in guild_ids]
+        self.discord = discord
+        self.closed = False
+        self._channels = {}
+
+    def get_channel(self, channel_id):
+        if channel_id is None:
+            return None
+        channel = self._channels.get(channel_id)
+        if channel is None:
+            channel = self._channels[channel_id] = FakeChannel(channel_id, self.discord)
+        return channel
+
+    async def wait_until_ready(self):
+        pass
+
+    def is_closed(self):
+        return self.closed
+
+def setup_guilds(count, seed):
+    """Store randomized Texas guilds with their own radar/forecast/alerts channels."""
+    guilds = generate_guilds(count, seed)
+    for guild_id, (counties, (lat, lon)) in guilds.items():
+        location_manager.save_location(guild_id, lat=lat, lon=lon, city=f"Sim {guild_id}", state="TX")
+        server_config_manager.set_server_config(
+            guild_id,
+            radar_channel=guild_id * 10 + 1,
+            forecast_channel=guild_id * 10 + 2,
+            alerts_channel=guild_id * 10 + 3,
+            watched_counties=counties
+        )
+    return list(guilds)
+
+# --- TIMELINE ---
+def generate_timeline(alert_count, duration, seed):
+    """Return sorted (simulated seconds, "alert"/"cancel", payload) for an outbreak.
+
+    Issuance ramps up to a peak halfway through and tails off; each alert is
+    cancelled 20-60 simulated minutes after it is issued.
+    """
+    rng = random.Random(seed)
+    events = []
+    for alert in generate_alerts(alert_count, local_share=0.3, seed=seed):
+        issued_at = rng.triangular(0, duration * 0.85, duration * 0.5)
+        lifetime = rng.uniform(20 * 60, 60 * 60)
+        events.append((issued_at, "alert", alert))
+        if issued_at + lifetime < duration:
+            events.append((issued_at + lifetime, "cancel", alert.id))
+    return sorted(events, key=lambda event: event[0])
+
+async def load_timeline(path):
+    """Read a recorded event stream (alert/cancel/delay events) into a timeline."""
+    async def lines():
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                yield line
+
+    events = []
+    clock = 0.0
+    async for event, data in read_events(lines()):
+        if event == "delay":
+            clock += float(data)
+        elif event in ("alert", "snapshot"):
+            events.extend((clock, "alert", alert) for alert in parse_alert_feed(data))
+        elif event == "cancel":
+            events.append((clock, "cancel", data.strip()))
+    return events
+
+def restamp(alert, lifetime):
+    """Copy an alert as if NWS issued it just now, expiring after `lifetime` real seconds."""
+    now = datetime.datetime.now(datetime.timezone.utc)
+    fields = {slot: getattr(alert, slot) for slot in Alert.__slots__}
+    fields["issued"] = now.isoformat()
+    fields["expires"] = (now + datetime.timedelta(seconds=lifetime)).isoformat()
+    return Alert(**fields)
+
+async def replay_timeline(store, events, speed, clock):
+    """Inject timeline events into the fake NWS feed as simulated time reaches them."""
+    for sim_time, kind, payload in events:
+        delay = (sim_time - clock()) / speed
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if kind == "alert":
+            store.upsert(restamp(payload, lifetime=3600 / speed + 60))
+        else:
+            store.cancel(payload)
+
+# --- DRIVERS (the scheduler's jobs, on a compressed clock) ---
+async def poll_alerts(bot, speed):
+    while True:
+        try:
+            await alerts_watcher.process_alerts(bot)
+        except Exception as e:
+            print(f"❌ Simulated alert poll failed: {e}")
+        interval = await alerts_watcher.next_poll_interval()
+        await asyncio.sleep(max(MIN_POLL_SLEEP, interval / speed))
+
+async def update_radar(bot, speed):
+    while True:
+        try:
+            await radar_updater.radar_task(bot)
+        except Exception as e:
+            print(f"❌ Simulated radar update failed: {e}")
+        await asyncio.sleep(radar_updater.UPDATE_INTERVAL / speed)
+
+async def sample_queue(samples):
+    while True:
+        samples.append(dispatcher.queue_depth())
+        await asyncio.sleep(SAMPLE_INTERVAL)
+
+async def drain_dispatcher(timeout):
+    deadline = time.monotonic() + timeout
+    while dispatcher.queue_depth() and time.monotonic() < deadline:
+        await asyncio.sleep(SAMPLE_INTERVAL)
+
+# --- REPORT ---
+def distribution(values, scale=1.0, digits=3):
+    if not values:
+        return None
+    ordered = sorted(values)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    return {
+        "mean": round(statistics.fmean(ordered) * scale, digits),
+        "p50": round(pick(0.50) * scale, digits),
+        "p95": round(pick(0.95) * scale, digits),
+        "p99": round(pick(0.99) * scale, digits),
+        "max": round(ordered[-1] * scale, digits),
+    }
+
+def histogram_report(name):
+    rows = {}
+    for metric, labels, count, p50, p95, p99 in metrics.summary():
+        if metric == name:
+            key = ",".join(f"{k}={v}" for k, v in labels.items()) or "all"
+            rows[key] = {"count": count, "p50": round(p50, 4), "p95": round(p95, 4), "p99": round(p99, 4)}
+    return rows
+
+def peak_rate(times, window=1.0):
+    """Most calls seen in any `window`-second span."""
+    peak = 0
+    start = 0
+    for end, t in enumerate(times):
+        while t - times[start] > window:
+            start += 1
+        peak = max(peak, end - start + 1)
+    return peak
+
+async def simulate(args):
+    rng = random.Random(args.seed)
+    started = time.monotonic()
+    clock = lambda: (time.monotonic() - started) * args.speed
+
+    # Upstreams
+    app = make_upstream_app(clock, risk=args.risk)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", args.port)
+    await site.start()
+    base = f"http://127.0.0.1:{args.port}"
+    alerts_watcher.atom_source.url = f"{base}/alerts/active.atom"
+    daily_spc_outlook.SPC_TEXT_URL_DAY1 = alerts_watcher.SPC_TEXT_URL_DAY1 = f"{base}/spc/products/outlook/day1otlk.txt"
+    daily_spc_outlook.SPC_TEXT_URL_DAY2 = f"{base}/spc/products/outlook/day2otlk.txt"
+    daily_forecast.OPEN_METEO_URL = f"{base}/open-meteo/v1/forecast"
+    radar_updater.RIDGE_URL = f"{base}/ridge/standard"
+
+    # Discord
+    guild_ids = setup_guilds(args.guilds, args.seed)
+    discord = FakeDiscord(args.discord_latency_ms, rng)
+    bot = FakeBot(guild_ids, discord)
+    if args.lift_rate_limits:
+        dispatcher.set_limits(route_limit=(10 ** 9, 1.0), global_limit=(10 ** 9, 1.0))
+
+    if args.timeline:
+        events = await load_timeline(args.timeline)
+    else:
+        events = generate_timeline(args.alerts, args.duration * 60, args.seed)
+    duration = max(args.duration * 60, events[-1][0] if events else 0)
+
+    samples = []
+    tasks = [
+        asyncio.create_task(metrics.monitor_event_loop(0.05)),
+        asyncio.create_task(sample_queue(samples)),
+        asyncio.create_task(replay_timeline(app["store"], events, args.speed, clock)),
+        asyncio.create_task(poll_alerts(bot, args.speed)),
+        asyncio.create_task(update_radar(bot, args.speed)),
+    ]
+    if args.push:
+        tasks.append(asyncio.create_task(StreamingSource(f"{base}/alerts/stream").run(alerts_watcher.alert_queue)))
+        tasks.append(asyncio.create_task(alerts_watcher.consume_alerts(bot)))
+
+    # The daily posts, fired once at the start of the run
+    await asyncio.gather(
+        daily_forecast.post_forecasts(bot),
+        daily_spc_outlook.post_spc_outlook(bot),
+        main.send_heartbeat(bot),
+        return_exceptions=True
+    )
+
+    await asyncio.sleep(max(0.0, duration / args.speed - (time.monotonic() - started)))
+    bot.closed = True
+    await drain_dispatcher(args.drain_timeout)
+    real_seconds = time.monotonic() - started
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await dispatcher.stop()
+    await close_session()
+    await runner.cleanup()
+
+    total_calls = sum(discord.calls.values())
+    return {
+        "guilds": args.guilds,
+        "speed": args.speed,
+        "simulated_minutes": round(duration / 60, 1),
+        "real_seconds": round(real_seconds, 2),
+        "alerts_injected": sum(1 for _, kind, _ in events if kind == "alert"),
+        "mode": "push" if args.push else "poll",
+        "discord": {
+            "calls": dict(discord.calls),
+            "throughput_per_s": round(total_calls / real_seconds, 1),
+            "peak_per_s": peak_rate(discord.call_times),
+            "left_in_queue": dispatcher.queue_depth(),
+        },
+        "queue_depth": distribution(samples, digits=1),
+        "event_loop_lag_s": histogram_report("radarbot_event_loop_lag_seconds"),
+        "alert_delivery_s": histogram_report("radarbot_alert_delivery_seconds"),
+        "discord_queue_wait_s": histogram_report("radarbot_discord_queue_seconds"),
+        "jobs_s": histogram_report("radarbot_job_seconds"),
+        "upstream_s": histogram_report("radarbot_upstream_request_seconds"),
+        "errors": {f"{name} {labels}": value for name, labels, value in metrics.counters()},
+    }
+
+def main_cli():
+    parser = argparse.ArgumentParser(description="Simulate Radarbot end to end against fake Discord and upstreams.")
+    parser.add_argument("--guilds", type=int, default=100, help="Synthetic guilds (1-5000)")
+    parser.add_argument("--duration", type=float, default=120, help="Simulated minutes to run")
+    parser.add_argument("--speed", type=float, default=60, help="Simulated seconds per real second")
+    parser.add_argument("--alerts", type=int, default=200, help="Alerts in the generated outbreak timeline")
+    parser.add_argument("--timeline", help="Recorded event stream to replay instead of a generated outbreak")
+    parser.add_argument("--push", action="store_true", help="Also ingest through the SSE stream, not just polling")
+    parser.add_argument("--risk", default="SLIGHT", help="SPC Day 1 categorical risk the fake SPC reports")
+    parser.add_argument("--discord-latency-ms", type=float, default=80, help="Median simulated Discord API latency")
+    parser.add_argument("--lift-rate-limits", action="store_true", help="Disable the dispatcher's rate limits")
+    parser.add_argument("--drain-timeout", type=float, default=30, help="Real seconds to wait for queued Discord calls")
+    parser.add_argument("--port", type=int, default=8089, help="Local port for the fake upstreams")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    parser.add_argument("--log", default=os.devnull, help="Where the bot's own log lines go")
+    args = parser.parse_args()
+    if not 1 <= args.guilds <= 5000:
+        parser.error("--guilds must be between 1 and 5000")
+
+    with open(args.log, "w") as log, contextlib.redirect_stdout(log):
+        report = asyncio.run(simulate(args))
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+if __name__ == "__main__":
+    main_cli()
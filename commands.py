@@ -1,12 +1,19 @@
 import discord
 import datetime
-from alerts_watcher import process_alerts
+from alert_history import count_history, query_history, resolve_codes
+from alerts_watcher import process_alerts, invalidate_county_index, get_watched_counties, get_alert_emoji
 from config import SYSTEM_MESSAGES_CHANNEL_ID, GUILD_ID
+from county_codes import county_zone_codes
 from daily_forecast import post_forecast
+from discord_dispatcher import dispatcher, PRIORITY_STATUS
+from metrics import summary, counters
+from daily_spc_outlook import post_spc_outlook
 from location_manager import save_location, get_lat_lon, get_city_state, get_station_id
 from nexrad_locator import get_nearest_station
 from server_config_manager import set_server_config, get_server_config
 
+HISTORY_RESULTS = 15  # Alerts listed by /alerthistory; the total is always shown
+
 def setup_commands(bot):
     @bot.tree.command(name="heartbeat", description="Manually send a Radarbot heartbeat.")
     @discord.app_commands.guilds(discord.Object(id=GUILD_ID))
@@ -15,7 +22,7 @@ def setup_commands(bot):
         now = datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
         channel = bot.get_channel(SYSTEM_MESSAGES_CHANNEL_ID)
         if channel:
-            await channel.send(f"✅ **Radarbot Heartbeat:** Manual heartbeat as of {now} UTC.")
+            await dispatcher.send(channel, PRIORITY_STATUS, content=f"✅ **Radarbot Heartbeat:** Manual heartbeat as of {now} UTC.")
             await interaction.followup.send(f"💓 Heartbeat sent at {now} UTC!", ephemeral=True)
         else:
             await interaction.followup.send("⚠️ Could not find system messages channel.", ephemeral=True)
@@ -40,6 +47,13 @@ def setup_commands(bot):
         await post_forecast(bot, interaction.guild.id)
         await interaction.followup.send("🌤️ Forecast posted/updated successfully.", ephemeral=True)
 
+    @bot.tree.command(name="outlook", description="Post the current SPC severe weather outlook.")
+    @discord.app_commands.guilds(discord.Object(id=GUILD_ID))
+    async def outlook(interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True)
+        await post_spc_outlook(bot, guild_ids=[interaction.guild.id])
+        await interaction.followup.send("🛡️ SPC outlook posted.", ephemeral=True)
+
     @bot.tree.command(name="ping", description="Check if Radarbot is alive and get current UTC time.")
     @discord.app_commands.guilds(discord.Object(id=GUILD_ID))
     async def ping(interaction: discord.Interaction):
@@ -55,6 +69,7 @@ def setup_commands(bot):
                           state: str = None,
                           station_id: str = None):
         guild_id = interaction.guild.id
+        invalidate_county_index()  # State may change which county codes match
 
         if station_id:
             save_location(guild_id, station_id=station_id.upper())
@@ -135,6 +150,37 @@ def setup_commands(bot):
         set_server_config(guild_id, severe_role=severe_role.id)
         await interaction.response.send_message("✅ Severe role updated successfully!", ephemeral=True)
 
+    @bot.tree.command(name="setcounties", description="Set the counties Radarbot watches for alerts in this server.")
+    @discord.app_commands.guilds(discord.Object(id=GUILD_ID))
+    async def setcounties(interaction: discord.Interaction, counties: str):
+        guild_id = interaction.guild.id
+        county_list = [c.strip() for c in counties.split(",") if c.strip()]
+
+        if not county_list:
+            await interaction.response.send_message(
+                "⚠️ Provide a comma-separated list of counties (e.g. `Tom Green, Coke, Runnels`).",
+                ephemeral=True
+            )
+            return
+
+        _, state = get_city_state(guild_id)
+        unknown = [county for county in county_list if not county_zone_codes(county, state or "")]
+        if unknown:
+            await interaction.response.send_message(
+                f"⚠️ Unknown {state} counties: `{', '.join(unknown)}`. Nothing was saved.\n"
+                "Check the spelling, set your state with `/setlocation`, or give NWS zone codes "
+                "instead (e.g. `TXC451`, `OKZ025`).",
+                ephemeral=True
+            )
+            return
+
+        set_server_config(guild_id, watched_counties=county_list)
+        invalidate_county_index()
+        await interaction.response.send_message(
+            f"✅ Now watching {len(county_list)} counties: `{', '.join(county_list)}`",
+            ephemeral=True
+        )
+
     @bot.tree.command(name="viewconfig", description="View the Radarbot configuration for this server.")
     @discord.app_commands.guilds(discord.Object(id=GUILD_ID))
     async def viewconfig(interaction: discord.Interaction):
@@ -150,6 +196,8 @@ def setup_commands(bot):
         embed.add_field(name="Alerts Channel", value=f"<#{config['alerts_channel']}>" if config['alerts_channel'] else "Not Set", inline=False)
         embed.add_field(name="System Messages Channel", value=f"<#{config['system_channel']}>" if config['system_channel'] else "Not Set", inline=False)
         embed.add_field(name="Severe Role", value=f"<@&{config['severe_role']}>" if config['severe_role'] else "Not Set", inline=False)
+        watched = ", ".join(get_watched_counties(guild_id)) or "None — storm polygons only (use /setcounties)"
+        embed.add_field(name="Watched Counties", value=watched[:1024], inline=False)
 
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
@@ -173,6 +221,86 @@ def setup_commands(bot):
                 ephemeral=True
             )
 
+    @bot.tree.command(name="perf", description="Show Radarbot latency percentiles and error counts.")
+    @discord.app_commands.guilds(discord.Object(id=GUILD_ID))
+    async def perf(interaction: discord.Interaction):
+        def ms(seconds):
+            return f"{seconds * 1000:.0f} ms" if seconds < 10 else f"{seconds:.1f} s"
+
+        embed = discord.Embed(
+            title="📈 Radarbot Performance",
+            description="p50 / p95 / p99 over recent samples",
+            color=discord.Color.blue()
+        )
+        sections = {}
+        for name, labels, count, p50, p95, p99 in summary():
+            label_text = ", ".join(str(v) for v in labels.values()) or "all"
+            section = name.removeprefix("radarbot_").removesuffix("_seconds").replace("_", " ").title()
+            sections.setdefault(section, []).append(
+                f"`{label_text}`: {ms(p50)} / {ms(p95)} / {ms(p99)} ({count})"
+            )
+        for section, lines in sections.items():
+            embed.add_field(name=section, value="\n".join(lines)[:1024], inline=False)
+
+        errors = [f"`{name.removeprefix('radarbot_')} {', '.join(str(v) for v in labels.values())}`: {value}"
+                  for name, labels, value in counters()]
+        embed.add_field(name="Errors", value="\n".join(errors)[:1024] or "None 🎉", inline=False)
+        if not sections:
+            embed.description = "No samples recorded yet."
+
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+    @bot.tree.command(name="alerthistory", description="Search past alerts for this server's counties.")
+    @discord.app_commands.guilds(discord.Object(id=GUILD_ID))
+    async def alerthistory(interaction: discord.Interaction, event: str = None, counties: str = None, days: int = None):
+        guild_id = interaction.guild.id
+        if counties:
+            county_list = [c.strip() for c in counties.split(",") if c.strip()]
+        else:
+            county_list = get_watched_counties(guild_id)
+        _, state = get_city_state(guild_id)
+
+        if not county_list:
+            await interaction.response.send_message(
+                "⚠️ No watched counties set. Pass `counties` or use `/setcounties` first.", ephemeral=True
+            )
+            return
+
+        codes = resolve_codes(county_list, state)
+        if not codes:
+            await interaction.response.send_message(
+                f"⚠️ No counties named `{', '.join(county_list)}` found in {state}.", ephemeral=True
+            )
+            return
+
+        now = datetime.datetime.now(datetime.timezone.utc)
+        if days:
+            since = now - datetime.timedelta(days=days)
+        else:
+            since = now.replace(month=1, day=1, hour=0, minute=0, second=0, microsecond=0)  # This year
+
+        total = count_history(codes=codes, event=event, since=since)
+        alerts = query_history(codes=codes, event=event, since=since, limit=HISTORY_RESULTS)
+
+        lines = [
+            f"{get_alert_emoji(alert['title'] or alert['event'])} [{alert['event']}]({alert['link']}) — "
+            f"{alert['issued']:%Y-%m-%d %H:%M} UTC"
+            for alert in alerts
+        ]
+        if total > len(alerts):
+            lines.append(f"…and {total - len(alerts)} more.")
+
+        embed = discord.Embed(
+            title="🗄️ Alert History",
+            description="\n".join(lines)[:4000] or "No matching alerts. 🌤️",
+            color=discord.Color.dark_grey()
+        )
+        embed.add_field(name="Counties", value=", ".join(county_list)[:1024], inline=False)
+        embed.add_field(name="Event", value=event or "Any", inline=True)
+        embed.add_field(name="Since", value=f"{since:%Y-%m-%d}", inline=True)
+        embed.add_field(name="Matches", value=str(total), inline=True)
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
     @bot.tree.command(name="help", description="Show a list of all Radarbot commands.")
     @discord.app_commands.guilds(discord.Object(id=GUILD_ID))
     async def help(interaction: discord.Interaction):
@@ -186,11 +314,15 @@ def setup_commands(bot):
         embed.add_field(name="/location", value="View the currently saved location and radar source.", inline=False)
         embed.add_field(name="/neareststation", value="Show the radar station currently in use.", inline=False)
         embed.add_field(name="/forecast", value="Post or update the 7-day forecast for this server.", inline=False)
+        embed.add_field(name="/outlook", value="Post the current SPC severe weather outlook.", inline=False)
         embed.add_field(name="/checkalerts", value="Manually check for severe weather alerts now.", inline=False)
         embed.add_field(name="/setchannels", value="Set where Radarbot posts radar, forecasts, and alerts.", inline=False)
+        embed.add_field(name="/setcounties", value="Set the counties Radarbot watches for alerts.", inline=False)
         embed.add_field(name="/setrole", value="Set the role to ping for severe weather alerts.", inline=False)
         embed.add_field(name="/viewconfig", value="See your server's full Radarbot configuration.", inline=False)
         embed.add_field(name="/heartbeat", value="Manually trigger a bot heartbeat message.", inline=False)
+        embed.add_field(name="/alerthistory", value="Search past alerts by event and county (this year by default).", inline=False)
+        embed.add_field(name="/perf", value="Show latency percentiles for upstream fetches, Discord calls, and jobs.", inline=False)
         embed.add_field(name="/ping", value="Check if Radarbot is online and show the current UTC time.", inline=False)
 
         embed.set_footer(text="Radarbot by W5QX • Stay weather-aware! 🌩️")
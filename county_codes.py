@@ -0,0 +1,57 @@
+import re
+import unicodedata
+
+from county_fips import COUNTY_FIPS, STATE_FIPS
+
+# --- COUNTY CODES ---
+# NWS alerts carry SAME (e.g. 048451) and UGC county (e.g. TXC451) geocodes built from
+# the state and county FIPS numbers in county_fips.py.
+UGC_PATTERN = re.compile(r"^[A-Z]{2}[CZ]\d{3}$")
+SAME_PATTERN = re.compile(r"^\d{6}$")
+
+NAME_SUFFIX = re.compile(r" (county|parish|city and borough|borough|census area|municipality|municipio)$")
+
+def normalize_county(name):
+    """Fold a county name for lookup: "St. Mary's County" and "saint marys" both become "st marys"."""
+    name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode().lower()
+    name = " ".join(name.replace(".", "").replace("'", "").split())
+    if name.startswith("saint "):
+        name = "st " + name[len("saint "):]
+    return NAME_SUFFIX.sub("", name)
+
+# (state, normalized county name) -> county FIPS number
+_county_lookup = {
+    (state, normalize_county(name)): fips
+    for state, counties in COUNTY_FIPS.items()
+    for name, fips in counties.items()
+}
+_county_lookup[("TX", "shackleford")] = 417  # Common misspelling of Shackelford, saved by older configs
+
+def county_zone_codes(county, state):
+    """Return the SAME and UGC codes for a county, or an empty set if it's unknown.
+
+    Raw UGC (TXC451, TXZ071) or SAME (048451) codes are passed through as-is.
+    """
+    county = county.strip()
+    if UGC_PATTERN.match(county.upper()):
+        return {county.upper()}
+    if SAME_PATTERN.match(county):
+        return {county}
+
+    state = state.strip().upper()
+    name = normalize_county(county.split(",")[0])
+    # Virginia's independent cities, e.g. "Norfolk", are only listed as "Norfolk City"
+    fips = _county_lookup.get((state, name), _county_lookup.get((state, f"{name} city")))
+    if fips is None or state not in STATE_FIPS:
+        return set()
+    return {f"0{STATE_FIPS[state]:02d}{fips:03d}", f"{state}C{fips:03d}"}
+
+def zone_codes_for_counties(counties, state):
+    """Return a frozen set of SAME/UGC codes for a list of counties in one state."""
+    codes = set()
+    for county in counties:
+        county_codes = county_zone_codes(county, state)
+        if not county_codes:
+            print(f"⚠️ Unknown county for alert matching: {county}, {state}")
+        codes.update(county_codes)
+    return frozenset(codes)
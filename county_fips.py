@@ -0,0 +1,743 @@
+# --- COUNTY FIPS TABLE ---
+# Census 2020 state and county FIPS numbers for every state, DC and the inhabited
+# territories, plus the older and borough names people still use (Shannon, Brooklyn).
+# "County", "Parish", "Borough", "Census Area" and "Municipio" are dropped from names;
+# independent cities keep "City" so they don't collide with counties (Baltimore City).
+
+STATE_FIPS = {
+    "AL": 1, "AK": 2, "AZ": 4, "AR": 5, "CA": 6, "CO": 8, "CT": 9, "DE": 10, "DC": 11, "FL": 12,
+    "GA": 13, "HI": 15, "ID": 16, "IL": 17, "IN": 18, "IA": 19, "KS": 20, "KY": 21, "LA": 22,
+    "ME": 23, "MD": 24, "MA": 25, "MI": 26, "MN": 27, "MS": 28, "MO": 29, "MT": 30, "NE": 31,
+    "NV": 32, "NH": 33, "NJ": 34, "NM": 35, "NY": 36, "NC": 37, "ND": 38, "OH": 39, "OK": 40,
+    "OR": 41, "PA": 42, "RI": 44, "SC": 45, "SD": 46, "TN": 47, "TX": 48, "UT": 49, "VT": 50,
+    "VA": 51, "WA": 53, "WV": 54, "WI": 55, "WY": 56, "AS": 60, "GU": 66, "MP": 69, "PR": 72,
+    "VI": 78
+}
+
+COUNTY_FIPS = {
+    "AL": {
+        "Autauga": 1, "Baldwin": 3, "Barbour": 5, "Bibb": 7, "Blount": 9, "Bullock": 11,
+        "Butler": 13, "Calhoun": 15, "Chambers": 17, "Cherokee": 19, "Chilton": 21, "Choctaw": 23,
+        "Clarke": 25, "Clay": 27, "Cleburne": 29, "Coffee": 31, "Colbert": 33, "Conecuh": 35,
+        "Coosa": 37, "Covington": 39, "Crenshaw": 41, "Cullman": 43, "Dale": 45, "Dallas": 47,
+        "DeKalb": 49, "Elmore": 51, "Escambia": 53, "Etowah": 55, "Fayette": 57, "Franklin": 59,
+        "Geneva": 61, "Greene": 63, "Hale": 65, "Henry": 67, "Houston": 69, "Jackson": 71,
+        "Jefferson": 73, "Lamar": 75, "Lauderdale": 77, "Lawrence": 79, "Lee": 81, "Limestone": 83,
+        "Lowndes": 85, "Macon": 87, "Madison": 89, "Marengo": 91, "Marion": 93, "Marshall": 95,
+        "Mobile": 97, "Monroe": 99, "Montgomery": 101, "Morgan": 103, "Perry": 105, "Pickens": 107,
+        "Pike": 109, "Randolph": 111, "Russell": 113, "St. Clair": 115, "Shelby": 117,
+        "Sumter": 119, "Talladega": 121, "Tallapoosa": 123, "Tuscaloosa": 125, "Walker": 127,
+        "Washington": 129, "Wilcox": 131, "Winston": 133
+    },
+    "AK": {
+        "Aleutians East": 13, "Aleutians West": 16, "Anchorage": 20, "Bethel": 50,
+        "Bristol Bay": 60, "Copper River": 66, "Denali": 68, "Dillingham": 70,
+        "Fairbanks North Star": 90, "Haines": 100, "Hoonah-Angoon": 105, "Juneau": 110,
+        "Kenai Peninsula": 122, "Ketchikan Gateway": 130, "Kodiak Island": 150, "Kusilvak": 158,
+        "Wade Hampton": 158, "Lake and Peninsula": 164, "Matanuska-Susitna": 170, "Nome": 180,
+        "North Slope": 185, "Northwest Arctic": 188, "Petersburg": 195,
+        "Prince of Wales-Hyder": 198, "Sitka": 220, "Skagway": 230, "Southeast Fairbanks": 240,
+        "Valdez-Cordova": 261, "Wrangell": 275, "Yakutat": 282, "Yukon-Koyukuk": 290
+    },
+    "AZ": {
+        "Apache": 1, "Cochise": 3, "Coconino": 5, "Gila": 7, "Graham": 9, "Greenlee": 11,
+        "La Paz": 12, "Maricopa": 13, "Mohave": 15, "Navajo": 17, "Pima": 19, "Pinal": 21,
+        "Santa Cruz": 23, "Yavapai": 25, "Yuma": 27
+    },
+    "AR": {
+        "Arkansas": 1, "Ashley": 3, "Baxter": 5, "Benton": 7, "Boone": 9, "Bradley": 11,
+        "Calhoun": 13, "Carroll": 15, "Chicot": 17, "Clark": 19, "Clay": 21, "Cleburne": 23,
+        "Cleveland": 25, "Columbia": 27, "Conway": 29, "Craighead": 31, "Crawford": 33,
+        "Crittenden": 35, "Cross": 37, "Dallas": 39, "Desha": 41, "Drew": 43, "Faulkner": 45,
+        "Franklin": 47, "Fulton": 49, "Garland": 51, "Grant": 53, "Greene": 55, "Hempstead": 57,
+        "Hot Spring": 59, "Howard": 61, "Independence": 63, "Izard": 65, "Jackson": 67,
+        "Jefferson": 69, "Johnson": 71, "Lafayette": 73, "Lawrence": 75, "Lee": 77, "Lincoln": 79,
+        "Little River": 81, "Logan": 83, "Lonoke": 85, "Madison": 87, "Marion": 89, "Miller": 91,
+        "Mississippi": 93, "Monroe": 95, "Montgomery": 97, "Nevada": 99, "Newton": 101,
+        "Ouachita": 103, "Perry": 105, "Phillips": 107, "Pike": 109, "Poinsett": 111, "Polk": 113,
+        "Pope": 115, "Prairie": 117, "Pulaski": 119, "Randolph": 121, "St. Francis": 123,
+        "Saline": 125, "Scott": 127, "Searcy": 129, "Sebastian": 131, "Sevier": 133, "Sharp": 135,
+        "Stone": 137, "Union": 139, "Van Buren": 141, "Washington": 143, "White": 145,
+        "Woodruff": 147, "Yell": 149
+    },
+    "CA": {
+        "Alameda": 1, "Alpine": 3, "Amador": 5, "Butte": 7, "Calaveras": 9, "Colusa": 11,
+        "Contra Costa": 13, "Del Norte": 15, "El Dorado": 17, "Fresno": 19, "Glenn": 21,
+        "Humboldt": 23, "Imperial": 25, "Inyo": 27, "Kern": 29, "Kings": 31, "Lake": 33,
+        "Lassen": 35, "Los Angeles": 37, "Madera": 39, "Marin": 41, "Mariposa": 43,
+        "Mendocino": 45, "Merced": 47, "Modoc": 49, "Mono": 51, "Monterey": 53, "Napa": 55,
+        "Nevada": 57, "Orange": 59, "Placer": 61, "Plumas": 63, "Riverside": 65, "Sacramento": 67,
+        "San Benito": 69, "San Bernardino": 71, "San Diego": 73, "San Francisco": 75,
+        "San Joaquin": 77, "San Luis Obispo": 79, "San Mateo": 81, "Santa Barbara": 83,
+        "Santa Clara": 85, "Santa Cruz": 87, "Shasta": 89, "Sierra": 91, "Siskiyou": 93,
+        "Solano": 95, "Sonoma": 97, "Stanislaus": 99, "Sutter": 101, "Tehama": 103, "Trinity": 105,
+        "Tulare": 107, "Tuolumne": 109, "Ventura": 111, "Yolo": 113, "Yuba": 115
+    },
+    "CO": {
+        "Adams": 1, "Alamosa": 3, "Arapahoe": 5, "Archuleta": 7, "Baca": 9, "Bent": 11,
+        "Boulder": 13, "Broomfield": 14, "Chaffee": 15, "Cheyenne": 17, "Clear Creek": 19,
+        "Conejos": 21, "Costilla": 23, "Crowley": 25, "Custer": 27, "Delta": 29, "Denver": 31,
+        "Dolores": 33, "Douglas": 35, "Eagle": 37, "Elbert": 39, "El Paso": 41, "Fremont": 43,
+        "Garfield": 45, "Gilpin": 47, "Grand": 49, "Gunnison": 51, "Hinsdale": 53, "Huerfano": 55,
+        "Jackson": 57, "Jefferson": 59, "Kiowa": 61, "Kit Carson": 63, "Lake": 65, "La Plata": 67,
+        "Larimer": 69, "Las Animas": 71, "Lincoln": 73, "Logan": 75, "Mesa": 77, "Mineral": 79,
+        "Moffat": 81, "Montezuma": 83, "Montrose": 85, "Morgan": 87, "Otero": 89, "Ouray": 91,
+        "Park": 93, "Phillips": 95, "Pitkin": 97, "Prowers": 99, "Pueblo": 101, "Rio Blanco": 103,
+        "Rio Grande": 105, "Routt": 107, "Saguache": 109, "San Juan": 111, "San Miguel": 113,
+        "Sedgwick": 115, "Summit": 117, "Teller": 119, "Washington": 121, "Weld": 123, "Yuma": 125
+    },
+    "CT": {
+        "Fairfield": 1, "Hartford": 3, "Litchfield": 5, "Middlesex": 7, "New Haven": 9,
+        "New London": 11, "Tolland": 13, "Windham": 15
+    },
+    "DE": {
+        "Kent": 1, "New Castle": 3, "Sussex": 5
+    },
+    "DC": {
+        "District of Columbia": 1, "Washington": 1
+    },
+    "FL": {
+        "Alachua": 1, "Baker": 3, "Bay": 5, "Bradford": 7, "Brevard": 9, "Broward": 11,
+        "Calhoun": 13, "Charlotte": 15, "Citrus": 17, "Clay": 19, "Collier": 21, "Columbia": 23,
+        "DeSoto": 27, "Dixie": 29, "Duval": 31, "Escambia": 33, "Flagler": 35, "Franklin": 37,
+        "Gadsden": 39, "Gilchrist": 41, "Glades": 43, "Gulf": 45, "Hamilton": 47, "Hardee": 49,
+        "Hendry": 51, "Hernando": 53, "Highlands": 55, "Hillsborough": 57, "Holmes": 59,
+        "Indian River": 61, "Jackson": 63, "Jefferson": 65, "Lafayette": 67, "Lake": 69, "Lee": 71,
+        "Leon": 73, "Levy": 75, "Liberty": 77, "Madison": 79, "Manatee": 81, "Marion": 83,
+        "Martin": 85, "Miami-Dade": 86, "Monroe": 87, "Nassau": 89, "Okaloosa": 91,
+        "Okeechobee": 93, "Orange": 95, "Osceola": 97, "Palm Beach": 99, "Pasco": 101,
+        "Pinellas": 103, "Polk": 105, "Putnam": 107, "St. Johns": 109, "St. Lucie": 111,
+        "Santa Rosa": 113, "Sarasota": 115, "Seminole": 117, "Sumter": 119, "Suwannee": 121,
+        "Taylor": 123, "Union": 125, "Volusia": 127, "Wakulla": 129, "Walton": 131,
+        "Washington": 133
+    },
+    "GA": {
+        "Appling": 1, "Atkinson": 3, "Bacon": 5, "Baker": 7, "Baldwin": 9, "Banks": 11,
+        "Barrow": 13, "Bartow": 15, "Ben Hill": 17, "Berrien": 19, "Bibb": 21, "Bleckley": 23,
+        "Brantley": 25, "Brooks": 27, "Bryan": 29, "Bulloch": 31, "Burke": 33, "Butts": 35,
+        "Calhoun": 37, "Camden": 39, "Candler": 43, "Carroll": 45, "Catoosa": 47, "Charlton": 49,
+        "Chatham": 51, "Chattahoochee": 53, "Chattooga": 55, "Cherokee": 57, "Clarke": 59,
+        "Clay": 61, "Clayton": 63, "Clinch": 65, "Cobb": 67, "Coffee": 69, "Colquitt": 71,
+        "Columbia": 73, "Cook": 75, "Coweta": 77, "Crawford": 79, "Crisp": 81, "Dade": 83,
+        "Dawson": 85, "Decatur": 87, "DeKalb": 89, "Dodge": 91, "Dooly": 93, "Dougherty": 95,
+        "Douglas": 97, "Early": 99, "Echols": 101, "Effingham": 103, "Elbert": 105, "Emanuel": 107,
+        "Evans": 109, "Fannin": 111, "Fayette": 113, "Floyd": 115, "Forsyth": 117, "Franklin": 119,
+        "Fulton": 121, "Gilmer": 123, "Glascock": 125, "Glynn": 127, "Gordon": 129, "Grady": 131,
+        "Greene": 133, "Gwinnett": 135, "Habersham": 137, "Hall": 139, "Hancock": 141,
+        "Haralson": 143, "Harris": 145, "Hart": 147, "Heard": 149, "Henry": 151, "Houston": 153,
+        "Irwin": 155, "Jackson": 157, "Jasper": 159, "Jeff Davis": 161, "Jefferson": 163,
+        "Jenkins": 165, "Johnson": 167, "Jones": 169, "Lamar": 171, "Lanier": 173, "Laurens": 175,
+        "Lee": 177, "Liberty": 179, "Lincoln": 181, "Long": 183, "Lowndes": 185, "Lumpkin": 187,
+        "McDuffie": 189, "McIntosh": 191, "Macon": 193, "Madison": 195, "Marion": 197,
+        "Meriwether": 199, "Miller": 201, "Mitchell": 205, "Monroe": 207, "Montgomery": 209,
+        "Morgan": 211, "Murray": 213, "Muscogee": 215, "Newton": 217, "Oconee": 219,
+        "Oglethorpe": 221, "Paulding": 223, "Peach": 225, "Pickens": 227, "Pierce": 229,
+        "Pike": 231, "Polk": 233, "Pulaski": 235, "Putnam": 237, "Quitman": 239, "Rabun": 241,
+        "Randolph": 243, "Richmond": 245, "Rockdale": 247, "Schley": 249, "Screven": 251,
+        "Seminole": 253, "Spalding": 255, "Stephens": 257, "Stewart": 259, "Sumter": 261,
+        "Talbot": 263, "Taliaferro": 265, "Tattnall": 267, "Taylor": 269, "Telfair": 271,
+        "Terrell": 273, "Thomas": 275, "Tift": 277, "Toombs": 279, "Towns": 281, "Treutlen": 283,
+        "Troup": 285, "Turner": 287, "Twiggs": 289, "Union": 291, "Upson": 293, "Walker": 295,
+        "Walton": 297, "Ware": 299, "Warren": 301, "Washington": 303, "Wayne": 305, "Webster": 307,
+        "Wheeler": 309, "White": 311, "Whitfield": 313, "Wilcox": 315, "Wilkes": 317,
+        "Wilkinson": 319, "Worth": 321
+    },
+    "HI": {
+        "Hawaii": 1, "Honolulu": 3, "Kalawao": 5, "Kauai": 7, "Maui": 9
+    },
+    "ID": {
+        "Ada": 1, "Adams": 3, "Bannock": 5, "Bear Lake": 7, "Benewah": 9, "Bingham": 11,
+        "Blaine": 13, "Boise": 15, "Bonner": 17, "Bonneville": 19, "Boundary": 21, "Butte": 23,
+        "Camas": 25, "Canyon": 27, "Caribou": 29, "Cassia": 31, "Clark": 33, "Clearwater": 35,
+        "Custer": 37, "Elmore": 39, "Franklin": 41, "Fremont": 43, "Gem": 45, "Gooding": 47,
+        "Idaho": 49, "Jefferson": 51, "Jerome": 53, "Kootenai": 55, "Latah": 57, "Lemhi": 59,
+        "Lewis": 61, "Lincoln": 63, "Madison": 65, "Minidoka": 67, "Nez Perce": 69, "Oneida": 71,
+        "Owyhee": 73, "Payette": 75, "Power": 77, "Shoshone": 79, "Teton": 81, "Twin Falls": 83,
+        "Valley": 85, "Washington": 87
+    },
+    "IL": {
+        "Adams": 1, "Alexander": 3, "Bond": 5, "Boone": 7, "Brown": 9, "Bureau": 11, "Calhoun": 13,
+        "Carroll": 15, "Cass": 17, "Champaign": 19, "Christian": 21, "Clark": 23, "Clay": 25,
+        "Clinton": 27, "Coles": 29, "Cook": 31, "Crawford": 33, "Cumberland": 35, "DeKalb": 37,
+        "De Witt": 39, "Douglas": 41, "DuPage": 43, "Edgar": 45, "Edwards": 47, "Effingham": 49,
+        "Fayette": 51, "Ford": 53, "Franklin": 55, "Fulton": 57, "Gallatin": 59, "Greene": 61,
+        "Grundy": 63, "Hamilton": 65, "Hancock": 67, "Hardin": 69, "Henderson": 71, "Henry": 73,
+        "Iroquois": 75, "Jackson": 77, "Jasper": 79, "Jefferson": 81, "Jersey": 83,
+        "Jo Daviess": 85, "Johnson": 87, "Kane": 89, "Kankakee": 91, "Kendall": 93, "Knox": 95,
+        "Lake": 97, "LaSalle": 99, "Lawrence": 101, "Lee": 103, "Livingston": 105, "Logan": 107,
+        "McDonough": 109, "McHenry": 111, "McLean": 113, "Macon": 115, "Macoupin": 117,
+        "Madison": 119, "Marion": 121, "Marshall": 123, "Mason": 125, "Massac": 127, "Menard": 129,
+        "Mercer": 131, "Monroe": 133, "Montgomery": 135, "Morgan": 137, "Moultrie": 139,
+        "Ogle": 141, "Peoria": 143, "Perry": 145, "Piatt": 147, "Pike": 149, "Pope": 151,
+        "Pulaski": 153, "Putnam": 155, "Randolph": 157, "Richland": 159, "Rock Island": 161,
+        "St. Clair": 163, "Saline": 165, "Sangamon": 167, "Schuyler": 169, "Scott": 171,
+        "Shelby": 173, "Stark": 175, "Stephenson": 177, "Tazewell": 179, "Union": 181,
+        "Vermilion": 183, "Wabash": 185, "Warren": 187, "Washington": 189, "Wayne": 191,
+        "White": 193, "Whiteside": 195, "Will": 197, "Williamson": 199, "Winnebago": 201,
+        "Woodford": 203
+    },
+    "IN": {
+        "Adams": 1, "Allen": 3, "Bartholomew": 5, "Benton": 7, "Blackford": 9, "Boone": 11,
+        "Brown": 13, "Carroll": 15, "Cass": 17, "Clark": 19, "Clay": 21, "Clinton": 23,
+        "Crawford": 25, "Daviess": 27, "Dearborn": 29, "Decatur": 31, "DeKalb": 33, "Delaware": 35,
+        "Dubois": 37, "Elkhart": 39, "Fayette": 41, "Floyd": 43, "Fountain": 45, "Franklin": 47,
+        "Fulton": 49, "Gibson": 51, "Grant": 53, "Greene": 55, "Hamilton": 57, "Hancock": 59,
+        "Harrison": 61, "Hendricks": 63, "Henry": 65, "Howard": 67, "Huntington": 69,
+        "Jackson": 71, "Jasper": 73, "Jay": 75, "Jefferson": 77, "Jennings": 79, "Johnson": 81,
+        "Knox": 83, "Kosciusko": 85, "LaGrange": 87, "Lake": 89, "LaPorte": 91, "Lawrence": 93,
+        "Madison": 95, "Marion": 97, "Marshall": 99, "Martin": 101, "Miami": 103, "Monroe": 105,
+        "Montgomery": 107, "Morgan": 109, "Newton": 111, "Noble": 113, "Ohio": 115, "Orange": 117,
+        "Owen": 119, "Parke": 121, "Perry": 123, "Pike": 125, "Porter": 127, "Posey": 129,
+        "Pulaski": 131, "Putnam": 133, "Randolph": 135, "Ripley": 137, "Rush": 139,
+        "St. Joseph": 141, "Scott": 143, "Shelby": 145, "Spencer": 147, "Starke": 149,
+        "Steuben": 151, "Sullivan": 153, "Switzerland": 155, "Tippecanoe": 157, "Tipton": 159,
+        "Union": 161, "Vanderburgh": 163, "Vermillion": 165, "Vigo": 167, "Wabash": 169,
+        "Warren": 171, "Warrick": 173, "Washington": 175, "Wayne": 177, "Wells": 179, "White": 181,
+        "Whitley": 183
+    },
+    "IA": {
+        "Adair": 1, "Adams": 3, "Allamakee": 5, "Appanoose": 7, "Audubon": 9, "Benton": 11,
+        "Black Hawk": 13, "Boone": 15, "Bremer": 17, "Buchanan": 19, "Buena Vista": 21,
+        "Butler": 23, "Calhoun": 25, "Carroll": 27, "Cass": 29, "Cedar": 31, "Cerro Gordo": 33,
+        "Cherokee": 35, "Chickasaw": 37, "Clarke": 39, "Clay": 41, "Clayton": 43, "Clinton": 45,
+        "Crawford": 47, "Dallas": 49, "Davis": 51, "Decatur": 53, "Delaware": 55, "Des Moines": 57,
+        "Dickinson": 59, "Dubuque": 61, "Emmet": 63, "Fayette": 65, "Floyd": 67, "Franklin": 69,
+        "Fremont": 71, "Greene": 73, "Grundy": 75, "Guthrie": 77, "Hamilton": 79, "Hancock": 81,
+        "Hardin": 83, "Harrison": 85, "Henry": 87, "Howard": 89, "Humboldt": 91, "Ida": 93,
+        "Iowa": 95, "Jackson": 97, "Jasper": 99, "Jefferson": 101, "Johnson": 103, "Jones": 105,
+        "Keokuk": 107, "Kossuth": 109, "Lee": 111, "Linn": 113, "Louisa": 115, "Lucas": 117,
+        "Lyon": 119, "Madison": 121, "Mahaska": 123, "Marion": 125, "Marshall": 127, "Mills": 129,
+        "Mitchell": 131, "Monona": 133, "Monroe": 135, "Montgomery": 137, "Muscatine": 139,
+        "O'Brien": 141, "Osceola": 143, "Page": 145, "Palo Alto": 147, "Plymouth": 149,
+        "Pocahontas": 151, "Polk": 153, "Pottawattamie": 155, "Poweshiek": 157, "Ringgold": 159,
+        "Sac": 161, "Scott": 163, "Shelby": 165, "Sioux": 167, "Story": 169, "Tama": 171,
+        "Taylor": 173, "Union": 175, "Van Buren": 177, "Wapello": 179, "Warren": 181,
+        "Washington": 183, "Wayne": 185, "Webster": 187, "Winnebago": 189, "Winneshiek": 191,
+        "Woodbury": 193, "Worth": 195, "Wright": 197
+    },
+    "KS": {
+        "Allen": 1, "Anderson": 3, "Atchison": 5, "Barber": 7, "Barton": 9, "Bourbon": 11,
+        "Brown": 13, "Butler": 15, "Chase": 17, "Chautauqua": 19, "Cherokee": 21, "Cheyenne": 23,
+        "Clark": 25, "Clay": 27, "Cloud": 29, "Coffey": 31, "Comanche": 33, "Cowley": 35,
+        "Crawford": 37, "Decatur": 39, "Dickinson": 41, "Doniphan": 43, "Douglas": 45,
+        "Edwards": 47, "Elk": 49, "Ellis": 51, "Ellsworth": 53, "Finney": 55, "Ford": 57,
+        "Franklin": 59, "Geary": 61, "Gove": 63, "Graham": 65, "Grant": 67, "Gray": 69,
+        "Greeley": 71, "Greenwood": 73, "Hamilton": 75, "Harper": 77, "Harvey": 79, "Haskell": 81,
+        "Hodgeman": 83, "Jackson": 85, "Jefferson": 87, "Jewell": 89, "Johnson": 91, "Kearny": 93,
+        "Kingman": 95, "Kiowa": 97, "Labette": 99, "Lane": 101, "Leavenworth": 103, "Lincoln": 105,
+        "Linn": 107, "Logan": 109, "Lyon": 111, "McPherson": 113, "Marion": 115, "Marshall": 117,
+        "Meade": 119, "Miami": 121, "Mitchell": 123, "Montgomery": 125, "Morris": 127,
+        "Morton": 129, "Nemaha": 131, "Neosho": 133, "Ness": 135, "Norton": 137, "Osage": 139,
+        "Osborne": 141, "Ottawa": 143, "Pawnee": 145, "Phillips": 147, "Pottawatomie": 149,
+        "Pratt": 151, "Rawlins": 153, "Reno": 155, "Republic": 157, "Rice": 159, "Riley": 161,
+        "Rooks": 163, "Rush": 165, "Russell": 167, "Saline": 169, "Scott": 171, "Sedgwick": 173,
+        "Seward": 175, "Shawnee": 177, "Sheridan": 179, "Sherman": 181, "Smith": 183,
+        "Stafford": 185, "Stanton": 187, "Stevens": 189, "Sumner": 191, "Thomas": 193,
+        "Trego": 195, "Wabaunsee": 197, "Wallace": 199, "Washington": 201, "Wichita": 203,
+        "Wilson": 205, "Woodson": 207, "Wyandotte": 209
+    },
+    "KY": {
+        "Adair": 1, "Allen": 3, "Anderson": 5, "Ballard": 7, "Barren": 9, "Bath": 11, "Bell": 13,
+        "Boone": 15, "Bourbon": 17, "Boyd": 19, "Boyle": 21, "Bracken": 23, "Breathitt": 25,
+        "Breckinridge": 27, "Bullitt": 29, "Butler": 31, "Caldwell": 33, "Calloway": 35,
+        "Campbell": 37, "Carlisle": 39, "Carroll": 41, "Carter": 43, "Casey": 45, "Christian": 47,
+        "Clark": 49, "Clay": 51, "Clinton": 53, "Crittenden": 55, "Cumberland": 57, "Daviess": 59,
+        "Edmonson": 61, "Elliott": 63, "Estill": 65, "Fayette": 67, "Fleming": 69, "Floyd": 71,
+        "Franklin": 73, "Fulton": 75, "Gallatin": 77, "Garrard": 79, "Grant": 81, "Graves": 83,
+        "Grayson": 85, "Green": 87, "Greenup": 89, "Hancock": 91, "Hardin": 93, "Harlan": 95,
+        "Harrison": 97, "Hart": 99, "Henderson": 101, "Henry": 103, "Hickman": 105, "Hopkins": 107,
+        "Jackson": 109, "Jefferson": 111, "Jessamine": 113, "Johnson": 115, "Kenton": 117,
+        "Knott": 119, "Knox": 121, "Larue": 123, "Laurel": 125, "Lawrence": 127, "Lee": 129,
+        "Leslie": 131, "Letcher": 133, "Lewis": 135, "Lincoln": 137, "Livingston": 139,
+        "Logan": 141, "Lyon": 143, "McCracken": 145, "McCreary": 147, "McLean": 149,
+        "Madison": 151, "Magoffin": 153, "Marion": 155, "Marshall": 157, "Martin": 159,
+        "Mason": 161, "Meade": 163, "Menifee": 165, "Mercer": 167, "Metcalfe": 169, "Monroe": 171,
+        "Montgomery": 173, "Morgan": 175, "Muhlenberg": 177, "Nelson": 179, "Nicholas": 181,
+        "Ohio": 183, "Oldham": 185, "Owen": 187, "Owsley": 189, "Pendleton": 191, "Perry": 193,
+        "Pike": 195, "Powell": 197, "Pulaski": 199, "Robertson": 201, "Rockcastle": 203,
+        "Rowan": 205, "Russell": 207, "Scott": 209, "Shelby": 211, "Simpson": 213, "Spencer": 215,
+        "Taylor": 217, "Todd": 219, "Trigg": 221, "Trimble": 223, "Union": 225, "Warren": 227,
+        "Washington": 229, "Wayne": 231, "Webster": 233, "Whitley": 235, "Wolfe": 237,
+        "Woodford": 239
+    },
+    "LA": {
+        "Acadia": 1, "Allen": 3, "Ascension": 5, "Assumption": 7, "Avoyelles": 9, "Beauregard": 11,
+        "Bienville": 13, "Bossier": 15, "Caddo": 17, "Calcasieu": 19, "Caldwell": 21,
+        "Cameron": 23, "Catahoula": 25, "Claiborne": 27, "Concordia": 29, "De Soto": 31,
+        "East Baton Rouge": 33, "East Carroll": 35, "East Feliciana": 37, "Evangeline": 39,
+        "Franklin": 41, "Grant": 43, "Iberia": 45, "Iberville": 47, "Jackson": 49, "Jefferson": 51,
+        "Jefferson Davis": 53, "Lafayette": 55, "Lafourche": 57, "La Salle": 59, "Lincoln": 61,
+        "Livingston": 63, "Madison": 65, "Morehouse": 67, "Natchitoches": 69, "Orleans": 71,
+        "Ouachita": 73, "Plaquemines": 75, "Pointe Coupee": 77, "Rapides": 79, "Red River": 81,
+        "Richland": 83, "Sabine": 85, "St. Bernard": 87, "St. Charles": 89, "St. Helena": 91,
+        "St. James": 93, "St. John the Baptist": 95, "St. Landry": 97, "St. Martin": 99,
+        "St. Mary": 101, "St. Tammany": 103, "Tangipahoa": 105, "Tensas": 107, "Terrebonne": 109,
+        "Union": 111, "Vermilion": 113, "Vernon": 115, "Washington": 117, "Webster": 119,
+        "West Baton Rouge": 121, "West Carroll": 123, "West Feliciana": 125, "Winn": 127
+    },
+    "ME": {
+        "Androscoggin": 1, "Aroostook": 3, "Cumberland": 5, "Franklin": 7, "Hancock": 9,
+        "Kennebec": 11, "Knox": 13, "Lincoln": 15, "Oxford": 17, "Penobscot": 19,
+        "Piscataquis": 21, "Sagadahoc": 23, "Somerset": 25, "Waldo": 27, "Washington": 29,
+        "York": 31
+    },
+    "MD": {
+        "Allegany": 1, "Anne Arundel": 3, "Baltimore": 5, "Calvert": 9, "Caroline": 11,
+        "Carroll": 13, "Cecil": 15, "Charles": 17, "Dorchester": 19, "Frederick": 21,
+        "Garrett": 23, "Harford": 25, "Howard": 27, "Kent": 29, "Montgomery": 31,
+        "Prince George's": 33, "Queen Anne's": 35, "St. Mary's": 37, "Somerset": 39, "Talbot": 41,
+        "Washington": 43, "Wicomico": 45, "Worcester": 47, "Baltimore City": 510
+    },
+    "MA": {
+        "Barnstable": 1, "Berkshire": 3, "Bristol": 5, "Dukes": 7, "Essex": 9, "Franklin": 11,
+        "Hampden": 13, "Hampshire": 15, "Middlesex": 17, "Nantucket": 19, "Norfolk": 21,
+        "Plymouth": 23, "Suffolk": 25, "Worcester": 27
+    },
+    "MI": {
+        "Alcona": 1, "Alger": 3, "Allegan": 5, "Alpena": 7, "Antrim": 9, "Arenac": 11,
+        "Baraga": 13, "Barry": 15, "Bay": 17, "Benzie": 19, "Berrien": 21, "Branch": 23,
+        "Calhoun": 25, "Cass": 27, "Charlevoix": 29, "Cheboygan": 31, "Chippewa": 33, "Clare": 35,
+        "Clinton": 37, "Crawford": 39, "Delta": 41, "Dickinson": 43, "Eaton": 45, "Emmet": 47,
+        "Genesee": 49, "Gladwin": 51, "Gogebic": 53, "Grand Traverse": 55, "Gratiot": 57,
+        "Hillsdale": 59, "Houghton": 61, "Huron": 63, "Ingham": 65, "Ionia": 67, "Iosco": 69,
+        "Iron": 71, "Isabella": 73, "Jackson": 75, "Kalamazoo": 77, "Kalkaska": 79, "Kent": 81,
+        "Keweenaw": 83, "Lake": 85, "Lapeer": 87, "Leelanau": 89, "Lenawee": 91, "Livingston": 93,
+        "Luce": 95, "Mackinac": 97, "Macomb": 99, "Manistee": 101, "Marquette": 103, "Mason": 105,
+        "Mecosta": 107, "Menominee": 109, "Midland": 111, "Missaukee": 113, "Monroe": 115,
+        "Montcalm": 117, "Montmorency": 119, "Muskegon": 121, "Newaygo": 123, "Oakland": 125,
+        "Oceana": 127, "Ogemaw": 129, "Ontonagon": 131, "Osceola": 133, "Oscoda": 135,
+        "Otsego": 137, "Ottawa": 139, "Presque Isle": 141, "Roscommon": 143, "Saginaw": 145,
+        "St. Clair": 147, "St. Joseph": 149, "Sanilac": 151, "Schoolcraft": 153, "Shiawassee": 155,
+        "Tuscola": 157, "Van Buren": 159, "Washtenaw": 161, "Wayne": 163, "Wexford": 165
+    },
+    "MN": {
+        "Aitkin": 1, "Anoka": 3, "Becker": 5, "Beltrami": 7, "Benton": 9, "Big Stone": 11,
+        "Blue Earth": 13, "Brown": 15, "Carlton": 17, "Carver": 19, "Cass": 21, "Chippewa": 23,
+        "Chisago": 25, "Clay": 27, "Clearwater": 29, "Cook": 31, "Cottonwood": 33, "Crow Wing": 35,
+        "Dakota": 37, "Dodge": 39, "Douglas": 41, "Faribault": 43, "Fillmore": 45, "Freeborn": 47,
+        "Goodhue": 49, "Grant": 51, "Hennepin": 53, "Houston": 55, "Hubbard": 57, "Isanti": 59,
+        "Itasca": 61, "Jackson": 63, "Kanabec": 65, "Kandiyohi": 67, "Kittson": 69,
+        "Koochiching": 71, "Lac qui Parle": 73, "Lake": 75, "Lake of the Woods": 77,
+        "Le Sueur": 79, "Lincoln": 81, "Lyon": 83, "McLeod": 85, "Mahnomen": 87, "Marshall": 89,
+        "Martin": 91, "Meeker": 93, "Mille Lacs": 95, "Morrison": 97, "Mower": 99, "Murray": 101,
+        "Nicollet": 103, "Nobles": 105, "Norman": 107, "Olmsted": 109, "Otter Tail": 111,
+        "Pennington": 113, "Pine": 115, "Pipestone": 117, "Polk": 119, "Pope": 121, "Ramsey": 123,
+        "Red Lake": 125, "Redwood": 127, "Renville": 129, "Rice": 131, "Rock": 133, "Roseau": 135,
+        "St. Louis": 137, "Scott": 139, "Sherburne": 141, "Sibley": 143, "Stearns": 145,
+        "Steele": 147, "Stevens": 149, "Swift": 151, "Todd": 153, "Traverse": 155, "Wabasha": 157,
+        "Wadena": 159, "Waseca": 161, "Washington": 163, "Watonwan": 165, "Wilkin": 167,
+        "Winona": 169, "Wright": 171, "Yellow Medicine": 173
+    },
+    "MS": {
+        "Adams": 1, "Alcorn": 3, "Amite": 5, "Attala": 7, "Benton": 9, "Bolivar": 11,
+        "Calhoun": 13, "Carroll": 15, "Chickasaw": 17, "Choctaw": 19, "Claiborne": 21,
+        "Clarke": 23, "Clay": 25, "Coahoma": 27, "Copiah": 29, "Covington": 31, "DeSoto": 33,
+        "Forrest": 35, "Franklin": 37, "George": 39, "Greene": 41, "Grenada": 43, "Hancock": 45,
+        "Harrison": 47, "Hinds": 49, "Holmes": 51, "Humphreys": 53, "Issaquena": 55,
+        "Itawamba": 57, "Jackson": 59, "Jasper": 61, "Jefferson": 63, "Jefferson Davis": 65,
+        "Jones": 67, "Kemper": 69, "Lafayette": 71, "Lamar": 73, "Lauderdale": 75, "Lawrence": 77,
+        "Leake": 79, "Lee": 81, "Leflore": 83, "Lincoln": 85, "Lowndes": 87, "Madison": 89,
+        "Marion": 91, "Marshall": 93, "Monroe": 95, "Montgomery": 97, "Neshoba": 99, "Newton": 101,
+        "Noxubee": 103, "Oktibbeha": 105, "Panola": 107, "Pearl River": 109, "Perry": 111,
+        "Pike": 113, "Pontotoc": 115, "Prentiss": 117, "Quitman": 119, "Rankin": 121, "Scott": 123,
+        "Sharkey": 125, "Simpson": 127, "Smith": 129, "Stone": 131, "Sunflower": 133,
+        "Tallahatchie": 135, "Tate": 137, "Tippah": 139, "Tishomingo": 141, "Tunica": 143,
+        "Union": 145, "Walthall": 147, "Warren": 149, "Washington": 151, "Wayne": 153,
+        "Webster": 155, "Wilkinson": 157, "Winston": 159, "Yalobusha": 161, "Yazoo": 163
+    },
+    "MO": {
+        "Adair": 1, "Andrew": 3, "Atchison": 5, "Audrain": 7, "Barry": 9, "Barton": 11,
+        "Bates": 13, "Benton": 15, "Bollinger": 17, "Boone": 19, "Buchanan": 21, "Butler": 23,
+        "Caldwell": 25, "Callaway": 27, "Camden": 29, "Cape Girardeau": 31, "Carroll": 33,
+        "Carter": 35, "Cass": 37, "Cedar": 39, "Chariton": 41, "Christian": 43, "Clark": 45,
+        "Clay": 47, "Clinton": 49, "Cole": 51, "Cooper": 53, "Crawford": 55, "Dade": 57,
+        "Dallas": 59, "Daviess": 61, "DeKalb": 63, "Dent": 65, "Douglas": 67, "Dunklin": 69,
+        "Franklin": 71, "Gasconade": 73, "Gentry": 75, "Greene": 77, "Grundy": 79, "Harrison": 81,
+        "Henry": 83, "Hickory": 85, "Holt": 87, "Howard": 89, "Howell": 91, "Iron": 93,
+        "Jackson": 95, "Jasper": 97, "Jefferson": 99, "Johnson": 101, "Knox": 103, "Laclede": 105,
+        "Lafayette": 107, "Lawrence": 109, "Lewis": 111, "Lincoln": 113, "Linn": 115,
+        "Livingston": 117, "McDonald": 119, "Macon": 121, "Madison": 123, "Maries": 125,
+        "Marion": 127, "Mercer": 129, "Miller": 131, "Mississippi": 133, "Moniteau": 135,
+        "Monroe": 137, "Montgomery": 139, "Morgan": 141, "New Madrid": 143, "Newton": 145,
+        "Nodaway": 147, "Oregon": 149, "Osage": 151, "Ozark": 153, "Pemiscot": 155, "Perry": 157,
+        "Pettis": 159, "Phelps": 161, "Pike": 163, "Platte": 165, "Polk": 167, "Pulaski": 169,
+        "Putnam": 171, "Ralls": 173, "Randolph": 175, "Ray": 177, "Reynolds": 179, "Ripley": 181,
+        "St. Charles": 183, "St. Clair": 185, "Ste. Genevieve": 186, "St. Francois": 187,
+        "St. Louis": 189, "Saline": 195, "Schuyler": 197, "Scotland": 199, "Scott": 201,
+        "Shannon": 203, "Shelby": 205, "Stoddard": 207, "Stone": 209, "Sullivan": 211,
+        "Taney": 213, "Texas": 215, "Vernon": 217, "Warren": 219, "Washington": 221, "Wayne": 223,
+        "Webster": 225, "Worth": 227, "Wright": 229, "St. Louis City": 510
+    },
+    "MT": {
+        "Beaverhead": 1, "Big Horn": 3, "Blaine": 5, "Broadwater": 7, "Carbon": 9, "Carter": 11,
+        "Cascade": 13, "Chouteau": 15, "Custer": 17, "Daniels": 19, "Dawson": 21, "Deer Lodge": 23,
+        "Fallon": 25, "Fergus": 27, "Flathead": 29, "Gallatin": 31, "Garfield": 33, "Glacier": 35,
+        "Golden Valley": 37, "Granite": 39, "Hill": 41, "Jefferson": 43, "Judith Basin": 45,
+        "Lake": 47, "Lewis and Clark": 49, "Liberty": 51, "Lincoln": 53, "McCone": 55,
+        "Madison": 57, "Meagher": 59, "Mineral": 61, "Missoula": 63, "Musselshell": 65, "Park": 67,
+        "Petroleum": 69, "Phillips": 71, "Pondera": 73, "Powder River": 75, "Powell": 77,
+        "Prairie": 79, "Ravalli": 81, "Richland": 83, "Roosevelt": 85, "Rosebud": 87,
+        "Sanders": 89, "Sheridan": 91, "Silver Bow": 93, "Stillwater": 95, "Sweet Grass": 97,
+        "Teton": 99, "Toole": 101, "Treasure": 103, "Valley": 105, "Wheatland": 107, "Wibaux": 109,
+        "Yellowstone": 111
+    },
+    "NE": {
+        "Adams": 1, "Antelope": 3, "Arthur": 5, "Banner": 7, "Blaine": 9, "Boone": 11,
+        "Box Butte": 13, "Boyd": 15, "Brown": 17, "Buffalo": 19, "Burt": 21, "Butler": 23,
+        "Cass": 25, "Cedar": 27, "Chase": 29, "Cherry": 31, "Cheyenne": 33, "Clay": 35,
+        "Colfax": 37, "Cuming": 39, "Custer": 41, "Dakota": 43, "Dawes": 45, "Dawson": 47,
+        "Deuel": 49, "Dixon": 51, "Dodge": 53, "Douglas": 55, "Dundy": 57, "Fillmore": 59,
+        "Franklin": 61, "Frontier": 63, "Furnas": 65, "Gage": 67, "Garden": 69, "Garfield": 71,
+        "Gosper": 73, "Grant": 75, "Greeley": 77, "Hall": 79, "Hamilton": 81, "Harlan": 83,
+        "Hayes": 85, "Hitchcock": 87, "Holt": 89, "Hooker": 91, "Howard": 93, "Jefferson": 95,
+        "Johnson": 97, "Kearney": 99, "Keith": 101, "Keya Paha": 103, "Kimball": 105, "Knox": 107,
+        "Lancaster": 109, "Lincoln": 111, "Logan": 113, "Loup": 115, "McPherson": 117,
+        "Madison": 119, "Merrick": 121, "Morrill": 123, "Nance": 125, "Nemaha": 127,
+        "Nuckolls": 129, "Otoe": 131, "Pawnee": 133, "Perkins": 135, "Phelps": 137, "Pierce": 139,
+        "Platte": 141, "Polk": 143, "Red Willow": 145, "Richardson": 147, "Rock": 149,
+        "Saline": 151, "Sarpy": 153, "Saunders": 155, "Scotts Bluff": 157, "Seward": 159,
+        "Sheridan": 161, "Sherman": 163, "Sioux": 165, "Stanton": 167, "Thayer": 169,
+        "Thomas": 171, "Thurston": 173, "Valley": 175, "Washington": 177, "Wayne": 179,
+        "Webster": 181, "Wheeler": 183, "York": 185
+    },
+    "NV": {
+        "Churchill": 1, "Clark": 3, "Douglas": 5, "Elko": 7, "Esmeralda": 9, "Eureka": 11,
+        "Humboldt": 13, "Lander": 15, "Lincoln": 17, "Lyon": 19, "Mineral": 21, "Nye": 23,
+        "Pershing": 27, "Storey": 29, "Washoe": 31, "White Pine": 33, "Carson City": 510
+    },
+    "NH": {
+        "Belknap": 1, "Carroll": 3, "Cheshire": 5, "Coos": 7, "Grafton": 9, "Hillsborough": 11,
+        "Merrimack": 13, "Rockingham": 15, "Strafford": 17, "Sullivan": 19
+    },
+    "NJ": {
+        "Atlantic": 1, "Bergen": 3, "Burlington": 5, "Camden": 7, "Cape May": 9, "Cumberland": 11,
+        "Essex": 13, "Gloucester": 15, "Hudson": 17, "Hunterdon": 19, "Mercer": 21,
+        "Middlesex": 23, "Monmouth": 25, "Morris": 27, "Ocean": 29, "Passaic": 31, "Salem": 33,
+        "Somerset": 35, "Sussex": 37, "Union": 39, "Warren": 41
+    },
+    "NM": {
+        "Bernalillo": 1, "Catron": 3, "Chaves": 5, "Cibola": 6, "Colfax": 7, "Curry": 9,
+        "De Baca": 11, "Doña Ana": 13, "Eddy": 15, "Grant": 17, "Guadalupe": 19, "Harding": 21,
+        "Hidalgo": 23, "Lea": 25, "Lincoln": 27, "Los Alamos": 28, "Luna": 29, "McKinley": 31,
+        "Mora": 33, "Otero": 35, "Quay": 37, "Rio Arriba": 39, "Roosevelt": 41, "Sandoval": 43,
+        "San Juan": 45, "San Miguel": 47, "Santa Fe": 49, "Sierra": 51, "Socorro": 53, "Taos": 55,
+        "Torrance": 57, "Union": 59, "Valencia": 61
+    },
+    "NY": {
+        "Albany": 1, "Allegany": 3, "Bronx": 5, "Broome": 7, "Cattaraugus": 9, "Cayuga": 11,
+        "Chautauqua": 13, "Chemung": 15, "Chenango": 17, "Clinton": 19, "Columbia": 21,
+        "Cortland": 23, "Delaware": 25, "Dutchess": 27, "Erie": 29, "Essex": 31, "Franklin": 33,
+        "Fulton": 35, "Genesee": 37, "Greene": 39, "Hamilton": 41, "Herkimer": 43, "Jefferson": 45,
+        "Brooklyn": 47, "Kings": 47, "Lewis": 49, "Livingston": 51, "Madison": 53, "Monroe": 55,
+        "Montgomery": 57, "Nassau": 59, "Manhattan": 61, "New York": 61, "Niagara": 63,
+        "Oneida": 65, "Onondaga": 67, "Ontario": 69, "Orange": 71, "Orleans": 73, "Oswego": 75,
+        "Otsego": 77, "Putnam": 79, "Queens": 81, "Rensselaer": 83, "Richmond": 85,
+        "Staten Island": 85, "Rockland": 87, "St. Lawrence": 89, "Saratoga": 91, "Schenectady": 93,
+        "Schoharie": 95, "Schuyler": 97, "Seneca": 99, "Steuben": 101, "Suffolk": 103,
+        "Sullivan": 105, "Tioga": 107, "Tompkins": 109, "Ulster": 111, "Warren": 113,
+        "Washington": 115, "Wayne": 117, "Westchester": 119, "Wyoming": 121, "Yates": 123
+    },
+    "NC": {
+        "Alamance": 1, "Alexander": 3, "Alleghany": 5, "Anson": 7, "Ashe": 9, "Avery": 11,
+        "Beaufort": 13, "Bertie": 15, "Bladen": 17, "Brunswick": 19, "Buncombe": 21, "Burke": 23,
+        "Cabarrus": 25, "Caldwell": 27, "Camden": 29, "Carteret": 31, "Caswell": 33, "Catawba": 35,
+        "Chatham": 37, "Cherokee": 39, "Chowan": 41, "Clay": 43, "Cleveland": 45, "Columbus": 47,
+        "Craven": 49, "Cumberland": 51, "Currituck": 53, "Dare": 55, "Davidson": 57, "Davie": 59,
+        "Duplin": 61, "Durham": 63, "Edgecombe": 65, "Forsyth": 67, "Franklin": 69, "Gaston": 71,
+        "Gates": 73, "Graham": 75, "Granville": 77, "Greene": 79, "Guilford": 81, "Halifax": 83,
+        "Harnett": 85, "Haywood": 87, "Henderson": 89, "Hertford": 91, "Hoke": 93, "Hyde": 95,
+        "Iredell": 97, "Jackson": 99, "Johnston": 101, "Jones": 103, "Lee": 105, "Lenoir": 107,
+        "Lincoln": 109, "McDowell": 111, "Macon": 113, "Madison": 115, "Martin": 117,
+        "Mecklenburg": 119, "Mitchell": 121, "Montgomery": 123, "Moore": 125, "Nash": 127,
+        "New Hanover": 129, "Northampton": 131, "Onslow": 133, "Orange": 135, "Pamlico": 137,
+        "Pasquotank": 139, "Pender": 141, "Perquimans": 143, "Person": 145, "Pitt": 147,
+        "Polk": 149, "Randolph": 151, "Richmond": 153, "Robeson": 155, "Rockingham": 157,
+        "Rowan": 159, "Rutherford": 161, "Sampson": 163, "Scotland": 165, "Stanly": 167,
+        "Stokes": 169, "Surry": 171, "Swain": 173, "Transylvania": 175, "Tyrrell": 177,
+        "Union": 179, "Vance": 181, "Wake": 183, "Warren": 185, "Washington": 187, "Watauga": 189,
+        "Wayne": 191, "Wilkes": 193, "Wilson": 195, "Yadkin": 197, "Yancey": 199
+    },
+    "ND": {
+        "Adams": 1, "Barnes": 3, "Benson": 5, "Billings": 7, "Bottineau": 9, "Bowman": 11,
+        "Burke": 13, "Burleigh": 15, "Cass": 17, "Cavalier": 19, "Dickey": 21, "Divide": 23,
+        "Dunn": 25, "Eddy": 27, "Emmons": 29, "Foster": 31, "Golden Valley": 33, "Grand Forks": 35,
+        "Grant": 37, "Griggs": 39, "Hettinger": 41, "Kidder": 43, "LaMoure": 45, "Logan": 47,
+        "McHenry": 49, "McIntosh": 51, "McKenzie": 53, "McLean": 55, "Mercer": 57, "Morton": 59,
+        "Mountrail": 61, "Nelson": 63, "Oliver": 65, "Pembina": 67, "Pierce": 69, "Ramsey": 71,
+        "Ransom": 73, "Renville": 75, "Richland": 77, "Rolette": 79, "Sargent": 81, "Sheridan": 83,
+        "Sioux": 85, "Slope": 87, "Stark": 89, "Steele": 91, "Stutsman": 93, "Towner": 95,
+        "Traill": 97, "Walsh": 99, "Ward": 101, "Wells": 103, "Williams": 105
+    },
+    "OH": {
+        "Adams": 1, "Allen": 3, "Ashland": 5, "Ashtabula": 7, "Athens": 9, "Auglaize": 11,
+        "Belmont": 13, "Brown": 15, "Butler": 17, "Carroll": 19, "Champaign": 21, "Clark": 23,
+        "Clermont": 25, "Clinton": 27, "Columbiana": 29, "Coshocton": 31, "Crawford": 33,
+        "Cuyahoga": 35, "Darke": 37, "Defiance": 39, "Delaware": 41, "Erie": 43, "Fairfield": 45,
+        "Fayette": 47, "Franklin": 49, "Fulton": 51, "Gallia": 53, "Geauga": 55, "Greene": 57,
+        "Guernsey": 59, "Hamilton": 61, "Hancock": 63, "Hardin": 65, "Harrison": 67, "Henry": 69,
+        "Highland": 71, "Hocking": 73, "Holmes": 75, "Huron": 77, "Jackson": 79, "Jefferson": 81,
+        "Knox": 83, "Lake": 85, "Lawrence": 87, "Licking": 89, "Logan": 91, "Lorain": 93,
+        "Lucas": 95, "Madison": 97, "Mahoning": 99, "Marion": 101, "Medina": 103, "Meigs": 105,
+        "Mercer": 107, "Miami": 109, "Monroe": 111, "Montgomery": 113, "Morgan": 115,
+        "Morrow": 117, "Muskingum": 119, "Noble": 121, "Ottawa": 123, "Paulding": 125,
+        "Perry": 127, "Pickaway": 129, "Pike": 131, "Portage": 133, "Preble": 135, "Putnam": 137,
+        "Richland": 139, "Ross": 141, "Sandusky": 143, "Scioto": 145, "Seneca": 147, "Shelby": 149,
+        "Stark": 151, "Summit": 153, "Trumbull": 155, "Tuscarawas": 157, "Union": 159,
+        "Van Wert": 161, "Vinton": 163, "Warren": 165, "Washington": 167, "Wayne": 169,
+        "Williams": 171, "Wood": 173, "Wyandot": 175
+    },
+    "OK": {
+        "Adair": 1, "Alfalfa": 3, "Atoka": 5, "Beaver": 7, "Beckham": 9, "Blaine": 11, "Bryan": 13,
+        "Caddo": 15, "Canadian": 17, "Carter": 19, "Cherokee": 21, "Choctaw": 23, "Cimarron": 25,
+        "Cleveland": 27, "Coal": 29, "Comanche": 31, "Cotton": 33, "Craig": 35, "Creek": 37,
+        "Custer": 39, "Delaware": 41, "Dewey": 43, "Ellis": 45, "Garfield": 47, "Garvin": 49,
+        "Grady": 51, "Grant": 53, "Greer": 55, "Harmon": 57, "Harper": 59, "Haskell": 61,
+        "Hughes": 63, "Jackson": 65, "Jefferson": 67, "Johnston": 69, "Kay": 71, "Kingfisher": 73,
+        "Kiowa": 75, "Latimer": 77, "Le Flore": 79, "Lincoln": 81, "Logan": 83, "Love": 85,
+        "McClain": 87, "McCurtain": 89, "McIntosh": 91, "Major": 93, "Marshall": 95, "Mayes": 97,
+        "Murray": 99, "Muskogee": 101, "Noble": 103, "Nowata": 105, "Okfuskee": 107,
+        "Oklahoma": 109, "Okmulgee": 111, "Osage": 113, "Ottawa": 115, "Pawnee": 117, "Payne": 119,
+        "Pittsburg": 121, "Pontotoc": 123, "Pottawatomie": 125, "Pushmataha": 127,
+        "Roger Mills": 129, "Rogers": 131, "Seminole": 133, "Sequoyah": 135, "Stephens": 137,
+        "Texas": 139, "Tillman": 141, "Tulsa": 143, "Wagoner": 145, "Washington": 147,
+        "Washita": 149, "Woods": 151, "Woodward": 153
+    },
+    "OR": {
+        "Baker": 1, "Benton": 3, "Clackamas": 5, "Clatsop": 7, "Columbia": 9, "Coos": 11,
+        "Crook": 13, "Curry": 15, "Deschutes": 17, "Douglas": 19, "Gilliam": 21, "Grant": 23,
+        "Harney": 25, "Hood River": 27, "Jackson": 29, "Jefferson": 31, "Josephine": 33,
+        "Klamath": 35, "Lake": 37, "Lane": 39, "Lincoln": 41, "Linn": 43, "Malheur": 45,
+        "Marion": 47, "Morrow": 49, "Multnomah": 51, "Polk": 53, "Sherman": 55, "Tillamook": 57,
+        "Umatilla": 59, "Union": 61, "Wallowa": 63, "Wasco": 65, "Washington": 67, "Wheeler": 69,
+        "Yamhill": 71
+    },
+    "PA": {
+        "Adams": 1, "Allegheny": 3, "Armstrong": 5, "Beaver": 7, "Bedford": 9, "Berks": 11,
+        "Blair": 13, "Bradford": 15, "Bucks": 17, "Butler": 19, "Cambria": 21, "Cameron": 23,
+        "Carbon": 25, "Centre": 27, "Chester": 29, "Clarion": 31, "Clearfield": 33, "Clinton": 35,
+        "Columbia": 37, "Crawford": 39, "Cumberland": 41, "Dauphin": 43, "Delaware": 45, "Elk": 47,
+        "Erie": 49, "Fayette": 51, "Forest": 53, "Franklin": 55, "Fulton": 57, "Greene": 59,
+        "Huntingdon": 61, "Indiana": 63, "Jefferson": 65, "Juniata": 67, "Lackawanna": 69,
+        "Lancaster": 71, "Lawrence": 73, "Lebanon": 75, "Lehigh": 77, "Luzerne": 79,
+        "Lycoming": 81, "McKean": 83, "Mercer": 85, "Mifflin": 87, "Monroe": 89, "Montgomery": 91,
+        "Montour": 93, "Northampton": 95, "Northumberland": 97, "Perry": 99, "Philadelphia": 101,
+        "Pike": 103, "Potter": 105, "Schuylkill": 107, "Snyder": 109, "Somerset": 111,
+        "Sullivan": 113, "Susquehanna": 115, "Tioga": 117, "Union": 119, "Venango": 121,
+        "Warren": 123, "Washington": 125, "Wayne": 127, "Westmoreland": 129, "Wyoming": 131,
+        "York": 133
+    },
+    "RI": {
+        "Bristol": 1, "Kent": 3, "Newport": 5, "Providence": 7, "Washington": 9
+    },
+    "SC": {
+        "Abbeville": 1, "Aiken": 3, "Allendale": 5, "Anderson": 7, "Bamberg": 9, "Barnwell": 11,
+        "Beaufort": 13, "Berkeley": 15, "Calhoun": 17, "Charleston": 19, "Cherokee": 21,
+        "Chester": 23, "Chesterfield": 25, "Clarendon": 27, "Colleton": 29, "Darlington": 31,
+        "Dillon": 33, "Dorchester": 35, "Edgefield": 37, "Fairfield": 39, "Florence": 41,
+        "Georgetown": 43, "Greenville": 45, "Greenwood": 47, "Hampton": 49, "Horry": 51,
+        "Jasper": 53, "Kershaw": 55, "Lancaster": 57, "Laurens": 59, "Lee": 61, "Lexington": 63,
+        "McCormick": 65, "Marion": 67, "Marlboro": 69, "Newberry": 71, "Oconee": 73,
+        "Orangeburg": 75, "Pickens": 77, "Richland": 79, "Saluda": 81, "Spartanburg": 83,
+        "Sumter": 85, "Union": 87, "Williamsburg": 89, "York": 91
+    },
+    "SD": {
+        "Aurora": 3, "Beadle": 5, "Bennett": 7, "Bon Homme": 9, "Brookings": 11, "Brown": 13,
+        "Brule": 15, "Buffalo": 17, "Butte": 19, "Campbell": 21, "Charles Mix": 23, "Clark": 25,
+        "Clay": 27, "Codington": 29, "Corson": 31, "Custer": 33, "Davison": 35, "Day": 37,
+        "Deuel": 39, "Dewey": 41, "Douglas": 43, "Edmunds": 45, "Fall River": 47, "Faulk": 49,
+        "Grant": 51, "Gregory": 53, "Haakon": 55, "Hamlin": 57, "Hand": 59, "Hanson": 61,
+        "Harding": 63, "Hughes": 65, "Hutchinson": 67, "Hyde": 69, "Jackson": 71, "Jerauld": 73,
+        "Jones": 75, "Kingsbury": 77, "Lake": 79, "Lawrence": 81, "Lincoln": 83, "Lyman": 85,
+        "McCook": 87, "McPherson": 89, "Marshall": 91, "Meade": 93, "Mellette": 95, "Miner": 97,
+        "Minnehaha": 99, "Moody": 101, "Oglala Lakota": 102, "Shannon": 102, "Pennington": 103,
+        "Perkins": 105, "Potter": 107, "Roberts": 109, "Sanborn": 111, "Spink": 115,
+        "Stanley": 117, "Sully": 119, "Todd": 121, "Tripp": 123, "Turner": 125, "Union": 127,
+        "Walworth": 129, "Yankton": 135, "Ziebach": 137
+    },
+    "TN": {
+        "Anderson": 1, "Bedford": 3, "Benton": 5, "Bledsoe": 7, "Blount": 9, "Bradley": 11,
+        "Campbell": 13, "Cannon": 15, "Carroll": 17, "Carter": 19, "Cheatham": 21, "Chester": 23,
+        "Claiborne": 25, "Clay": 27, "Cocke": 29, "Coffee": 31, "Crockett": 33, "Cumberland": 35,
+        "Davidson": 37, "Decatur": 39, "DeKalb": 41, "Dickson": 43, "Dyer": 45, "Fayette": 47,
+        "Fentress": 49, "Franklin": 51, "Gibson": 53, "Giles": 55, "Grainger": 57, "Greene": 59,
+        "Grundy": 61, "Hamblen": 63, "Hamilton": 65, "Hancock": 67, "Hardeman": 69, "Hardin": 71,
+        "Hawkins": 73, "Haywood": 75, "Henderson": 77, "Henry": 79, "Hickman": 81, "Houston": 83,
+        "Humphreys": 85, "Jackson": 87, "Jefferson": 89, "Johnson": 91, "Knox": 93, "Lake": 95,
+        "Lauderdale": 97, "Lawrence": 99, "Lewis": 101, "Lincoln": 103, "Loudon": 105,
+        "McMinn": 107, "McNairy": 109, "Macon": 111, "Madison": 113, "Marion": 115,
+        "Marshall": 117, "Maury": 119, "Meigs": 121, "Monroe": 123, "Montgomery": 125,
+        "Moore": 127, "Morgan": 129, "Obion": 131, "Overton": 133, "Perry": 135, "Pickett": 137,
+        "Polk": 139, "Putnam": 141, "Rhea": 143, "Roane": 145, "Robertson": 147, "Rutherford": 149,
+        "Scott": 151, "Sequatchie": 153, "Sevier": 155, "Shelby": 157, "Smith": 159,
+        "Stewart": 161, "Sullivan": 163, "Sumner": 165, "Tipton": 167, "Trousdale": 169,
+        "Unicoi": 171, "Union": 173, "Van Buren": 175, "Warren": 177, "Washington": 179,
+        "Wayne": 181, "Weakley": 183, "White": 185, "Williamson": 187, "Wilson": 189
+    },
+    "TX": {
+        "Anderson": 1, "Andrews": 3, "Angelina": 5, "Aransas": 7, "Archer": 9, "Armstrong": 11,
+        "Atascosa": 13, "Austin": 15, "Bailey": 17, "Bandera": 19, "Bastrop": 21, "Baylor": 23,
+        "Bee": 25, "Bell": 27, "Bexar": 29, "Blanco": 31, "Borden": 33, "Bosque": 35, "Bowie": 37,
+        "Brazoria": 39, "Brazos": 41, "Brewster": 43, "Briscoe": 45, "Brooks": 47, "Brown": 49,
+        "Burleson": 51, "Burnet": 53, "Caldwell": 55, "Calhoun": 57, "Callahan": 59, "Cameron": 61,
+        "Camp": 63, "Carson": 65, "Cass": 67, "Castro": 69, "Chambers": 71, "Cherokee": 73,
+        "Childress": 75, "Clay": 77, "Cochran": 79, "Coke": 81, "Coleman": 83, "Collin": 85,
+        "Collingsworth": 87, "Colorado": 89, "Comal": 91, "Comanche": 93, "Concho": 95,
+        "Cooke": 97, "Coryell": 99, "Cottle": 101, "Crane": 103, "Crockett": 105, "Crosby": 107,
+        "Culberson": 109, "Dallam": 111, "Dallas": 113, "Dawson": 115, "Deaf Smith": 117,
+        "Delta": 119, "Denton": 121, "DeWitt": 123, "Dickens": 125, "Dimmit": 127, "Donley": 129,
+        "Duval": 131, "Eastland": 133, "Ector": 135, "Edwards": 137, "Ellis": 139, "El Paso": 141,
+        "Erath": 143, "Falls": 145, "Fannin": 147, "Fayette": 149, "Fisher": 151, "Floyd": 153,
+        "Foard": 155, "Fort Bend": 157, "Franklin": 159, "Freestone": 161, "Frio": 163,
+        "Gaines": 165, "Galveston": 167, "Garza": 169, "Gillespie": 171, "Glasscock": 173,
+        "Goliad": 175, "Gonzales": 177, "Gray": 179, "Grayson": 181, "Gregg": 183, "Grimes": 185,
+        "Guadalupe": 187, "Hale": 189, "Hall": 191, "Hamilton": 193, "Hansford": 195,
+        "Hardeman": 197, "Hardin": 199, "Harris": 201, "Harrison": 203, "Hartley": 205,
+        "Haskell": 207, "Hays": 209, "Hemphill": 211, "Henderson": 213, "Hidalgo": 215,
+        "Hill": 217, "Hockley": 219, "Hood": 221, "Hopkins": 223, "Houston": 225, "Howard": 227,
+        "Hudspeth": 229, "Hunt": 231, "Hutchinson": 233, "Irion": 235, "Jack": 237, "Jackson": 239,
+        "Jasper": 241, "Jeff Davis": 243, "Jefferson": 245, "Jim Hogg": 247, "Jim Wells": 249,
+        "Johnson": 251, "Jones": 253, "Karnes": 255, "Kaufman": 257, "Kendall": 259, "Kenedy": 261,
+        "Kent": 263, "Kerr": 265, "Kimble": 267, "King": 269, "Kinney": 271, "Kleberg": 273,
+        "Knox": 275, "Lamar": 277, "Lamb": 279, "Lampasas": 281, "La Salle": 283, "Lavaca": 285,
+        "Lee": 287, "Leon": 289, "Liberty": 291, "Limestone": 293, "Lipscomb": 295,
+        "Live Oak": 297, "Llano": 299, "Loving": 301, "Lubbock": 303, "Lynn": 305,
+        "McCulloch": 307, "McLennan": 309, "McMullen": 311, "Madison": 313, "Marion": 315,
+        "Martin": 317, "Mason": 319, "Matagorda": 321, "Maverick": 323, "Medina": 325,
+        "Menard": 327, "Midland": 329, "Milam": 331, "Mills": 333, "Mitchell": 335,
+        "Montague": 337, "Montgomery": 339, "Moore": 341, "Morris": 343, "Motley": 345,
+        "Nacogdoches": 347, "Navarro": 349, "Newton": 351, "Nolan": 353, "Nueces": 355,
+        "Ochiltree": 357, "Oldham": 359, "Orange": 361, "Palo Pinto": 363, "Panola": 365,
+        "Parker": 367, "Parmer": 369, "Pecos": 371, "Polk": 373, "Potter": 375, "Presidio": 377,
+        "Rains": 379, "Randall": 381, "Reagan": 383, "Real": 385, "Red River": 387, "Reeves": 389,
+        "Refugio": 391, "Roberts": 393, "Robertson": 395, "Rockwall": 397, "Runnels": 399,
+        "Rusk": 401, "Sabine": 403, "San Augustine": 405, "San Jacinto": 407, "San Patricio": 409,
+        "San Saba": 411, "Schleicher": 413, "Scurry": 415, "Shackelford": 417, "Shelby": 419,
+        "Sherman": 421, "Smith": 423, "Somervell": 425, "Starr": 427, "Stephens": 429,
+        "Sterling": 431, "Stonewall": 433, "Sutton": 435, "Swisher": 437, "Tarrant": 439,
+        "Taylor": 441, "Terrell": 443, "Terry": 445, "Throckmorton": 447, "Titus": 449,
+        "Tom Green": 451, "Travis": 453, "Trinity": 455, "Tyler": 457, "Upshur": 459, "Upton": 461,
+        "Uvalde": 463, "Val Verde": 465, "Van Zandt": 467, "Victoria": 469, "Walker": 471,
+        "Waller": 473, "Ward": 475, "Washington": 477, "Webb": 479, "Wharton": 481, "Wheeler": 483,
+        "Wichita": 485, "Wilbarger": 487, "Willacy": 489, "Williamson": 491, "Wilson": 493,
+        "Winkler": 495, "Wise": 497, "Wood": 499, "Yoakum": 501, "Young": 503, "Zapata": 505,
+        "Zavala": 507
+    },
+    "UT": {
+        "Beaver": 1, "Box Elder": 3, "Cache": 5, "Carbon": 7, "Daggett": 9, "Davis": 11,
+        "Duchesne": 13, "Emery": 15, "Garfield": 17, "Grand": 19, "Iron": 21, "Juab": 23,
+        "Kane": 25, "Millard": 27, "Morgan": 29, "Piute": 31, "Rich": 33, "Salt Lake": 35,
+        "San Juan": 37, "Sanpete": 39, "Sevier": 41, "Summit": 43, "Tooele": 45, "Uintah": 47,
+        "Utah": 49, "Wasatch": 51, "Washington": 53, "Wayne": 55, "Weber": 57
+    },
+    "VT": {
+        "Addison": 1, "Bennington": 3, "Caledonia": 5, "Chittenden": 7, "Essex": 9, "Franklin": 11,
+        "Grand Isle": 13, "Lamoille": 15, "Orange": 17, "Orleans": 19, "Rutland": 21,
+        "Washington": 23, "Windham": 25, "Windsor": 27
+    },
+    "VA": {
+        "Accomack": 1, "Albemarle": 3, "Alleghany": 5, "Amelia": 7, "Amherst": 9, "Appomattox": 11,
+        "Arlington": 13, "Augusta": 15, "Bath": 17, "Bedford": 19, "Bland": 21, "Botetourt": 23,
+        "Brunswick": 25, "Buchanan": 27, "Buckingham": 29, "Campbell": 31, "Caroline": 33,
+        "Carroll": 35, "Charles City": 36, "Charlotte": 37, "Chesterfield": 41, "Clarke": 43,
+        "Craig": 45, "Culpeper": 47, "Cumberland": 49, "Dickenson": 51, "Dinwiddie": 53,
+        "Essex": 57, "Fairfax": 59, "Fauquier": 61, "Floyd": 63, "Fluvanna": 65, "Franklin": 67,
+        "Frederick": 69, "Giles": 71, "Gloucester": 73, "Goochland": 75, "Grayson": 77,
+        "Greene": 79, "Greensville": 81, "Halifax": 83, "Hanover": 85, "Henrico": 87, "Henry": 89,
+        "Highland": 91, "Isle of Wight": 93, "James City": 95, "King and Queen": 97,
+        "King George": 99, "King William": 101, "Lancaster": 103, "Lee": 105, "Loudoun": 107,
+        "Louisa": 109, "Lunenburg": 111, "Madison": 113, "Mathews": 115, "Mecklenburg": 117,
+        "Middlesex": 119, "Montgomery": 121, "Nelson": 125, "New Kent": 127, "Northampton": 131,
+        "Northumberland": 133, "Nottoway": 135, "Orange": 137, "Page": 139, "Patrick": 141,
+        "Pittsylvania": 143, "Powhatan": 145, "Prince Edward": 147, "Prince George": 149,
+        "Prince William": 153, "Pulaski": 155, "Rappahannock": 157, "Richmond": 159,
+        "Roanoke": 161, "Rockbridge": 163, "Rockingham": 165, "Russell": 167, "Scott": 169,
+        "Shenandoah": 171, "Smyth": 173, "Southampton": 175, "Spotsylvania": 177, "Stafford": 179,
+        "Surry": 181, "Sussex": 183, "Tazewell": 185, "Warren": 187, "Washington": 191,
+        "Westmoreland": 193, "Wise": 195, "Wythe": 197, "York": 199, "Alexandria City": 510,
+        "Bedford City": 515, "Bristol City": 520, "Buena Vista City": 530,
+        "Charlottesville City": 540, "Chesapeake City": 550, "Colonial Heights City": 570,
+        "Covington City": 580, "Danville City": 590, "Emporia City": 595, "Fairfax City": 600,
+        "Falls Church City": 610, "Franklin City": 620, "Fredericksburg City": 630,
+        "Galax City": 640, "Hampton City": 650, "Harrisonburg City": 660, "Hopewell City": 670,
+        "Lexington City": 678, "Lynchburg City": 680, "Manassas City": 683,
+        "Manassas Park City": 685, "Martinsville City": 690, "Newport News City": 700,
+        "Norfolk City": 710, "Norton City": 720, "Petersburg City": 730, "Poquoson City": 735,
+        "Portsmouth City": 740, "Radford City": 750, "Richmond City": 760, "Roanoke City": 770,
+        "Salem City": 775, "Staunton City": 790, "Suffolk City": 800, "Virginia Beach City": 810,
+        "Waynesboro City": 820, "Williamsburg City": 830, "Winchester City": 840
+    },
+    "WA": {
+        "Adams": 1, "Asotin": 3, "Benton": 5, "Chelan": 7, "Clallam": 9, "Clark": 11,
+        "Columbia": 13, "Cowlitz": 15, "Douglas": 17, "Ferry": 19, "Franklin": 21, "Garfield": 23,
+        "Grant": 25, "Grays Harbor": 27, "Island": 29, "Jefferson": 31, "King": 33, "Kitsap": 35,
+        "Kittitas": 37, "Klickitat": 39, "Lewis": 41, "Lincoln": 43, "Mason": 45, "Okanogan": 47,
+        "Pacific": 49, "Pend Oreille": 51, "Pierce": 53, "San Juan": 55, "Skagit": 57,
+        "Skamania": 59, "Snohomish": 61, "Spokane": 63, "Stevens": 65, "Thurston": 67,
+        "Wahkiakum": 69, "Walla Walla": 71, "Whatcom": 73, "Whitman": 75, "Yakima": 77
+    },
+    "WV": {
+        "Barbour": 1, "Berkeley": 3, "Boone": 5, "Braxton": 7, "Brooke": 9, "Cabell": 11,
+        "Calhoun": 13, "Clay": 15, "Doddridge": 17, "Fayette": 19, "Gilmer": 21, "Grant": 23,
+        "Greenbrier": 25, "Hampshire": 27, "Hancock": 29, "Hardy": 31, "Harrison": 33,
+        "Jackson": 35, "Jefferson": 37, "Kanawha": 39, "Lewis": 41, "Lincoln": 43, "Logan": 45,
+        "McDowell": 47, "Marion": 49, "Marshall": 51, "Mason": 53, "Mercer": 55, "Mineral": 57,
+        "Mingo": 59, "Monongalia": 61, "Monroe": 63, "Morgan": 65, "Nicholas": 67, "Ohio": 69,
+        "Pendleton": 71, "Pleasants": 73, "Pocahontas": 75, "Preston": 77, "Putnam": 79,
+        "Raleigh": 81, "Randolph": 83, "Ritchie": 85, "Roane": 87, "Summers": 89, "Taylor": 91,
+        "Tucker": 93, "Tyler": 95, "Upshur": 97, "Wayne": 99, "Webster": 101, "Wetzel": 103,
+        "Wirt": 105, "Wood": 107, "Wyoming": 109
+    },
+    "WI": {
+        "Adams": 1, "Ashland": 3, "Barron": 5, "Bayfield": 7, "Brown": 9, "Buffalo": 11,
+        "Burnett": 13, "Calumet": 15, "Chippewa": 17, "Clark": 19, "Columbia": 21, "Crawford": 23,
+        "Dane": 25, "Dodge": 27, "Door": 29, "Douglas": 31, "Dunn": 33, "Eau Claire": 35,
+        "Florence": 37, "Fond du Lac": 39, "Forest": 41, "Grant": 43, "Green": 45,
+        "Green Lake": 47, "Iowa": 49, "Iron": 51, "Jackson": 53, "Jefferson": 55, "Juneau": 57,
+        "Kenosha": 59, "Kewaunee": 61, "La Crosse": 63, "Lafayette": 65, "Langlade": 67,
+        "Lincoln": 69, "Manitowoc": 71, "Marathon": 73, "Marinette": 75, "Marquette": 77,
+        "Menominee": 78, "Milwaukee": 79, "Monroe": 81, "Oconto": 83, "Oneida": 85,
+        "Outagamie": 87, "Ozaukee": 89, "Pepin": 91, "Pierce": 93, "Polk": 95, "Portage": 97,
+        "Price": 99, "Racine": 101, "Richland": 103, "Rock": 105, "Rusk": 107, "St. Croix": 109,
+        "Sauk": 111, "Sawyer": 113, "Shawano": 115, "Sheboygan": 117, "Taylor": 119,
+        "Trempealeau": 121, "Vernon": 123, "Vilas": 125, "Walworth": 127, "Washburn": 129,
+        "Washington": 131, "Waukesha": 133, "Waupaca": 135, "Waushara": 137, "Winnebago": 139,
+        "Wood": 141
+    },
+    "WY": {
+        "Albany": 1, "Big Horn": 3, "Campbell": 5, "Carbon": 7, "Converse": 9, "Crook": 11,
+        "Fremont": 13, "Goshen": 15, "Hot Springs": 17, "Johnson": 19, "Laramie": 21,
+        "Lincoln": 23, "Natrona": 25, "Niobrara": 27, "Park": 29, "Platte": 31, "Sheridan": 33,
+        "Sublette": 35, "Sweetwater": 37, "Teton": 39, "Uinta": 41, "Washakie": 43, "Weston": 45
+    },
+    "AS": {
+        "Eastern District": 10, "Manu'a District": 20, "Rose Atoll District": 30,
+        "Rose Island District": 30, "Swains Island District": 40, "Western District": 50
+    },
+    "GU": {
+        "Guam": 10
+    },
+    "MP": {
+        "Northern Islands": 85, "Rota": 100, "Saipan": 110, "Tinian": 120
+    },
+    "PR": {
+        "Adjuntas": 1, "Aguada": 3, "Aguadilla": 5, "Aguas Buenas": 7, "Aibonito": 9, "Añasco": 11,
+        "Arecibo": 13, "Arroyo": 15, "Barceloneta": 17, "Barranquitas": 19, "Bayamon": 21,
+        "Cabo Rojo": 23, "Caguas": 25, "Camuy": 27, "Canovanas": 29, "Carolina": 31, "Cataño": 33,
+        "Cayey": 35, "Ceiba": 37, "Ciales": 39, "Cidra": 41, "Coamo": 43, "Comerío": 45,
+        "Corozal": 47, "Culebra": 49, "Dorado": 51, "Fajardo": 53, "Florida": 54, "Guánica": 55,
+        "Guayama": 57, "Guayanilla": 59, "Guaynabo": 61, "Gurabo": 63, "Hatillo": 65,
+        "Hormigueros": 67, "Humacao": 69, "Isabela": 71, "Jayuya": 73, "Juana Díaz": 75,
+        "Juncos": 77, "Lajas": 79, "Lares": 81, "Las Marías": 83, "Las Piedras": 85, "Loíza": 87,
+        "Luquillo": 89, "Manatí": 91, "Maricao": 93, "Maunabo": 95, "Mayagüez": 97, "Moca": 99,
+        "Morovis": 101, "Naguabo": 103, "Naranjito": 105, "Orocovis": 107, "Patillas": 109,
+        "Peñuelas": 111, "Ponce": 113, "Quebradillas": 115, "Rincon": 117, "Río Grande": 119,
+        "Sabana Grande": 121, "Salinas": 123, "San Germán": 125, "San Juan": 127,
+        "San Lorenzo": 129, "San Sebastián": 131, "Santa Isabel": 133, "Toa Alta": 135,
+        "Toa Baja": 137, "Trujillo Alto": 139, "Utuado": 141, "Vega Alta": 143, "Vega Baja": 145,
+        "Vieques": 147, "Villalba": 149, "Yabucoa": 151, "Yauco": 153
+    },
+    "VI": {
+        "St. Croix Island District": 10, "St. John Island District": 20,
+        "St. Thomas Island District": 30
+    }
+}
@@ -1,12 +1,28 @@
-import discord
-import aiohttp
+import asyncio
 import datetime
+import time
+
+from http_client import get_session
+from discord_dispatcher import PRIORITY_FORECAST
+from message_cache import edit_or_post, FORECAST
+from metrics import timed_job
 
 # --- CONFIGURATION ---
-from config import FORECAST_CHANNEL_ID, FORECAST_MESSAGE_ID
+from config import FORECAST_CHANNEL_ID, GUILD_ID
 from location_manager import get_lat_lon, get_city_state
+from server_config_manager import get_server_config
+
+OPEN_METEO_URL = "https://api.open-meteo.com/v1/forecast"
 
 FORECAST_DAYS = 7
+FORECAST_CELL_DEGREES = 0.1   # Guilds within the same ~11 km cell share a forecast
+FORECAST_CACHE_TTL = 3600     # Open-Meteo refreshes its models hourly
+FORECAST_BATCH_SIZE = 50      # Locations per multi-coordinate Open-Meteo request
+FORECAST_BATCH_ATTEMPTS = 2   # A failed batch is retried once, never split into per-cell requests
+FORECAST_RETRY_DELAY = 5      # Seconds before retrying a failed batch (e.g. after a 429)
+
+_forecast_cache = {}  # Cell -> (fetched_at, forecast data with daily + current_weather)
+_inflight = {}        # Cell -> future resolved when that cell's batch arrives
 
 # --- Emoji icons based on weather codes ---
 WEATHER_EMOJIS = {
@@ -50,35 +66,128 @@ def c_to_f(celsius):
 def ms_to_mph(ms):
     return round(ms * 2.23694)
 
-async def fetch_forecast(guild_id):
-    lat, lon = get_lat_lon(guild_id)
+async def fetch_forecasts(coords, session=None):
+    """Fetch daily and current weather for many (lat, lon) pairs in one request."""
     url = (
-        f"https://api.open-meteo.com/v1/forecast?"
-        f"latitude={lat}&longitude={lon}&"
+        f"{OPEN_METEO_URL}?"
+        f"latitude={','.join(str(lat) for lat, _ in coords)}&"
+        f"longitude={','.join(str(lon) for _, lon in coords)}&"
         f"daily=weathercode,temperature_2m_max,temperature_2m_min,"
         f"precipitation_probability_max,dewpoint_2m_min,windgusts_10m_max&"
-        f"timezone=America/Chicago"
-    )
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url) as resp:
-            return await resp.json()
-
-async def fetch_current_conditions(guild_id):
-    lat, lon = get_lat_lon(guild_id)
-    url = (
-        f"https://api.open-meteo.com/v1/forecast?"
-        f"latitude={lat}&longitude={lon}&"
         f"current_weather=true&timezone=America/Chicago"
     )
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url) as resp:
-            return await resp.json()
+    session = session or get_session()
+    async with session.get(url) as resp:
+        data = await resp.json()
+
+    # Open-Meteo returns a bare object for one location and a list for several
+    if isinstance(data, dict):
+        if data.get("error"):
+            raise RuntimeError(f"Open-Meteo error: {data.get('reason')}")
+        data = [data]
+    if len(data) != len(coords):
+        raise RuntimeError(f"Open-Meteo returned {len(data)} results for {len(coords)} locations")
+    return data
+
+def forecast_cell(lat, lon):
+    """Round a location to its forecast grid cell."""
+    return round(lat / FORECAST_CELL_DEGREES), round(lon / FORECAST_CELL_DEGREES)
+
+def cell_center(cell):
+    return round(cell[0] * FORECAST_CELL_DEGREES, 4), round(cell[1] * FORECAST_CELL_DEGREES, 4)
+
+async def _fetch_batch(cells):
+    """Fetch one chunk of cells and resolve their in-flight futures."""
+    for attempt in range(1, FORECAST_BATCH_ATTEMPTS + 1):
+        try:
+            results = await fetch_forecasts([cell_center(cell) for cell in cells])
+            break
+        except Exception as e:
+            print(f"⚠️ Forecast batch of {len(cells)} cell(s) failed (attempt {attempt}/{FORECAST_BATCH_ATTEMPTS}): {e}")
+            if attempt == FORECAST_BATCH_ATTEMPTS:
+                for cell in cells:
+                    future = _inflight.pop(cell)
+                    future.set_exception(e)
+                    future.exception()  # Mark it retrieved; anyone awaiting it still gets the error
+                return
+            await asyncio.sleep(FORECAST_RETRY_DELAY)
+
+    now = time.monotonic()
+    for cell, data in zip(cells, results):
+        if "daily" in data and "current_weather" in data:
+            _forecast_cache[cell] = (now, data)
+        _inflight.pop(cell).set_result(data)
+
+async def get_cell_forecasts(cells):
+    """Return cell -> forecast data, fetching uncached cells in chunked batches.
+
+    Results are cached per cell for FORECAST_CACHE_TTL, and a cell that is
+    already being fetched is awaited instead of requested again. Cells whose
+    batch failed are left out of the result.
+    """
+    now = time.monotonic()
+    cells = set(cells)
+    missing = [
+        cell for cell in cells
+        if cell not in _inflight
+        and (cell not in _forecast_cache or now - _forecast_cache[cell][0] >= FORECAST_CACHE_TTL)
+    ]
+
+    loop = asyncio.get_running_loop()
+    for start in range(0, len(missing), FORECAST_BATCH_SIZE):
+        chunk = missing[start:start + FORECAST_BATCH_SIZE]
+        for cell in chunk:
+            _inflight[cell] = loop.create_future()
+        asyncio.ensure_future(_fetch_batch(chunk))
+
+    # Take the futures now: a batch pops its cells from _inflight once it finishes
+    pending = {cell: _inflight[cell] for cell in cells if cell in _inflight}
+    results = {cell: _forecast_cache[cell][1] for cell in cells if cell not in pending}
+    for cell, future in pending.items():
+        try:
+            results[cell] = await asyncio.shield(future)
+        except Exception:
+            pass  # Already logged by _fetch_batch
+    return results
+
+async def get_cell_forecast(lat, lon):
+    """Return the (possibly cached) forecast data for a location's cell, or None if it couldn't be fetched."""
+    cell = forecast_cell(lat, lon)
+    return (await get_cell_forecasts([cell])).get(cell)
+
+def get_forecast_channel_id(guild_id):
+    """Return the guild's forecast channel, falling back to config.py for the home guild."""
+    channel_id = get_server_config(guild_id).get("forecast_channel")
+    if channel_id is None and guild_id == GUILD_ID:
+        return FORECAST_CHANNEL_ID
+    return channel_id
+
+@timed_job("post_forecasts")
+async def post_forecasts(bot):
+    """Post or update the forecast for every guild with a forecast channel."""
+    guild_ids = [guild.id for guild in bot.guilds if get_forecast_channel_id(guild.id) is not None]
+
+    # Fetch every distinct cell in a few batched requests; guilds whose batch failed are skipped
+    cells = {guild_id: forecast_cell(*get_lat_lon(guild_id)) for guild_id in guild_ids}
+    forecasts = await get_cell_forecasts(cells.values())
+    ready = [guild_id for guild_id in guild_ids if cells[guild_id] in forecasts]
+    if len(ready) < len(guild_ids):
+        print(f"⚠️ Skipping forecasts for {len(guild_ids) - len(ready)} guild(s) whose batch failed.")
+
+    results = await asyncio.gather(
+        *(post_forecast(bot, guild_id, forecasts[cells[guild_id]]) for guild_id in ready), return_exceptions=True
+    )
+    for error in results:
+        if isinstance(error, Exception):
+            print(f"❌ Failed to post forecast for a guild: {error}")
+    print(f"🌤️ Forecast run finished for {len(ready)} guild(s) across {len(_forecast_cache)} cached cell(s).")
 
-async def post_forecast(bot, guild_id):
-    forecast_data = await fetch_forecast(guild_id)
-    current_data = await fetch_current_conditions(guild_id)
+@timed_job("post_forecast")
+async def post_forecast(bot, guild_id, forecast_data=None):
+    if forecast_data is None:
+        forecast_data = await get_cell_forecast(*get_lat_lon(guild_id))
 
-    if "daily" not in forecast_data or "current_weather" not in current_data:
+    if forecast_data is None or "daily" not in forecast_data or "current_weather" not in forecast_data:
         print("⚠️ Failed to fetch forecast or current weather data")
         return
 
@@ -90,7 +199,7 @@ async def post_forecast(bot, guild_id):
     dews_c = forecast_data["daily"]["dewpoint_2m_min"]
     gusts = forecast_data["daily"].get("windgusts_10m_max", [None] * FORECAST_DAYS)
 
-    current = current_data["current_weather"]
+    current = forecast_data["current_weather"]
     temp_f = c_to_f(current["temperature"])
     wind_mph = ms_to_mph(current["windspeed"])
     wind_dir = current["winddirection"]
@@ -128,17 +237,13 @@ async def post_forecast(bot, guild_id):
 
     forecast_text = "\n".join(lines)
 
-    channel = bot.get_channel(FORECAST_CHANNEL_ID)
+    channel = bot.get_channel(get_forecast_channel_id(guild_id))
     if not channel:
         print("⚠️ Forecast channel not found!")
         return
 
     try:
-        forecast_message = await channel.fetch_message(FORECAST_MESSAGE_ID)
-        await forecast_message.edit(content=forecast_text)
+        await edit_or_post(channel, guild_id, FORECAST, PRIORITY_FORECAST, content=forecast_text)
         print("✅ Forecast message updated successfully.")
-    except discord.NotFound:
-        new_message = await channel.send(forecast_text)
-        print("✅ Forecast message posted successfully (new message).")
     except Exception as e:
         print(f"❌ Failed to update forecast message: {e}")
@@ -1,10 +1,13 @@
 import discord
-import aiohttp
+import asyncio
 import datetime
 import re
 
-# --- CONFIGURATION ---
-from config import FORECAST_CHANNEL_ID
+from http_client import fetch_if_modified
+from daily_forecast import get_forecast_channel_id
+from discord_dispatcher import dispatcher, PRIORITY_FORECAST
+from metrics import timed_job
+from sharding import fetch_shared
 
 SPC_DAY1_IMAGE_URL = "https://www.spc.noaa.gov/products/outlook/day1otlk.png"
 SPC_DAY2_IMAGE_URL = "https://www.spc.noaa.gov/products/outlook/day2otlk.png"
@@ -12,44 +15,109 @@ SPC_DAY2_IMAGE_URL = "https://www.spc.noaa.gov/products/outlook/day2otlk.png"
 SPC_TEXT_URL_DAY1 = "https://www.spc.noaa.gov/products/outlook/day1otlk.txt"
 SPC_TEXT_URL_DAY2 = "https://www.spc.noaa.gov/products/outlook/day2otlk.txt"
 
-async def fetch_outlook_summary(url, label=""):
-    """Fetch the SPC summary paragraph following the ...SUMMARY... tag."""
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url) as resp:
-            text = await resp.text()
-
-    lines = text.splitlines()
-    summary_lines = []
-    capturing = False
-
-    for line in lines:
-        stripped = line.strip()
-        if stripped.upper().startswith("...SUMMARY..."):
-            capturing = True
-            continue
-        if capturing:
-            if stripped == "":
-                break  # End of paragraph
-            summary_lines.append(stripped)
-
-    if summary_lines:
-        summary = " ".join(summary_lines).strip()
+# Scheduled SPC issuance times (UTC hour, minute). Day 2's overnight issuance is
+# 0600Z during daylight time and 0700Z during standard time.
+SPC_ISSUANCE_TIMES = {
+    "Day 1": [(1, 0), (6, 0), (13, 0), (16, 30), (20, 0)],
+    "Day 2": [(6, 0), (7, 0), (17, 30)]
+}
+ISSUANCE_GRACE = datetime.timedelta(minutes=45)  # Products can post late after their slot
+LATE_RETRY = datetime.timedelta(minutes=5)       # Re-check interval while waiting on a late product
+SHARED_OUTLOOK_TTL = 300                         # Seconds one worker's fetch serves every worker
+
+# Categorical risks, lowest to highest
+RISK_LEVELS = ["NONE", "MARGINAL", "SLIGHT", "ENHANCED", "MODERATE", "HIGH"]
+
+ISSUANCE_PATTERN = re.compile(r"^(\d{3,4} [AP]M [A-Z]{3,4} \w{3} \w{3} \d{1,2} \d{4})\s*$", re.MULTILINE)
+SUMMARY_PATTERN = re.compile(r"^\s*\.\.\.SUMMARY\.\.\.\s*\n(.*?)(?:\n\s*\n|\Z)", re.MULTILINE | re.DOTALL | re.IGNORECASE)
+RISK_PATTERN = re.compile(r"\.\.\.THERE IS AN? (MARGINAL|SLIGHT|ENHANCED|MODERATE|HIGH) RISK", re.IGNORECASE)
+
+# Label -> {"issued", "summary", "risk", "valid_until"}
+_outlooks = {}
+_embed_cache = {"key": None, "embed": None}
+
+def extract_summary(text, label=""):
+    """Return the SPC summary paragraph following the ...SUMMARY... tag."""
+    match = SUMMARY_PATTERN.search(text)
+    if match:
+        summary = " ".join(line.strip() for line in match.group(1).splitlines()).strip()
         print(f"✅ Extracted {label} summary: {summary}")
         return summary
 
     print(f"❌ No summary found for {label}.")
     return f"⚠️ No summary found for {label}."
 
+def extract_risk(text):
+    """Return the highest categorical risk mentioned in the outlook text."""
+    risks = [m.upper() for m in RISK_PATTERN.findall(text)]
+    return max(risks, key=RISK_LEVELS.index) if risks else "NONE"
+
+def next_check_time(label, now, issued_changed):
+    """Return when the cached outlook should next be checked against spc.noaa.gov."""
+    slots = []
+    for day_offset in (-1, 0, 1):
+        day = now.date() + datetime.timedelta(days=day_offset)
+        for hour, minute in SPC_ISSUANCE_TIMES[label]:
+            slots.append(datetime.datetime.combine(day, datetime.time(hour, minute)))
 
-async def post_spc_outlook(bot):
-    today_summary = await fetch_outlook_summary(SPC_TEXT_URL_DAY1, label="Day 1")
-    tomorrow_summary = await fetch_outlook_summary(SPC_TEXT_URL_DAY2, label="Day 2")
+    last_slot = max(slot for slot in slots if slot <= now)
+    next_slot = min(slot for slot in slots if slot > now)
+
+    # Still waiting on a product that's due — check again shortly
+    if not issued_changed and now - last_slot < ISSUANCE_GRACE:
+        return min(now + LATE_RETRY, next_slot)
+    return next_slot
+
+async def fetch_outlook(url, label=""):
+    """Return the cached outlook for its issuance, refreshing it only when a new one is due."""
+    now = datetime.datetime.utcnow()
+    cached = _outlooks.get(label)
+    if cached is not None and now < cached["valid_until"]:
+        return cached
+
+    def parse_text(text):
+        match = ISSUANCE_PATTERN.search(text)
+        issued = match.group(1) if match else None
+        if cached is not None and issued is not None and issued == cached["issued"]:
+            return cached  # Same issuance re-served — keep the parsed product
+        return {"issued": issued, "summary": extract_summary(text, label), "risk": extract_risk(text)}
+
+    async def parse(resp):
+        return parse_text(await resp.text())
+
+    outlook, _ = await fetch_shared(
+        f"spc:{url}", lambda: fetch_if_modified(url, parse), SHARED_OUTLOOK_TTL,
+        encode=lambda product: {key: product[key] for key in ("issued", "summary", "risk")}
+    )
+    issued_changed = cached is None or outlook["issued"] != cached["issued"]
+    if not issued_changed:
+        print(f"🟰 {label} outlook unchanged — reusing cached product.")
+
+    outlook = dict(outlook, valid_until=next_check_time(label, now, issued_changed))
+    _outlooks[label] = outlook
+    return outlook
+
+def get_current_risk():
+    """Return the highest categorical risk in the cached Day 1 outlook."""
+    outlook = _outlooks.get("Day 1")
+    return outlook["risk"] if outlook else "NONE"
+
+async def build_outlook_embed():
+    """Fetch Day 1 and Day 2 concurrently and build the embed once per issuance pair."""
+    today, tomorrow = await asyncio.gather(
+        fetch_outlook(SPC_TEXT_URL_DAY1, label="Day 1"),
+        fetch_outlook(SPC_TEXT_URL_DAY2, label="Day 2")
+    )
+
+    key = (today["issued"], today["summary"], tomorrow["issued"], tomorrow["summary"])
+    if _embed_cache["key"] == key:
+        return _embed_cache["embed"]
 
     embed = discord.Embed(
         title="🌩️ SPC Severe Weather Outlook",
         description=(
-            f"**Today:** {today_summary}\n"
-            f"**Tomorrow:** {tomorrow_summary}"
+            f"**Today:** {today['summary']}\n"
+            f"**Tomorrow:** {tomorrow['summary']}"
         ),
         timestamp=datetime.datetime.utcnow(),
         color=0xFF9900
@@ -62,7 +130,22 @@ async def post_spc_outlook(bot):
         inline=False
     )
 
-    channel = bot.get_channel(FORECAST_CHANNEL_ID)
-    if channel:
-        await channel.send(embed=embed)
-        print("✅ SPC Outlook posted.")
+    _embed_cache["key"] = key
+    _embed_cache["embed"] = embed
+    return embed
+
+@timed_job("post_spc_outlook")
+async def post_spc_outlook(bot, guild_ids=None):
+    """Broadcast the SPC outlook to every guild's forecast channel (or just `guild_ids`)."""
+    embed = await build_outlook_embed()
+
+    if guild_ids is None:
+        guild_ids = [guild.id for guild in bot.guilds]
+    channels = [bot.get_channel(get_forecast_channel_id(guild_id)) for guild_id in guild_ids]
+    channels = [channel for channel in channels if channel]
+
+    results = await asyncio.gather(*(dispatcher.send(channel, PRIORITY_FORECAST, embed=embed) for channel in channels), return_exceptions=True)
+    failures = [r for r in results if isinstance(r, Exception)]
+    for error in failures:
+        print(f"❌ Failed to post SPC outlook: {error}")
+    print(f"✅ SPC Outlook posted to {len(channels) - len(failures)} channel(s).")
@@ -0,0 +1,215 @@
+import asyncio
+import collections
+import itertools
+import time
+
+from metrics import observe, timed
+from sharding import WORKER_COUNT
+
+# --- PRIORITY CLASSES (lower goes first) ---
+PRIORITY_WARNING = 0   # Tornado / severe thunderstorm warnings
+PRIORITY_ALERT = 1     # Every other alert
+PRIORITY_STATUS = 2    # Alert status/timestamp messages, heartbeats, welcomes
+PRIORITY_FORECAST = 3  # Daily forecasts and SPC outlooks
+PRIORITY_RADAR = 4     # Radar embed edits
+
+# --- RATE LIMITS ---
+# Conservative copies of Discord's limits so discord.py never has to back off on a 429
+ROUTE_LIMIT = (5, 5.5)     # Requests per channel route per window (Discord allows 5 per 5 s; +0.5 s for jitter)
+GLOBAL_LIMIT = (45, 1.0)   # Requests per second across the bot (Discord allows 50)
+WORKERS = 4                # Requests in flight at once
+STOP_TIMEOUT = 10          # Seconds stop() waits for requests already sent to Discord
+
+def worker_global_limit(worker_count=WORKER_COUNT):
+    """This process's share of GLOBAL_LIMIT, since Discord counts every worker against one bot-wide limit."""
+    limit, period = GLOBAL_LIMIT
+    return max(1, limit // worker_count), period
+
+class SlidingWindow:
+    """Allows at most `limit` requests in any `period`-second span.
+
+    Unlike a token bucket, which can burst its capacity and then keep
+    refilling within the same window, this never exceeds the limit
+    however Discord's own windows happen to line up with ours.
+    """
+
+    def __init__(self, limit, period):
+        self.limit = limit
+        self.period = period
+        self._sent = collections.deque()  # Start times of the last `limit` requests
+
+    def delay(self, now):
+        """Seconds until another request may start (0 if one may start now)."""
+        while self._sent and now - self._sent[0] >= self.period:
+            self._sent.popleft()
+        if len(self._sent) < self.limit:
+            return 0.0
+        return self._sent[0] + self.period - now
+
+    def take(self, now):
+        self._sent.append(now)
+
+class _Job:
+    __slots__ = ("route", "action", "target", "kwargs", "future", "started", "edit_key", "enqueued")
+
+    def __init__(self, route, action, target, kwargs, future, edit_key=None):
+        self.route = route
+        self.action = action
+        self.target = target
+        self.kwargs = kwargs
+        self.future = future
+        self.started = False
+        self.edit_key = edit_key
+        self.enqueued = time.monotonic()
+
+class Dispatcher:
+    """Single outbound queue for Discord sends, edits and deletes.
+
+    Jobs run in priority order, pending edits to the same message are
+    coalesced into one request, and per-route plus global sliding windows
+    keep the bot under Discord's rate limits.
+    """
+
+    def __init__(self, workers=WORKERS):
+        self.worker_count = workers
+        self._loop = None
+        self._queue = None
+        self._workers = []
+        self._sequence = itertools.count()
+        self._pending_edits = {}  # (channel ID, message ID) -> queued edit job
+        self._buckets = {}        # Route -> SlidingWindow
+        self._in_flight = 0       # Requests sent to Discord and not yet answered
+        self._stopping = False
+        self.route_limit = ROUTE_LIMIT
+        self._global = SlidingWindow(*worker_global_limit())
+
+    def set_limits(self, route_limit=ROUTE_LIMIT, global_limit=None):
+        """Change the rate limits (benchmarks and simulations lift them)."""
+        global_limit = global_limit or worker_global_limit()
+        self.route_limit = route_limit
+        self._buckets.clear()
+        self._global = SlidingWindow(*global_limit)
+
+    def _ensure_started(self):
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            # First use, or the bot was restarted on a new event loop
+            self._loop = loop
+            self._queue = asyncio.PriorityQueue()
+            self._workers = []
+            self._pending_edits.clear()
+        self._workers = [w for w in self._workers if not w.done()]
+        while len(self._workers) < self.worker_count:
+            self._workers.append(asyncio.ensure_future(self._worker()))
+
+    def queue_depth(self):
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def _submit(self, priority, job):
+        self._ensure_started()
+        self._queue.put_nowait((priority, next(self._sequence), job))
+        return job.future
+
+    def send(self, channel, priority, **kwargs):
+        """Queue channel.send(**kwargs); returns a future for the sent message."""
+        future = asyncio.get_running_loop().create_future()
+        return self._submit(priority, _Job(("send", channel.id), "send", channel, kwargs, future))
+
+    def edit(self, message, priority, **kwargs):
+        """Queue message.edit(**kwargs), merging it into any pending edit of the same message."""
+        key = (message.channel.id, message.id)
+        pending = self._pending_edits.get(key)
+        if pending is not None and not pending.started:
+            pending.kwargs.update(kwargs)
+            # Re-queue at the new priority if it's more urgent; the stale entry is skipped
+            self._submit(priority, pending)
+            return pending.future
+
+        future = asyncio.get_running_loop().create_future()
+        job = _Job(("edit", message.channel.id), "edit", message, dict(kwargs), future, edit_key=key)
+        self._pending_edits[key] = job
+        return self._submit(priority, job)
+
+    def delete(self, message, priority):
+        """Queue message.delete()."""
+        future = asyncio.get_running_loop().create_future()
+        return self._submit(priority, _Job(("delete", message.channel.id), "delete", message, {}, future))
+
+    def _requeue_later(self, delay, priority, job):
+        def requeue():
+            if self._queue is not None:
+                self._queue.put_nowait((priority, next(self._sequence), job))
+        asyncio.get_running_loop().call_later(delay, requeue)
+
+    async def _worker(self):
+        while True:
+            priority, _, job = await self._queue.get()
+            if job.started or job.future.done():
+                continue  # Coalesced duplicate or cancelled by the caller
+
+            bucket = self._buckets.get(job.route)
+            if bucket is None:
+                bucket = self._buckets[job.route] = SlidingWindow(*self.route_limit)
+
+            # Other workers may take slots while this one sleeps, so check both windows again after waking
+            while True:
+                now = time.monotonic()
+                route_delay = bucket.delay(now)
+                global_delay = self._global.delay(now)
+                if route_delay > 0 or global_delay <= 0:
+                    break
+                await asyncio.sleep(global_delay)
+            if job.started or job.future.done():
+                continue  # A re-queued copy of this coalesced edit ran while this worker slept
+            if route_delay > 0:
+                # Park this job without blocking other routes
+                self._requeue_later(route_delay, priority, job)
+                continue
+            if self._stopping:
+                return  # Never start a request during shutdown; its caller could not record the result
+
+            bucket.take(now)
+            self._global.take(now)
+            job.started = True
+            observe("radarbot_discord_queue_seconds", now - job.enqueued, action=job.action)
+            if job.edit_key is not None and self._pending_edits.get(job.edit_key) is job:
+                del self._pending_edits[job.edit_key]
+
+            self._in_flight += 1
+            try:
+                with timed("radarbot_discord_call_seconds", "radarbot_discord_errors_total", action=job.action):
+                    result = await getattr(job.target, job.action)(**job.kwargs)
+            except Exception as e:
+                if not job.future.done():
+                    job.future.set_exception(e)
+            else:
+                if not job.future.done():
+                    job.future.set_result(result)
+            finally:
+                self._in_flight -= 1
+
+    async def stop(self, timeout=STOP_TIMEOUT):
+        """Stop the workers, first letting requests already sent to Discord finish.
+
+        Their callers then get the results and can save the message IDs;
+        queued jobs that never started are dropped, since nothing was sent.
+        """
+        self._stopping = True
+        deadline = time.monotonic() + timeout
+        while self._in_flight and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        self._stopping = False
+
+dispatcher = Dispatcher()
+
+def alert_priority(alert):
+    """Tornado and severe thunderstorm warnings jump ahead of everything else."""
+    event = (alert.event or alert.title).lower()
+    if event.startswith(("tornado warning", "severe thunderstorm warning", "tornado emergency")):
+        return PRIORITY_WARNING
+    return PRIORITY_ALERT
@@ -0,0 +1,114 @@
+import aiohttp
+import email.utils
+import time
+
+from metrics import upstream_trace_config
+
+# --- CONNECTION POOL SETTINGS ---
+TOTAL_CONNECTIONS = 64
+CONNECTIONS_PER_HOST = 8   # api.weather.gov, open-meteo, spc.noaa.gov, radar.weather.gov
+DNS_CACHE_TTL = 300        # seconds
+KEEPALIVE_TIMEOUT = 75     # seconds an idle connection is kept warm
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10, sock_read=20)
+
+# api.weather.gov rejects requests without an identifying User-Agent
+USER_AGENT = "Radarbot (https://github.com/tleavelle/radarbot)"
+
+_session = None  # Shared session, created lazily inside the running event loop
+
+def get_session():
+    """Return the process-wide HTTP session, creating it on first use."""
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=TOTAL_CONNECTIONS,
+            limit_per_host=CONNECTIONS_PER_HOST,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            keepalive_timeout=KEEPALIVE_TIMEOUT
+        )
+        _session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=REQUEST_TIMEOUT,
+            headers={"User-Agent": USER_AGENT},
+            trace_configs=[upstream_trace_config()]
+        )
+    return _session
+
+async def close_session():
+    """Close the shared HTTP session and its pooled connections."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+        print("🔌 HTTP session closed.")
+    _session = None
+
+# --- CONDITIONAL GET CACHE ---
+# url -> {"etag": ..., "last_modified": ..., "fresh_until": ..., "result": ...}
+_conditional_cache = {}
+
+def freshness_lifetime(headers):
+    """Seconds a response may be reused without revalidation, per Cache-Control/Expires."""
+    directives = [d.strip().lower() for d in headers.get("Cache-Control", "").split(",")]
+    if "no-cache" in directives or "no-store" in directives:
+        return 0
+    for directive in directives:
+        if directive.startswith("max-age="):
+            try:
+                age = int(headers.get("Age", 0))
+                return max(0, int(directive[len("max-age="):]) - age)
+            except ValueError:
+                return 0
+
+    expires = headers.get("Expires")
+    if expires:
+        try:
+            expires_at = email.utils.parsedate_to_datetime(expires)
+            date = email.utils.parsedate_to_datetime(headers["Date"]) if "Date" in headers else None
+        except (TypeError, ValueError):
+            return 0  # Invalid dates such as "0" mean already expired
+        if date is None:
+            return max(0, expires_at.timestamp() - time.time())
+        return max(0, (expires_at - date).total_seconds())
+    return 0
+
+def seconds_until_stale(url):
+    """Seconds until the cached response for `url` needs revalidating (0 if it already does)."""
+    cached = _conditional_cache.get(url)
+    if cached is None:
+        return 0
+    return max(0, cached["fresh_until"] - time.monotonic())
+
+async def fetch_if_modified(url, parse, session=None):
+    """Conditional GET returning (result, changed).
+
+    `parse` turns a 200 response into a result; on 304 Not Modified the
+    previous result is reused without reading or parsing the body. While
+    the upstream's Cache-Control/Expires says the last response is still
+    fresh, no request is made at all.
+    """
+    session = session or get_session()
+    cached = _conditional_cache.get(url)
+    if cached is not None and time.monotonic() < cached["fresh_until"]:
+        return cached["result"], False
+
+    headers = {}
+    if cached is not None:
+        if cached["etag"]:
+            headers["If-None-Match"] = cached["etag"]
+        if cached["last_modified"]:
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    async with session.get(url, headers=headers) as resp:
+        if resp.status == 304 and cached is not None:
+            cached["fresh_until"] = time.monotonic() + freshness_lifetime(resp.headers)
+            return cached["result"], False
+
+        resp.raise_for_status()
+        result = await parse(resp)
+        _conditional_cache[url] = {
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+            "fresh_until": time.monotonic() + freshness_lifetime(resp.headers),
+            "result": result
+        }
+        return result, True
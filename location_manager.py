@@ -1,7 +1,7 @@
-import json
-import os
+import storage
 
-LOCATION_FILE = "locations.json"
+LOCATION_FILE = "locations.json"  # Legacy file, imported into the database once
+LOCATION_FIELDS = ("lat", "lon", "city", "state", "station_id")
 
 # Default fallback location if none set yet
 default_location = {
@@ -12,51 +12,81 @@ default_location = {
     "station_id": "KSJT"
 }
 
+_cache = {}  # Guild ID -> saved location (or None), mirrors the locations table
+_imported = False
+
+def _ensure_imported():
+    global _imported
+    if not _imported:
+        storage.import_json_once("locations", LOCATION_FILE, _upsert_location)
+        _imported = True
+
+def _upsert_location(guild_id, location):
+    storage.upsert("locations", guild_id, {k: location[k] for k in LOCATION_FIELDS if k in location})
+
+def _row_to_location(row):
+    return {k: row[k] for k in LOCATION_FIELDS if row[k] is not None}
+
+def _cached_location(guild_id):
+    guild_id = int(guild_id)
+    if guild_id not in _cache:
+        _ensure_imported()
+        row = storage.fetch_row("locations", guild_id)
+        _cache[guild_id] = _row_to_location(row) if row is not None else None
+    return _cache[guild_id]
+
 def load_all_locations():
-    """Load all saved locations from file."""
-    if not os.path.exists(LOCATION_FILE):
-        return {}
-    try:
-        with open(LOCATION_FILE, "r") as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"⚠️ Failed to load location file: {e}")
-        return {}
+    """Load all saved locations, keyed by guild ID string."""
+    _ensure_imported()
+    locations = {}
+    for guild_id, row in storage.fetch_all("locations").items():
+        _cache[guild_id] = _row_to_location(row)
+        locations[str(guild_id)] = dict(_cache[guild_id])
+    return locations
 
 def save_all_locations(locations):
-    """Save all locations to file."""
-    try:
-        with open(LOCATION_FILE, "w") as f:
-            json.dump(locations, f, indent=4)
-        print("✅ Locations saved successfully.")
-    except Exception as e:
-        print(f"❌ Failed to save locations: {e}")
+    """Save many locations at once."""
+    for guild_id, location in locations.items():
+        _upsert_location(int(guild_id), location)
+        _cache.pop(int(guild_id), None)
+    print("✅ Locations saved successfully.")
 
 def load_location(guild_id):
     """Load the location for a specific guild."""
-    locations = load_all_locations()
-    return locations.get(str(guild_id), default_location.copy())
+    location = _cached_location(guild_id)
+    return dict(location) if location is not None else default_location.copy()
+
+def has_saved_location(guild_id):
+    """True if the guild has a location of its own rather than the default."""
+    return _cached_location(guild_id) is not None
 
 def save_location(guild_id, lat=None, lon=None, city=None, state=None, station_id=None):
     """Save location or station override for a specific guild."""
-    locations = load_all_locations()
-    location = locations.get(str(guild_id), default_location.copy())
+    guild_id = int(guild_id)
+    changes = {}
 
     if lat is not None and lon is not None:
-        location["lat"] = float(lat)
-        location["lon"] = float(lon)
+        changes["lat"] = float(lat)
+        changes["lon"] = float(lon)
 
     if city is not None:
-        location["city"] = city
+        changes["city"] = city
 
     if state is not None:
-        location["state"] = state
+        changes["state"] = state
 
     if station_id is not None:
-        location["station_id"] = station_id.upper()
+        changes["station_id"] = station_id.upper()
+
+    location = _cached_location(guild_id)
+    if location is None:
+        location = default_location.copy()
+        changes = {**location, **changes}  # New guilds start from the default location
+    location.update(changes)
 
-    locations[str(guild_id)] = location
-    save_all_locations(locations)
+    _upsert_location(guild_id, changes)
+    _cache[guild_id] = location
+    print("✅ Location saved successfully.")
 
 def get_lat_lon(guild_id):
     loc = load_location(guild_id)
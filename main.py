@@ -1,19 +1,57 @@
 import discord
 from discord.ext import commands
+import aiohttp
+import argparse
 import asyncio
 import datetime
+import os
+import subprocess
+import sys
+import time
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from radar_updater import radar_updater, radar_task
+from radar_updater import radar_updater, restore_radar_state
 from server_config_manager import ensure_server_config
+from http_client import get_session, close_session
+from storage import close_connection
+from discord_dispatcher import dispatcher, PRIORITY_STATUS
+from metrics import start_metrics_server, stop_metrics_server, monitor_event_loop, METRICS_PORT
+from location_manager import load_all_locations
+from server_config_manager import load_all_server_configs
+from sharding import (
+    WORKER_PROCESSES, SHARD_COUNT, MIN_SHARDS_PER_WORKER, WORKER_ID,
+    is_worker, owns_guild, shards_for_worker, worker_shard_ids
+)
 
-from alerts_watcher import process_alerts, clear_status
-from daily_forecast import post_forecast
+from alerts_watcher import process_alerts, clear_status, next_poll_interval, consume_alerts, alert_queue
+from alerts_watcher import restore_alert_state, checkpoint_alert_state
+from alert_history import compact_history
+from message_cache import restore_message_ids
+from alert_sources import StreamingSource, ReplaySource
+from daily_forecast import post_forecasts
 from daily_spc_outlook import post_spc_outlook
 from commands import setup_commands  # Slash command setup
 
 # ======== CONFIGURATION ========
 from config import DISCORD_TOKEN
 from config import SYSTEM_MESSAGES_CHANNEL_ID, GUILD_ID
+
+try:
+    from config import ALERT_STREAM_URL  # Optional push feed, e.g. alert_test_server.py's /alerts/stream
+except ImportError:
+    ALERT_STREAM_URL = None
+
+try:
+    from config import ALERT_REPLAY_FILE  # Optional recorded event stream to play back, for drills and demos
+except ImportError:
+    ALERT_REPLAY_FILE = None
+
+try:
+    from config import ALERT_REPLAY_SPEED
+except ImportError:
+    ALERT_REPLAY_SPEED = 1.0
+
+DISCORD_API = "https://discord.com/api/v10"
+IDENTIFY_INTERVAL = 5  # Seconds Discord requires between shard logins
 # =================================
 
 # --- INTENTS ---
@@ -21,8 +59,38 @@ intents = discord.Intents.default()
 intents.message_content = True  # Required to edit messages
 
 # --- CREATE BOT ---
-bot = commands.Bot(command_prefix="!", intents=intents, help_command=None)
+class RadarBot(commands.AutoShardedBot):
+    """Bot that owns the shared upstream HTTP session for its whole lifetime."""
+
+    async def setup_hook(self):
+        # Pick up where the last run left off before any job can touch Discord
+        restore_message_ids()
+        restore_alert_state()
+        restore_radar_state()
+
+        get_session()
+        print("🔌 Shared HTTP session opened.")
+        try:
+            await start_metrics_server(port=METRICS_PORT + WORKER_ID)
+        except OSError as e:
+            print(f"⚠️ Failed to start metrics endpoint: {e}")
+        self.loop.create_task(monitor_event_loop())
+
+    async def close(self):
+        await dispatcher.stop()  # Waits for requests already sent, so their alert message IDs get saved
+        await stop_metrics_server()
+        await close_session()
+        checkpoint_alert_state()
+        close_connection()
+        await super().close()
+
+bot = RadarBot(
+    command_prefix="!", intents=intents, help_command=None, shard_count=SHARD_COUNT, shard_ids=worker_shard_ids()
+)
 scheduler = AsyncIOScheduler()
+alert_poll_interval = 120  # Seconds; retuned after every check by poll_alerts
+started = False  # on_ready runs again after every gateway reconnect; start up only once
+CHECKPOINT_INTERVAL = 5  # Minutes between saves of state that is cheap to lose
 
 # --- FUNCTIONS ---
 async def send_heartbeat(bot):
@@ -30,12 +98,28 @@ async def send_heartbeat(bot):
     channel = bot.get_channel(SYSTEM_MESSAGES_CHANNEL_ID)
     if channel:
         now = datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
-        await channel.send(f"✅ **Radarbot Heartbeat:** All systems operational as of {now} UTC.")
+        await dispatcher.send(channel, PRIORITY_STATUS, content=f"✅ **Radarbot Heartbeat:** All systems operational as of {now} UTC.")
         print(f"💓 Heartbeat sent at {now} UTC")
     else:
         print("⚠️ Could not find the system messages channel to send heartbeat.")
 
+async def checkpoint_state():
+    """Save the runtime state that isn't written through as it changes."""
+    checkpoint_alert_state()
+
 # --- EVENTS ---
+async def poll_alerts(bot):
+    """Check alerts, then retune the polling interval to the current hazard level."""
+    global alert_poll_interval
+    try:
+        await process_alerts(bot)
+    finally:
+        interval = await next_poll_interval()
+        if interval != alert_poll_interval:
+            scheduler.reschedule_job("process_alerts", trigger="interval", seconds=interval)
+            print(f"⏱️ Alert polling interval changed: {alert_poll_interval}s → {interval}s")
+            alert_poll_interval = interval
+
 @bot.event
 async def on_guild_join(guild):
     """When the bot joins a new server, create default config and send a welcome message."""
@@ -44,8 +128,9 @@ async def on_guild_join(guild):
 
     if guild.system_channel:
         try:
-            await guild.system_channel.send(
-                "**👋 Thanks for adding Radarbot!**\n\n"
+            await dispatcher.send(
+                guild.system_channel, PRIORITY_STATUS,
+                content="**👋 Thanks for adding Radarbot!**\n\n"
                 "I'm now watching your skies!\n\n"
                 "To get started, use these commands:\n"
                 "• `/setlocation` — set your server's location\n"
@@ -62,43 +147,123 @@ async def on_guild_join(guild):
 
 @bot.event
 async def on_ready():
-    print(f"✅ Logged in as {bot.user}")
+    global started
+    if started:
+        print(f"🔁 Reconnected as {bot.user}; jobs and loops are already running.")
+        return
+    started = True
+
+    print(f"✅ Logged in as {bot.user} on shard(s) {sorted(bot.shards)}")
+    home = owns_guild(GUILD_ID)  # Only the worker holding the home guild runs its jobs
 
     # Setup slash command handlers BEFORE syncing
     setup_commands(bot)
 
     # Register slash commands ONLY for your guild
-    try:
-        await bot.tree.sync(guild=discord.Object(id=GUILD_ID))
-        print(f"🛡️ Slash commands synced to guild ID: {GUILD_ID}")
-    except Exception as e:
-        print(f"⚠️ Failed to sync slash commands: {e}")
+    if home:
+        try:
+            await bot.tree.sync(guild=discord.Object(id=GUILD_ID))
+            print(f"🛡️ Slash commands synced to guild ID: {GUILD_ID}")
+        except Exception as e:
+            print(f"⚠️ Failed to sync slash commands: {e}")
 
+    # Every job has a fixed ID, so registering it again replaces it instead of adding a duplicate
     # Schedule the daily 7-day forecast at 7:00 AM
-    scheduler.add_job(post_forecast, 'cron', hour=7, minute=0, args=[bot, GUILD_ID])
+    scheduler.add_job(post_forecasts, 'cron', hour=7, minute=0, args=[bot], id="post_forecasts", replace_existing=True)
 
     # Schedule the daily SPC outlook at 7:05 AM
-    scheduler.add_job(post_spc_outlook, 'cron', hour=7, minute=5, args=[bot])
+    scheduler.add_job(
+        post_spc_outlook, 'cron', hour=7, minute=5, args=[bot], id="post_spc_outlook", replace_existing=True
+    )
+
+    # Schedule alert checking, starting at 2 minutes and adapting to the hazard level
+    scheduler.add_job(
+        poll_alerts, 'interval', seconds=alert_poll_interval, args=[bot], id="process_alerts", coalesce=True,
+        replace_existing=True
+    )
+
+    # Save soft state (last alert times, status texts) periodically
+    scheduler.add_job(
+        checkpoint_state, 'interval', minutes=CHECKPOINT_INTERVAL, id="checkpoint_state", replace_existing=True
+    )
 
-    # Schedule alert checking every 2 minutes
-    scheduler.add_job(process_alerts, 'interval', minutes=2, args=[bot])
+    if home:
+        # Schedule quiet "all clear" check every 30 minutes
+        scheduler.add_job(clear_status, 'interval', minutes=30, args=[bot], id="clear_status", replace_existing=True)
 
-    # Schedule quiet "all clear" check every 30 minutes
-    scheduler.add_job(clear_status, 'interval', minutes=30, args=[bot])
+        # Schedule bot heartbeat every 24 hours
+        scheduler.add_job(send_heartbeat, 'interval', hours=24, args=[bot], id="send_heartbeat", replace_existing=True)
 
-    # Schedule bot heartbeat every 24 hours
-    scheduler.add_job(send_heartbeat, 'interval', hours=24, args=[bot])
+        # Trim the alert history archive nightly at 3:30 AM
+        scheduler.add_job(compact_history, 'cron', hour=3, minute=30, id="compact_history", replace_existing=True)
 
-    # Start radar updater auto-loop
-    bot.loop.create_task(radar_updater(bot, GUILD_ID))
+    # Handle alerts from push sources the moment they arrive
+    bot.loop.create_task(consume_alerts(bot))
+    if ALERT_STREAM_URL:
+        bot.loop.create_task(StreamingSource(ALERT_STREAM_URL).run(alert_queue))
+    if ALERT_REPLAY_FILE:
+        bot.loop.create_task(ReplaySource(path=ALERT_REPLAY_FILE, speed=ALERT_REPLAY_SPEED).run(alert_queue))
+
+    # Start radar updater auto-loop; its first pass runs immediately and only
+    # edits guilds whose saved loop version is out of date
+    bot.loop.create_task(radar_updater(bot))
 
     # Start the scheduler
     scheduler.start()
 
-    # Post radar once immediately on startup
-    await radar_task(bot, GUILD_ID)
-
     print("🗓️ Scheduler and radar updater started.")
 
+# --- WORKERS ---
+async def recommended_shard_count():
+    """Ask Discord how many shards it recommends for this bot."""
+    async with aiohttp.ClientSession() as session:
+        async with session.get(f"{DISCORD_API}/gateway/bot", headers={"Authorization": f"Bot {DISCORD_TOKEN}"}) as resp:
+            resp.raise_for_status()
+            return (await resp.json())["shards"]
+
+def run_workers(worker_count):
+    """Run one bot process per worker, each owning a hashed subset of shards, until they all exit."""
+    # Import legacy JSON files once here instead of racing to do it in every worker
+    load_all_locations()
+    load_all_server_configs()
+    close_connection()
+
+    shard_count = SHARD_COUNT or max(asyncio.run(recommended_shard_count()), worker_count * MIN_SHARDS_PER_WORKER)
+    print(f"🧩 Running {shard_count} shard(s) across {worker_count} worker process(es).")
+
+    processes = []
+    try:
+        for worker_id in range(worker_count):
+            shards = shards_for_worker(worker_id, worker_count, shard_count)
+            if not shards:
+                print(f"⚠️ Worker {worker_id} owns no shards — not starting it.")
+                continue
+            env = dict(
+                os.environ, RADARBOT_WORKER_ID=str(worker_id),
+                RADARBOT_WORKER_COUNT=str(worker_count), RADARBOT_SHARD_COUNT=str(shard_count)
+            )
+            processes.append(subprocess.Popen([sys.executable, os.path.abspath(__file__)], env=env))
+            print(f"🧩 Worker {worker_id} started for shard(s) {shards} (pid {processes[-1].pid}).")
+            if worker_id < worker_count - 1:
+                time.sleep(len(shards) * IDENTIFY_INTERVAL)  # Let its shards log in before the next worker's
+        for process in processes:
+            process.wait()
+    except KeyboardInterrupt:
+        print("🛑 Stopping workers...")
+    finally:
+        for process in processes:
+            if process.poll() is None:
+                process.terminate()
+        for process in processes:
+            process.wait()
+
 # --- RUN BOT ---
-bot.run(DISCORD_TOKEN)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run Radarbot.")
+    parser.add_argument("--workers", type=int, default=WORKER_PROCESSES, help="Bot processes to split shards across")
+    args = parser.parse_args()
+
+    if args.workers > 1 and not is_worker():
+        run_workers(args.workers)
+    else:
+        bot.run(DISCORD_TOKEN)
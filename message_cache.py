@@ -0,0 +1,88 @@
+import asyncio
+import discord
+
+import storage
+from discord_dispatcher import dispatcher
+
+# --- CONFIGURATION ---
+from config import GUILD_ID, ALERT_STATUS_MESSAGE_ID, ALERT_TIMESTAMP_MESSAGE_ID, FORECAST_MESSAGE_ID
+
+try:
+    from config import RADAR_MESSAGE_ID
+except ImportError:
+    RADAR_MESSAGE_ID = None
+
+# Long-lived messages the bot keeps editing in place
+ALERT_STATUS = "alert status"
+ALERT_TIMESTAMP = "alert timestamp"
+FORECAST = "forecast"
+RADAR = "radar"
+KINDS = (ALERT_STATUS, ALERT_TIMESTAMP, FORECAST, RADAR)
+
+# (guild ID, kind) -> message ID, seeded with the home guild's configured messages
+_message_ids = {
+    (GUILD_ID, kind): message_id
+    for kind, message_id in (
+        (ALERT_STATUS, ALERT_STATUS_MESSAGE_ID),
+        (ALERT_TIMESTAMP, ALERT_TIMESTAMP_MESSAGE_ID),
+        (FORECAST, FORECAST_MESSAGE_ID),
+        (RADAR, RADAR_MESSAGE_ID)
+    )
+    if message_id is not None
+}
+_locks = {}  # (guild ID, kind) -> lock held while a replacement message is posted
+
+STATE_PREFIX = "message_ids:"  # bot_state key per guild -> {kind: message ID}
+
+def restore_message_ids():
+    """Load message handles saved by earlier runs, which win over config.py's."""
+    saved = storage.get_states(STATE_PREFIX)
+    for guild_id, kinds in saved.items():
+        for kind, message_id in kinds.items():
+            _message_ids[(int(guild_id), kind)] = message_id
+    print(f"♻️ Restored message handles for {len(saved)} guild(s).")
+
+def _save_guild(guild_id):
+    kinds = {kind: _message_ids[(guild_id, kind)] for kind in KINDS if (guild_id, kind) in _message_ids}
+    storage.set_state(f"{STATE_PREFIX}{guild_id}", kinds)
+
+def get_message_id(guild_id, kind):
+    return _message_ids.get((guild_id, kind))
+
+def remember_message(guild_id, kind, message_id):
+    _message_ids[(guild_id, kind)] = message_id
+    _save_guild(guild_id)
+
+def forget_message(guild_id, kind, message_id=None):
+    """Drop a cached handle (only if it still points at `message_id`, when given)."""
+    key = (guild_id, kind)
+    if message_id is None or _message_ids.get(key) == message_id:
+        _message_ids.pop(key, None)
+        _save_guild(guild_id)
+
+async def edit_or_post(channel, guild_id, kind, priority, **kwargs):
+    """Edit the guild's cached message in one call, posting a replacement if it's gone.
+
+    Returns the ID of the message that now holds the content.
+    """
+    key = (guild_id, kind)
+    message_id = _message_ids.get(key)
+    if message_id is not None:
+        try:
+            await dispatcher.edit(channel.get_partial_message(message_id), priority, **kwargs)
+            return message_id
+        except discord.NotFound:
+            print(f"⚠️ {kind.capitalize()} message {message_id} not found in guild {guild_id}. Posting a new one...")
+            forget_message(guild_id, kind, message_id)
+
+    async with _locks.setdefault(key, asyncio.Lock()):
+        # A concurrent caller may have already replaced the missing message
+        replacement = _message_ids.get(key)
+        if replacement is not None:
+            await dispatcher.edit(channel.get_partial_message(replacement), priority, **kwargs)
+            return replacement
+
+        message = await dispatcher.send(channel, priority, **kwargs)
+        remember_message(guild_id, kind, message.id)
+        print(f"📌 New {kind} message posted in guild {guild_id}. ID: {message.id}")
+        return message.id
@@ -0,0 +1,193 @@
+import asyncio
+import bisect
+import collections
+import contextlib
+import functools
+import math
+import time
+
+from aiohttp import web, TraceConfig
+
+try:
+    from config import METRICS_PORT
+except ImportError:
+    METRICS_PORT = 9108
+
+METRICS_HOST = "127.0.0.1"  # Local scrape endpoint only
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+RESERVOIR_SIZE = 1024  # Recent samples kept per series for p50/p95/p99
+
+HELP = {
+    "radarbot_upstream_request_seconds": "Upstream HTTP request latency (time to response headers).",
+    "radarbot_upstream_errors_total": "Upstream HTTP requests that failed or returned an error status.",
+    "radarbot_discord_call_seconds": "Discord API call latency through the dispatcher.",
+    "radarbot_discord_queue_seconds": "Time a Discord call waited in the dispatcher queue.",
+    "radarbot_discord_errors_total": "Discord API calls that raised.",
+    "radarbot_job_seconds": "Scheduled job run time.",
+    "radarbot_job_errors_total": "Scheduled job runs that raised.",
+    "radarbot_alert_delivery_seconds": "Alert issued (NWS published time) to first posted in Discord.",
+    "radarbot_event_loop_lag_seconds": "How late the event loop woke a sleeping task.",
+}
+LOOP_LAG_INTERVAL = 0.25  # Seconds between event loop lag probes
+
+class Histogram:
+    """Cumulative bucket counts for Prometheus plus a reservoir of recent samples for percentiles."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.recent = collections.deque(maxlen=RESERVOIR_SIZE)
+
+    def observe(self, value):
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.counts):
+            self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+        self.recent.append(value)
+
+    def percentile(self, q):
+        """Nearest-rank percentile over recent samples (None if there are none)."""
+        if not self.recent:
+            return None
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, max(0, math.ceil(q / 100 * len(ordered)) - 1))]
+
+# (metric name, sorted label items) -> Histogram / count
+_histograms = {}
+_counters = collections.Counter()
+
+def observe(name, seconds, **labels):
+    key = (name, tuple(sorted(labels.items())))
+    histogram = _histograms.get(key)
+    if histogram is None:
+        histogram = _histograms[key] = Histogram()
+    histogram.observe(seconds)
+
+def inc(name, amount=1, **labels):
+    _counters[(name, tuple(sorted(labels.items())))] += amount
+
+@contextlib.contextmanager
+def timed(name, error_counter=None, **labels):
+    """Record the duration of the block in `name`, counting exceptions in `error_counter`."""
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        if error_counter:
+            inc(error_counter, **labels)
+        raise
+    finally:
+        observe(name, time.perf_counter() - start, **labels)
+
+def timed_job(job):
+    """Decorator recording an async job's run time and failures."""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            with timed("radarbot_job_seconds", "radarbot_job_errors_total", job=job):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+async def monitor_event_loop(interval=LOOP_LAG_INTERVAL):
+    """Forever record how late the loop wakes a task sleeping for `interval` seconds."""
+    loop = asyncio.get_running_loop()
+    while True:
+        start = loop.time()
+        await asyncio.sleep(interval)
+        observe("radarbot_event_loop_lag_seconds", max(0.0, loop.time() - start - interval))
+
+# --- UPSTREAM HTTP (aiohttp tracing on the shared session) ---
+async def _on_request_start(session, ctx, params):
+    ctx.start = time.perf_counter()
+
+async def _on_request_end(session, ctx, params):
+    host = params.url.host
+    observe("radarbot_upstream_request_seconds", time.perf_counter() - ctx.start, host=host, method=params.method)
+    if params.response.status >= 400:
+        inc("radarbot_upstream_errors_total", host=host, reason=str(params.response.status))
+
+async def _on_request_exception(session, ctx, params):
+    host = params.url.host
+    observe("radarbot_upstream_request_seconds", time.perf_counter() - ctx.start, host=host, method=params.method)
+    inc("radarbot_upstream_errors_total", host=host, reason=type(params.exception).__name__)
+
+def upstream_trace_config():
+    """aiohttp TraceConfig timing every request made through a session, labelled by host."""
+    trace_config = TraceConfig()
+    trace_config.on_request_start.append(_on_request_start)
+    trace_config.on_request_end.append(_on_request_end)
+    trace_config.on_request_exception.append(_on_request_exception)
+    return trace_config
+
+# --- EXPOSITION ---
+def _format_labels(labels, extra=()):
+    items = [*labels, *extra]
+    if not items:
+        return ""
+    escaped = (str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, v in items)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(items, escaped)) + "}"
+
+def render_prometheus():
+    """Render every metric in the Prometheus text exposition format."""
+    lines = []
+    seen = set()
+
+    def header(name, kind):
+        if name not in seen:
+            seen.add(name)
+            if name in HELP:
+                lines.append(f"# HELP {name} {HELP[name]}")
+            lines.append(f"# TYPE {name} {kind}")
+
+    for (name, labels), histogram in sorted(_histograms.items()):
+        header(name, "histogram")
+        cumulative = 0
+        for bound, count in zip(histogram.buckets, histogram.counts):
+            cumulative += count
+            lines.append(f"{name}_bucket{_format_labels(labels, [('le', bound)])} {cumulative}")
+        lines.append(f"{name}_bucket{_format_labels(labels, [('le', '+Inf')])} {histogram.count}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {histogram.sum}")
+        lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+
+    for (name, labels), value in sorted(_counters.items()):
+        header(name, "counter")
+        lines.append(f"{name}{_format_labels(labels)} {value}")
+    return "\n".join(lines) + "\n"
+
+def summary():
+    """Return [(metric name, labels dict, count, p50, p95, p99)] for every histogram."""
+    return [
+        (name, dict(labels), histogram.count, *(histogram.percentile(q) for q in (50, 95, 99)))
+        for (name, labels), histogram in sorted(_histograms.items())
+    ]
+
+def counters():
+    """Return [(metric name, labels dict, value)] for every counter."""
+    return [(name, dict(labels), value) for (name, labels), value in sorted(_counters.items())]
+
+async def _handle_metrics(request):
+    return web.Response(text=render_prometheus(), content_type="text/plain", charset="utf-8")
+
+_runner = None
+
+async def start_metrics_server(host=METRICS_HOST, port=METRICS_PORT):
+    """Serve /metrics for Prometheus on a local port."""
+    global _runner
+    if _runner is not None:
+        return
+    app = web.Application()
+    app.router.add_get("/metrics", _handle_metrics)
+    _runner = web.AppRunner(app, access_log=None)
+    await _runner.setup()
+    await web.TCPSite(_runner, host, port).start()
+    print(f"📈 Metrics endpoint listening on http://{host}:{port}/metrics")
+
+async def stop_metrics_server():
+    global _runner
+    if _runner is not None:
+        await _runner.cleanup()
+        _runner = None
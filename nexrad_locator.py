@@ -1,3 +1,4 @@
+import heapq
 import math
 
 NEXRAD_STATIONS = [
@@ -160,15 +161,97 @@ def haversine(lat1, lon1, lat2, lon2):
 
     return R * c
 
+# --- SPATIAL INDEX ---
+EARTH_RADIUS_KM = 6371
+GRID_CELL_DEGREES = 1.0
+
+def _unit_vector(lat, lon):
+    phi = math.radians(lat)
+    lam = math.radians(lon)
+    return (math.cos(phi) * math.cos(lam), math.cos(phi) * math.sin(lam), math.sin(phi))
+
+# Station IDs and unit vectors, precomputed once at import
+STATION_IDS = [station["id"] for station in NEXRAD_STATIONS]
+STATION_VECTORS = [_unit_vector(station["lat"], station["lon"]) for station in NEXRAD_STATIONS]
+
+_cell_rankings = {}    # (row, col) -> (corner radius, [(angle from cell center, station index)] nearest first)
+_cell_candidates = {}  # (row, col) -> indexes of stations that can be nearest within the cell
+
+def _angle(u, v):
+    """Central angle (radians) between two unit vectors."""
+    dot = u[0] * v[0] + u[1] * v[1] + u[2] * v[2]
+    return math.acos(max(-1.0, min(1.0, dot)))
+
+def _cell_ranking(row, col):
+    """Return a grid cell's corner radius and every station ranked by angle from its center."""
+    ranking = _cell_rankings.get((row, col))
+    if ranking is None:
+        lat0, lon0 = row * GRID_CELL_DEGREES, col * GRID_CELL_DEGREES
+        center = _unit_vector(lat0 + GRID_CELL_DEGREES / 2, lon0 + GRID_CELL_DEGREES / 2)
+        radius = max(
+            _angle(center, _unit_vector(lat, lon))
+            for lat in (lat0, lat0 + GRID_CELL_DEGREES)
+            for lon in (lon0, lon0 + GRID_CELL_DEGREES)
+        )
+        ranking = (radius, sorted((_angle(center, vector), i) for i, vector in enumerate(STATION_VECTORS)))
+        _cell_rankings[(row, col)] = ranking
+    return ranking
+
+def _candidates_for_cell(row, col):
+    """Return the stations that can be nearest to any point in a grid cell.
+
+    For a cell with center c and corner radius r, every point's nearest
+    station lies within (nearest distance to c) + 2r of c.
+    """
+    candidates = _cell_candidates.get((row, col))
+    if candidates is None:
+        radius, ranking = _cell_ranking(row, col)
+        cutoff = ranking[0][0] + 2 * radius + 1e-9
+        candidates = [i for angle, i in ranking if angle <= cutoff]
+        _cell_candidates[(row, col)] = candidates
+    return candidates
+
+def _nearest_index(lat, lon):
+    x, y, z = _unit_vector(lat, lon)
+    row = math.floor(lat / GRID_CELL_DEGREES)
+    col = math.floor(lon / GRID_CELL_DEGREES)
+
+    best_index = None
+    best_dot = -2.0
+    for i in _candidates_for_cell(row, col):
+        sx, sy, sz = STATION_VECTORS[i]
+        dot = x * sx + y * sy + z * sz
+        if dot > best_dot:
+            best_dot = dot
+            best_index = i
+    return best_index
+
 def get_nearest_station(lat, lon):
     """Return the NEXRAD station ID closest to given lat/lon."""
-    closest_station = None
-    min_distance = float('inf')
+    return STATION_IDS[_nearest_index(lat, lon)]
+
+def get_nearest_stations(lats, lons):
+    """Return the closest NEXRAD station ID for each lat/lon pair, in order."""
+    return [STATION_IDS[_nearest_index(lat, lon)] for lat, lon in zip(lats, lons)]
+
+def get_k_nearest_stations(lat, lon, k=3):
+    """Return the k closest stations as (station ID, distance in km), nearest first.
 
-    for station in NEXRAD_STATIONS:
-        distance = haversine(lat, lon, station["lat"], station["lon"])
-        if distance < min_distance:
-            min_distance = distance
-            closest_station = station["id"]
+    Walks stations outward from the point's grid cell center and stops once
+    the next one is too far from the center to beat the k found so far.
+    """
+    if k < 1:
+        return []
+    point = _unit_vector(lat, lon)
+    radius, ranking = _cell_ranking(math.floor(lat / GRID_CELL_DEGREES), math.floor(lon / GRID_CELL_DEGREES))
 
-    return closest_station
\ No newline at end of file
+    best = []  # Max-heap of (-angle, station index) holding the k nearest so far
+    for center_angle, i in ranking:
+        if len(best) == k and center_angle - radius > -best[0][0]:
+            break
+        angle = _angle(point, STATION_VECTORS[i])
+        if len(best) < k:
+            heapq.heappush(best, (-angle, i))
+        elif angle < -best[0][0]:
+            heapq.heapreplace(best, (-angle, i))
+    return [(STATION_IDS[i], EARTH_RADIUS_KM * -negative) for negative, i in sorted(best, reverse=True)]
@@ -1,77 +1,153 @@
 import discord
 import datetime
 import asyncio
+import zlib
 
-from config import RADAR_CHANNEL_ID
+import storage
+from config import RADAR_CHANNEL_ID, GUILD_ID
 from location_manager import get_lat_lon, get_station_id
-from nexrad_locator import get_nearest_station
-
-try:
-    from config import RADAR_MESSAGE_ID
-except ImportError:
-    RADAR_MESSAGE_ID = None
+from nexrad_locator import get_nearest_stations
+from server_config_manager import get_server_config
+from http_client import get_session
+from discord_dispatcher import PRIORITY_RADAR
+from message_cache import edit_or_post, RADAR
+from metrics import timed_job
+from sharding import fetch_shared
 
+RIDGE_URL = "https://radar.weather.gov/ridge/standard"
 UPDATE_INTERVAL = 300  # 5 minutes
+SHARED_VERSION_TTL = 60  # Seconds one worker's freshness check serves every worker
 
-radar_message = None  # Will store the radar message object
+radar_versions = {}    # Guild ID -> (station, loop version) its message currently shows
+station_versions = {}  # Station -> last seen loop version (ETag or Last-Modified)
 
-async def radar_task(bot, guild_id):
-    global radar_message
+STATE_PREFIX = "radar_version:"  # bot_state key per guild -> [station, loop version]
 
-    channel = bot.get_channel(RADAR_CHANNEL_ID)
-    if channel is None:
-        print("⚠️ Radar channel not found.")
-        return
+def restore_radar_state():
+    """Load the loop each guild's radar message showed before a restart, so it isn't re-edited."""
+    for guild_id, (station, version) in storage.get_states(STATE_PREFIX).items():
+        radar_versions[int(guild_id)] = (station, version)
+    print(f"♻️ Restored radar versions for {len(radar_versions)} guild(s).")
+
+def get_radar_channel_id(guild_id):
+    """Return the guild's radar channel, falling back to config.py for the home guild."""
+    channel_id = get_server_config(guild_id).get("radar_channel")
+    if channel_id is None and guild_id == GUILD_ID:
+        return RADAR_CHANNEL_ID
+    return channel_id
+
+def group_guilds_by_station(guild_ids):
+    """Group guilds that have a radar channel by their resolved station."""
+    stations = {}
+    unresolved = []  # Guilds without an override, resolved in one batched lookup
+    for guild_id in guild_ids:
+        if get_radar_channel_id(guild_id) is None:
+            continue
+        station_id = get_station_id(guild_id)
+        if station_id:
+            stations.setdefault(station_id.upper(), []).append(guild_id)
+        else:
+            unresolved.append(guild_id)
+
+    if unresolved:
+        coords = [get_lat_lon(guild_id) for guild_id in unresolved]
+        nearest = get_nearest_stations([lat for lat, _ in coords], [lon for _, lon in coords])
+        for guild_id, radar_code in zip(unresolved, nearest):
+            stations.setdefault(radar_code, []).append(guild_id)
+    return stations
 
-    # Check if station ID is explicitly set
-    station_id = get_station_id(guild_id)
+def get_radar_url(radar_code):
+    return f"{RIDGE_URL}/{radar_code}_loop.gif"
 
-    if station_id:
-        radar_code = station_id.upper()
-        print(f"📡 Using overridden station ID: {radar_code}")
-    else:
-        lat, lon = get_lat_lon(guild_id)
-        radar_code = get_nearest_station(lat, lon)
-        print(f"📡 Using nearest station: {radar_code} for lat/lon {lat}, {lon}")
+async def fetch_station_version(radar_code, session=None):
+    """HEAD the station's loop GIF and return its ETag/Last-Modified, or None if unknown."""
+    session = session or get_session()
+    known = station_versions.get(radar_code)
+    headers = {}
+    if known is not None:
+        headers["If-None-Match" if known.startswith(('"', "W/")) else "If-Modified-Since"] = known
 
-    radar_url = f"https://radar.weather.gov/ridge/standard/{radar_code}_loop.gif"
+    try:
+        async with session.head(get_radar_url(radar_code), headers=headers) as resp:
+            if resp.status == 304 and known is not None:
+                return known
+            if resp.status != 200:
+                print(f"⚠️ Radar loop HEAD for {radar_code} returned {resp.status}.")
+                return None
+            version = resp.headers.get("ETag") or resp.headers.get("Last-Modified")
+    except Exception as e:
+        print(f"⚠️ Failed to check radar freshness for {radar_code}: {e}")
+        return None
 
+    if version is not None:
+        station_versions[radar_code] = version
+    return version
+
+async def shared_station_version(radar_code):
+    """Return the station's loop version, checked by one worker on behalf of all of them."""
+    async def fetch():
+        return await fetch_station_version(radar_code), True
+    version, _ = await fetch_shared(f"radar:{radar_code}", fetch, SHARED_VERSION_TTL)
+    return version
+
+def build_radar_embed(radar_code, version):
     embed = discord.Embed(
         title=f"🌩️ Live Radar near {radar_code}",
         description=f"Updated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
         color=discord.Color.blue()
     )
-    embed.set_image(url=f"{radar_url}?{datetime.datetime.now().timestamp()}")
-
-    if radar_message is None:
-        if RADAR_MESSAGE_ID is not None:
-            try:
-                radar_message = await channel.fetch_message(RADAR_MESSAGE_ID)
-                await radar_message.edit(embed=embed)
-                print(f"✅ Radar message updated at {datetime.datetime.now()}")
-            except discord.NotFound:
-                print("⚠️ RADAR_MESSAGE_ID not found. Posting new radar message...")
-                radar_message = await channel.send(embed=embed)
-                print(f"📌 New radar message posted. ID: {radar_message.id}")
-                print("👉 Please add this ID to your config.py as RADAR_MESSAGE_ID.")
-        else:
-            radar_message = await channel.send(embed=embed)
-            print(f"📌 First-time radar message posted. ID: {radar_message.id}")
-            print("👉 Please copy this ID and add it to config.py as RADAR_MESSAGE_ID.")
-    else:
-        try:
-            await radar_message.edit(embed=embed)
-            print(f"✅ Radar updated at {datetime.datetime.now()}")
-        except Exception as e:
-            print(f"❌ Failed to update radar message: {e}")
+    # Cache-buster tied to the product version, so Discord only re-fetches a new loop
+    embed.set_image(url=f"{get_radar_url(radar_code)}?v={zlib.crc32(version.encode()):08x}")
+    return embed
+
+async def update_guild_radar(bot, guild_id, embed, version):
+    """Edit a guild's radar message, posting a new one if it doesn't exist yet."""
+    channel = bot.get_channel(get_radar_channel_id(guild_id))
+    if channel is None:
+        print(f"⚠️ Radar channel not found for guild {guild_id}.")
+        return None
+
+    await edit_or_post(channel, guild_id, RADAR, PRIORITY_RADAR, embed=embed)
+    radar_versions[guild_id] = version
+    return guild_id
+
+@timed_job("radar_task")
+async def radar_task(bot):
+    """Refresh radar for guilds whose station has a new loop, building each embed once."""
+    stations = group_guilds_by_station(guild.id for guild in bot.guilds)
+
+    versions = await asyncio.gather(*(shared_station_version(radar_code) for radar_code in stations))
+
+    updates = []
+    for (radar_code, guild_ids), version in zip(stations.items(), versions):
+        if version is None:
+            version = str(datetime.datetime.now().timestamp())  # Unknown freshness — always refresh
+        stale = [g for g in guild_ids if radar_versions.get(g) != (radar_code, version)]
+        if not stale:
+            continue
+
+        embed = build_radar_embed(radar_code, version)
+        updates.extend(
+            update_guild_radar(bot, guild_id, embed, (radar_code, version)) for guild_id in stale
+        )
+
+    results = await asyncio.gather(*updates, return_exceptions=True)
+    failures = [r for r in results if isinstance(r, Exception)]
+    for error in failures:
+        print(f"❌ Failed to update radar message: {error}")
+
+    updated = [r for r in results if isinstance(r, int)]
+    storage.set_states({f"{STATE_PREFIX}{guild_id}": list(radar_versions[guild_id]) for guild_id in updated})
+
+    print(f"✅ Radar updated for {len(results) - len(failures)} guild(s) across {len(stations)} station(s) at {datetime.datetime.now()}")
 
-async def radar_updater(bot, guild_id):
+async def radar_updater(bot):
     """Looping task to refresh radar every UPDATE_INTERVAL seconds."""
     await bot.wait_until_ready()
     print("🔄 radar_updater loop started.")
     while not bot.is_closed():
         try:
-            await radar_task(bot, guild_id)
+            await radar_task(bot)
         except Exception as e:
             print(f"❌ Unhandled error in radar updater loop: {e}")
         await asyncio.sleep(UPDATE_INTERVAL)
@@ -1,60 +1,93 @@
 import json
-import os
 
-CONFIG_FILE = "server_configs.json"
+import storage
+
+CONFIG_FILE = "server_configs.json"  # Legacy file, imported into the database once
 
 default_config = {
     "radar_channel": None,
     "forecast_channel": None,
     "alerts_channel": None,
     "system_channel": None,
-    "severe_role": None
+    "severe_role": None,
+    "watched_counties": None
 }
 
+_cache = {}  # Guild ID -> config dict (or None), mirrors the server_configs table
+_imported = False
+
+def _ensure_imported():
+    global _imported
+    if not _imported:
+        storage.import_json_once("server_configs", CONFIG_FILE, _upsert_config)
+        _imported = True
+
+def _upsert_config(guild_id, config):
+    values = {k: config[k] for k in default_config if k in config}
+    if values.get("watched_counties") is not None:
+        values["watched_counties"] = json.dumps(values["watched_counties"])
+    storage.upsert("server_configs", guild_id, values)
+
+def _row_to_config(row):
+    config = {k: row[k] for k in default_config}
+    if config["watched_counties"] is not None:
+        config["watched_counties"] = json.loads(config["watched_counties"])
+    return config
+
+def _cached_config(guild_id):
+    guild_id = int(guild_id)
+    if guild_id not in _cache:
+        _ensure_imported()
+        row = storage.fetch_row("server_configs", guild_id)
+        _cache[guild_id] = _row_to_config(row) if row is not None else None
+    return _cache[guild_id]
+
 def load_all_server_configs():
-    """Load all server configs from file."""
-    if not os.path.exists(CONFIG_FILE):
-        return {}
-    try:
-        with open(CONFIG_FILE, "r") as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"⚠️ Failed to load server config: {e}")
-        return {}
+    """Load all server configs, keyed by guild ID string."""
+    _ensure_imported()
+    configs = {}
+    for guild_id, row in storage.fetch_all("server_configs").items():
+        _cache[guild_id] = _row_to_config(row)
+        configs[str(guild_id)] = dict(_cache[guild_id])
+    return configs
 
 def save_all_server_configs(configs):
-    """Save all server configs to file."""
-    try:
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(configs, f, indent=4)
-        print("✅ Server configs saved successfully.")
-    except Exception as e:
-        print(f"❌ Failed to save server configs: {e}")
+    """Save many server configs at once."""
+    for guild_id, config in configs.items():
+        _upsert_config(int(guild_id), config)
+        _cache.pop(int(guild_id), None)
+    print("✅ Server configs saved successfully.")
 
 def get_server_config(guild_id):
-    configs = load_all_server_configs()
-    return configs.get(str(guild_id), default_config.copy())
+    config = _cached_config(guild_id)
+    return dict(config) if config is not None else default_config.copy()
 
-def set_server_config(guild_id, radar_channel=None, forecast_channel=None, alerts_channel=None, system_channel=None, severe_role=None):
-    configs = load_all_server_configs()
-    config = configs.get(str(guild_id), default_config.copy())
+def set_server_config(guild_id, radar_channel=None, forecast_channel=None, alerts_channel=None, system_channel=None, severe_role=None, watched_counties=None):
+    guild_id = int(guild_id)
+    changes = {}
 
     if radar_channel is not None:
-        config["radar_channel"] = radar_channel
+        changes["radar_channel"] = radar_channel
     if forecast_channel is not None:
-        config["forecast_channel"] = forecast_channel
+        changes["forecast_channel"] = forecast_channel
     if alerts_channel is not None:
-        config["alerts_channel"] = alerts_channel
+        changes["alerts_channel"] = alerts_channel
     if system_channel is not None:
-        config["system_channel"] = system_channel
+        changes["system_channel"] = system_channel
     if severe_role is not None:
-        config["severe_role"] = severe_role
+        changes["severe_role"] = severe_role
+    if watched_counties is not None:
+        changes["watched_counties"] = watched_counties
+
+    config = _cached_config(guild_id) or default_config.copy()
+    config.update(changes)
 
-    configs[str(guild_id)] = config
-    save_all_server_configs(configs)
+    _upsert_config(guild_id, changes)
+    _cache[guild_id] = config
+    print("✅ Server config saved successfully.")
 
 def ensure_server_config(guild_id):
-    configs = load_all_server_configs()
-    if str(guild_id) not in configs:
-        configs[str(guild_id)] = default_config.copy()
-        save_all_server_configs(configs)
+    guild_id = int(guild_id)
+    if _cached_config(guild_id) is None:
+        _upsert_config(guild_id, {})
+        _cache[guild_id] = default_config.copy()
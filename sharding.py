@@ -0,0 +1,87 @@
+import asyncio
+import hashlib
+import os
+import time
+
+import storage
+
+try:
+    from config import WORKER_PROCESSES  # Bot processes to run, each owning a subset of shards
+except ImportError:
+    WORKER_PROCESSES = 1
+
+try:
+    from config import SHARD_COUNT  # Leave unset to use Discord's recommended count
+except ImportError:
+    SHARD_COUNT = None
+
+# Set by the supervisor in main.py for each worker process it starts
+WORKER_ID = int(os.environ.get("RADARBOT_WORKER_ID", 0))
+WORKER_COUNT = int(os.environ.get("RADARBOT_WORKER_COUNT", 1))
+if "RADARBOT_SHARD_COUNT" in os.environ:
+    SHARD_COUNT = int(os.environ["RADARBOT_SHARD_COUNT"])
+
+MIN_SHARDS_PER_WORKER = 4   # Keeps hashed shard ownership from leaving a worker idle
+SHARED_LEASE_SECONDS = 30   # How long one worker may spend refreshing shared data before another retries
+SHARED_WAIT_INTERVAL = 0.5  # Seconds between checks while another worker makes the first fetch
+
+_seen_versions = {}  # Shared cache key -> version this process last returned
+
+def is_worker():
+    """True when this process is one of several workers started by the supervisor."""
+    return WORKER_COUNT > 1
+
+def shard_for_guild(guild_id, shard_count):
+    """Return the shard Discord delivers a guild's events to."""
+    return (guild_id >> 22) % shard_count
+
+def worker_for_shard(shard_id, worker_count):
+    """Return the worker owning a shard, by rendezvous hashing so resizing the pool moves few shards."""
+    return max(range(worker_count), key=lambda worker: hashlib.sha1(f"{shard_id}:{worker}".encode()).digest())
+
+def shards_for_worker(worker_id, worker_count, shard_count):
+    return [shard for shard in range(shard_count) if worker_for_shard(shard, worker_count) == worker_id]
+
+def worker_shard_ids():
+    """Shard IDs this process should connect, or None to let discord.py run them all."""
+    if not is_worker():
+        return None
+    return shards_for_worker(WORKER_ID, WORKER_COUNT, SHARD_COUNT)
+
+def owns_guild(guild_id):
+    """True if this process is responsible for the guild (always, when not running as a worker)."""
+    if not is_worker():
+        return True
+    return worker_for_shard(shard_for_guild(guild_id, SHARD_COUNT), WORKER_COUNT) == WORKER_ID
+
+async def fetch_shared(key, fetch, ttl, encode=lambda value: value, decode=lambda value: value):
+    """Return (value, changed) for upstream data that every worker needs, fetched by only one of them.
+
+    `fetch()` returns (value, changed) like http_client.fetch_if_modified and is
+    simply awaited in a single process. With several workers, the first to find
+    the copy in SQLite older than `ttl` seconds refreshes it and the rest reuse
+    it; `changed` then means changed since this process last looked.
+    """
+    if not is_worker():
+        return await fetch()
+
+    while True:
+        now = time.time()
+        if storage.claim_shared(key, now, SHARED_LEASE_SECONDS):
+            try:
+                value, changed = await fetch()
+            except Exception:
+                storage.release_shared(key)
+                raise
+            first = storage.get_shared(key)["version"] == 0
+            version = storage.put_shared(key, encode(value), now + ttl, changed=changed or first)
+        else:
+            row = storage.get_shared(key)
+            if not row["version"]:
+                await asyncio.sleep(SHARED_WAIT_INTERVAL)  # First fetch still in flight in another worker
+                continue
+            value, version = decode(row["value"]), row["version"]
+
+        changed = version != _seen_versions.get(key)
+        _seen_versions[key] = version
+        return value, changed
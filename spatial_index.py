@@ -0,0 +1,50 @@
+import math
+
+CELL_SIZE = 1.0  # Grid cell size in degrees
+
+def point_in_polygon(lat, lon, polygon):
+    """Ray-casting test for a point inside a polygon of (lat, lon) vertices."""
+    inside = False
+    j = len(polygon) - 1
+    for i in range(len(polygon)):
+        lat_i, lon_i = polygon[i]
+        lat_j, lon_j = polygon[j]
+        if (lat_i > lat) != (lat_j > lat):
+            crossing_lon = lon_i + (lat - lat_i) * (lon_j - lon_i) / (lat_j - lat_i)
+            if lon < crossing_lon:
+                inside = not inside
+        j = i
+    return inside
+
+def _cell(lat, lon):
+    return math.floor(lat / CELL_SIZE), math.floor(lon / CELL_SIZE)
+
+class PolygonGrid:
+    """Uniform lat/lon grid of polygons, bucketed by bounding box."""
+
+    def __init__(self):
+        self._cells = {}  # (row, col) -> [(bbox, polygon, payload)]
+
+    def insert(self, polygon, payload):
+        lats = [p[0] for p in polygon]
+        lons = [p[1] for p in polygon]
+        bbox = (min(lats), min(lons), max(lats), max(lons))
+        row_min, col_min = _cell(bbox[0], bbox[1])
+        row_max, col_max = _cell(bbox[2], bbox[3])
+
+        item = (bbox, polygon, payload)
+        for row in range(row_min, row_max + 1):
+            for col in range(col_min, col_max + 1):
+                self._cells.setdefault((row, col), []).append(item)
+
+    def query(self, lat, lon):
+        """Return the payloads of every polygon containing the point."""
+        hits = []
+        for (min_lat, min_lon, max_lat, max_lon), polygon, payload in self._cells.get(_cell(lat, lon), ()):
+            if min_lat <= lat <= max_lat and min_lon <= lon <= max_lon and point_in_polygon(lat, lon, polygon):
+                hits.append(payload)
+        return hits
+
+    def query_points(self, points):
+        """Return point -> payloads for many points, testing each distinct point once."""
+        return {point: self.query(*point) for point in set(points)}
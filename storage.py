@@ -0,0 +1,200 @@
+import json
+import os
+import sqlite3
+
+DB_FILE = "radarbot.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS locations (
+    guild_id INTEGER PRIMARY KEY,
+    lat REAL,
+    lon REAL,
+    city TEXT,
+    state TEXT,
+    station_id TEXT
+);
+CREATE TABLE IF NOT EXISTS server_configs (
+    guild_id INTEGER PRIMARY KEY,
+    radar_channel INTEGER,
+    forecast_channel INTEGER,
+    alerts_channel INTEGER,
+    system_channel INTEGER,
+    severe_role INTEGER,
+    watched_counties TEXT
+);
+CREATE TABLE IF NOT EXISTS bot_state (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS json_imports (
+    name TEXT PRIMARY KEY
+);
+CREATE TABLE IF NOT EXISTS alert_history (
+    id INTEGER PRIMARY KEY,
+    alert_id TEXT NOT NULL UNIQUE,
+    event TEXT,
+    severity TEXT,
+    issued INTEGER NOT NULL,  -- Unix seconds
+    expires INTEGER,
+    title TEXT,
+    areas TEXT,
+    link TEXT,
+    summary BLOB              -- zlib-compressed; dropped once the alert is old enough
+);
+CREATE INDEX IF NOT EXISTS alert_history_event ON alert_history (event COLLATE NOCASE, issued);
+CREATE INDEX IF NOT EXISTS alert_history_issued ON alert_history (issued);
+CREATE TABLE IF NOT EXISTS alert_history_zones (
+    code TEXT NOT NULL,       -- SAME or UGC code
+    issued INTEGER NOT NULL,
+    alert INTEGER NOT NULL,   -- alert_history.id
+    PRIMARY KEY (code, issued, alert)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS shared_cache (
+    key TEXT PRIMARY KEY,
+    value TEXT,
+    version INTEGER NOT NULL DEFAULT 0,
+    fresh_until REAL NOT NULL DEFAULT 0,
+    lease_until REAL NOT NULL DEFAULT 0
+);
+"""
+
+_connection = None
+
+def get_connection():
+    """Return the shared SQLite connection, creating the database on first use."""
+    global _connection
+    if _connection is None:
+        _connection = sqlite3.connect(DB_FILE, isolation_level=None, check_same_thread=False)
+        _connection.row_factory = sqlite3.Row
+        _connection.execute("PRAGMA journal_mode=WAL")
+        _connection.execute("PRAGMA synchronous=NORMAL")  # Durable across app crashes in WAL mode
+        _connection.execute("PRAGMA busy_timeout=5000")
+        _connection.executescript(SCHEMA)
+    return _connection
+
+def close_connection():
+    global _connection
+    if _connection is not None:
+        _connection.close()
+        _connection = None
+
+def upsert(table, guild_id, values):
+    """Insert or update one guild row, touching only the given columns."""
+    columns = ["guild_id", *values]
+    placeholders = ", ".join("?" for _ in columns)
+    updates = ", ".join(f"{c} = excluded.{c}" for c in values)
+    conflict = f"DO UPDATE SET {updates}" if values else "DO NOTHING"
+    get_connection().execute(
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders}) ON CONFLICT(guild_id) {conflict}",
+        [guild_id, *values.values()]
+    )
+
+def fetch_row(table, guild_id):
+    row = get_connection().execute(f"SELECT * FROM {table} WHERE guild_id = ?", (guild_id,)).fetchone()
+    return dict(row) if row is not None else None
+
+def fetch_all(table):
+    return {row["guild_id"]: dict(row) for row in get_connection().execute(f"SELECT * FROM {table}")}
+
+def import_json_once(name, path, import_row):
+    """Import a legacy JSON file into SQLite the first time the database sees it.
+
+    import_row(guild_id, data) is called for each top-level entry inside one
+    transaction; the import is recorded so it never runs again.
+    """
+    conn = get_connection()
+    if conn.execute("SELECT 1 FROM json_imports WHERE name = ?", (name,)).fetchone():
+        return
+    if os.path.exists(path):
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"⚠️ Failed to read {path} for import: {e}")
+            return
+        conn.execute("BEGIN")
+        try:
+            for guild_id, entry in data.items():
+                import_row(int(guild_id), entry)
+            conn.execute("INSERT INTO json_imports (name) VALUES (?)", (name,))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        print(f"📥 Imported {len(data)} entries from {path} into {DB_FILE}.")
+    else:
+        conn.execute("INSERT INTO json_imports (name) VALUES (?)", (name,))
+
+def get_state(key, default=None):
+    """Return a JSON value from the bot_state table."""
+    row = get_connection().execute("SELECT value FROM bot_state WHERE key = ?", (key,)).fetchone()
+    return json.loads(row["value"]) if row is not None else default
+
+def set_state(key, value):
+    """Store a JSON-serializable value in the bot_state table."""
+    get_connection().execute(
+        "INSERT INTO bot_state (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+        (key, json.dumps(value))
+    )
+
+def delete_state(key):
+    """Remove a value from the bot_state table."""
+    get_connection().execute("DELETE FROM bot_state WHERE key = ?", (key,))
+
+def get_states(prefix):
+    """Return {key suffix: value} for every bot_state key starting with `prefix`."""
+    rows = get_connection().execute(
+        "SELECT key, value FROM bot_state WHERE substr(key, 1, ?) = ?", (len(prefix), prefix)
+    )
+    return {row["key"][len(prefix):]: json.loads(row["value"]) for row in rows}
+
+def set_states(values):
+    """Store several bot_state values in one transaction."""
+    if not values:
+        return
+    conn = get_connection()
+    conn.execute("BEGIN")
+    try:
+        conn.executemany(
+            "INSERT INTO bot_state (key, value) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            [(key, json.dumps(value)) for key, value in values.items()]
+        )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+def get_shared(key):
+    """Return the shared_cache row for `key` as a dict with its value decoded (None if absent)."""
+    row = get_connection().execute("SELECT * FROM shared_cache WHERE key = ?", (key,)).fetchone()
+    if row is None:
+        return None
+    row = dict(row)
+    row["value"] = json.loads(row["value"]) if row["value"] is not None else None
+    return row
+
+def claim_shared(key, now, lease_seconds):
+    """Atomically take the right to refresh `key` if it is stale and nobody else holds it."""
+    conn = get_connection()
+    conn.execute("INSERT OR IGNORE INTO shared_cache (key) VALUES (?)", (key,))
+    cursor = conn.execute(
+        "UPDATE shared_cache SET lease_until = ? WHERE key = ? AND fresh_until <= ? AND lease_until <= ?",
+        (now + lease_seconds, key, now, now)
+    )
+    return cursor.rowcount == 1
+
+def put_shared(key, value, fresh_until, changed=True):
+    """Store a refreshed value and release the lease; returns the row's version."""
+    conn = get_connection()
+    if changed:
+        conn.execute(
+            "UPDATE shared_cache SET value = ?, version = version + 1, fresh_until = ?, lease_until = 0 WHERE key = ?",
+            (json.dumps(value), fresh_until, key)
+        )
+    else:
+        conn.execute("UPDATE shared_cache SET fresh_until = ?, lease_until = 0 WHERE key = ?", (fresh_until, key))
+    return conn.execute("SELECT version FROM shared_cache WHERE key = ?", (key,)).fetchone()["version"]
+
+def release_shared(key):
+    """Give up a lease after a failed refresh so another worker can retry."""
+    get_connection().execute("UPDATE shared_cache SET lease_until = 0 WHERE key = ?", (key,))
@@ -0,0 +1,18 @@
+import os
+import sys
+import types
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import config  # noqa: F401
+except ImportError:
+    # Modules read channel/message IDs from config.py at import time; tests never talk to Discord
+    sys.modules["config"] = types.SimpleNamespace(
+        DISCORD_TOKEN="test", GUILD_ID=1, SYSTEM_MESSAGES_CHANNEL_ID=2, RADAR_CHANNEL_ID=3,
+        ALERTS_CHANNEL_ID=4, ALERT_STATUS_MESSAGE_ID=5, ALERT_TIMESTAMP_MESSAGE_ID=6,
+        FORECAST_CHANNEL_ID=7, FORECAST_MESSAGE_ID=8
+    )
+
+import storage
+storage.DB_FILE = ":memory:"  # Never touch the real radarbot.db
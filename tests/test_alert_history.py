@@ -0,0 +1,15 @@
+import alert_history
+from alert_parser import Alert
+
+def test_query_accepts_more_codes_than_a_compound_select_allows():
+    codes = {f"TXC{n:03}" for n in range(1, 508, 2)} | {f"TXZ{n:03}" for n in range(1, 300)}
+    assert len(codes) > 500  # SQLite's limit on UNION terms
+    alert_history.archive_alerts([
+        Alert("urn:oid:history-1", title="Tornado Warning", event="Tornado Warning",
+              codes=frozenset({"TXC451"}), issued="2026-05-01T12:00:00-05:00"),
+        Alert("urn:oid:history-2", title="Flood Watch", event="Flood Watch",
+              codes=frozenset({"OKC027"}), issued="2026-05-01T12:00:00-05:00"),
+    ])
+
+    assert alert_history.count_history(codes=codes) == 1
+    assert [alert["id"] for alert in alert_history.query_history(codes=codes)] == ["urn:oid:history-1"]
@@ -0,0 +1,71 @@
+import asyncio
+import datetime
+
+import alerts_watcher
+import storage
+from alert_parser import Alert
+from discord_dispatcher import dispatcher
+from location_manager import save_location
+
+def test_checkpoint_skips_guilds_owned_by_other_workers(monkeypatch):
+    moment = datetime.datetime(2026, 5, 1, 12, tzinfo=datetime.timezone.utc)
+    fresher = (moment + datetime.timedelta(hours=1)).isoformat()  # Saved by the worker that owns guild 200
+    storage.set_states({"last_alert_time:200": fresher})
+    monkeypatch.setattr(alerts_watcher, "owns_guild", lambda guild_id: guild_id == 100)
+    monkeypatch.setattr(alerts_watcher, "last_alert_times", {100: moment, 200: moment})
+    monkeypatch.setattr(alerts_watcher, "last_status_texts", {100: "mine", 200: "stale"})
+
+    alerts_watcher.checkpoint_alert_state()
+
+    assert storage.get_states("last_alert_time:") == {"100": moment.isoformat(), "200": fresher}
+    assert storage.get_states("status_text:") == {"100": "mine"}
+
+class FakeMessage:
+    def __init__(self, message_id):
+        self.id = message_id
+
+class FakeChannel:
+    """Posts "fast" at once, "slow" after a moment, and never answers for "hung"."""
+
+    def __init__(self):
+        self.id = 300
+
+    async def send(self, content=None, **kwargs):
+        if "hung" in content:
+            await asyncio.Event().wait()
+        if "slow" in content:
+            await asyncio.sleep(0.2)
+        return FakeMessage(len(content))
+
+def test_confirmed_posts_are_saved_before_reconcile_finishes(monkeypatch):
+    monkeypatch.setattr(alerts_watcher, "alert_messages", {})
+    alerts = [
+        Alert(f"urn:oid:{name}", title=name, link="https://example.com", summary=name)
+        for name in ("fast", "slow", "hung")
+    ]
+
+    async def main():
+        reconcile = asyncio.ensure_future(alerts_watcher.reconcile_alerts(FakeChannel(), 300, alerts))
+        await asyncio.sleep(0.05)
+        await dispatcher.stop(timeout=0.5)  # Shutdown lets the slow post finish and gives up on the hung one
+        assert not reconcile.done()
+        reconcile.cancel()
+
+    asyncio.run(main())
+
+    saved = storage.get_states("alert_messages:300:")
+    assert sorted(saved) == ["urn:oid:fast", "urn:oid:slow"]
+
+    for name in ("alert_messages", "last_alert_times", "last_status_texts"):
+        monkeypatch.setattr(alerts_watcher, name, {})
+    alerts_watcher.restore_alert_state()
+    assert alerts_watcher.alert_messages[300]["urn:oid:fast"] == saved["urn:oid:fast"]
+
+def test_guilds_without_a_location_get_no_polygon_point():
+    save_location(401, lat=35.2, lon=-97.4, city="Norman", state="OK")
+    alerts_watcher.invalidate_county_index()
+    _, _, points = alerts_watcher.get_county_index([alerts_watcher.GUILD_ID, 401, 402])
+
+    routed = {guild_id for guild_ids in points.values() for guild_id in guild_ids}
+    assert routed == {alerts_watcher.GUILD_ID, 401}
+    assert points[(35.2, -97.4)] == {401}
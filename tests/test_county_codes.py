@@ -0,0 +1,20 @@
+from county_codes import county_zone_codes, zone_codes_for_counties
+
+def test_counties_outside_texas_resolve():
+    assert county_zone_codes("Cleveland", "OK") == {"040027", "OKC027"}
+    assert county_zone_codes("Orleans Parish", "la") == {"022071", "LAC071"}
+    assert county_zone_codes("Matanuska-Susitna Borough", "AK") == {"002170", "AKC170"}
+
+def test_county_names_are_matched_loosely():
+    assert county_zone_codes("saint marys", "MD") == county_zone_codes("St. Mary's County", "MD")
+    assert county_zone_codes("Dona Ana", "NM") == {"035013", "NMC013"}
+    assert county_zone_codes("Shackleford", "TX") == county_zone_codes("Shackelford", "TX")
+
+def test_independent_cities_stay_apart_from_counties():
+    assert county_zone_codes("Baltimore", "MD") == {"024005", "MDC005"}
+    assert county_zone_codes("Baltimore City", "MD") == {"024510", "MDC510"}
+    assert county_zone_codes("Norfolk", "VA") == {"051710", "VAC710"}
+
+def test_unknown_counties_and_raw_codes():
+    assert county_zone_codes("Tom Green", "OK") == set()
+    assert zone_codes_for_counties(["TXZ071", "048451"], "TX") == {"TXZ071", "048451"}
@@ -0,0 +1,46 @@
+from daily_spc_outlook import extract_risk, extract_summary, ISSUANCE_PATTERN
+
+# Day 1 outlook excerpt in SPC's text-product layout and wording
+ENHANCED_OUTLOOK = """
+SPC AC 271630
+
+Day 1 Convective Outlook
+NWS Storm Prediction Center Norman OK
+1130 AM CDT Sat Apr 27 2024
+
+Valid 271630Z - 281200Z
+
+...THERE IS A HIGH RISK OF SEVERE THUNDERSTORMS ACROSS PARTS OF
+CENTRAL OKLAHOMA...
+
+...THERE IS A MODERATE RISK OF SEVERE THUNDERSTORMS FROM NORTH TEXAS
+INTO CENTRAL KANSAS...
+
+...THERE IS AN ENHANCED RISK OF SEVERE THUNDERSTORMS ACROSS PARTS OF
+THE SOUTHERN AND CENTRAL PLAINS...
+
+...SUMMARY...
+Numerous severe thunderstorms are expected across the southern and
+central Plains this afternoon into tonight.
+
+...Central Oklahoma...
+"""
+
+def test_an_enhanced_risk_is_recognized():
+    text = (
+        "...THERE IS AN ENHANCED RISK OF SEVERE THUNDERSTORMS ACROSS PARTS OF\n"
+        "THE MID-SOUTH...\n\n"
+        "...THERE IS A SLIGHT RISK OF SEVERE THUNDERSTORMS ELSEWHERE...\n"
+    )
+    assert extract_risk(text) == "ENHANCED"
+
+def test_highest_risk_wins():
+    assert extract_risk(ENHANCED_OUTLOOK) == "HIGH"
+    assert extract_risk(ENHANCED_OUTLOOK.replace("A HIGH", "A SLIGHT").replace("A MODERATE", "A MARGINAL")) == "ENHANCED"
+
+def test_no_risk_line():
+    assert extract_risk("...NO SEVERE THUNDERSTORM AREAS FORECAST...") == "NONE"
+
+def test_issuance_and_summary():
+    assert ISSUANCE_PATTERN.search(ENHANCED_OUTLOOK).group(1) == "1130 AM CDT Sat Apr 27 2024"
+    assert extract_summary(ENHANCED_OUTLOOK).startswith("Numerous severe thunderstorms are expected")
@@ -0,0 +1,100 @@
+import asyncio
+import time
+
+from discord_dispatcher import Dispatcher, SlidingWindow, GLOBAL_LIMIT, ROUTE_LIMIT, PRIORITY_ALERT, worker_global_limit
+
+class FakeChannel:
+    def __init__(self, channel_id, calls):
+        self.id = channel_id
+        self.calls = calls
+
+    async def send(self, content=None, **kwargs):
+        self.calls.append(time.monotonic())
+        return content
+
+def max_in_window(times, period):
+    """Most calls that started within any `period`-second span."""
+    times = sorted(times)
+    most = 0
+    start = 0
+    for end, t in enumerate(times):
+        while t - times[start] >= period:
+            start += 1
+        most = max(most, end - start + 1)
+    return most
+
+def run_sends(dispatcher, channels, per_channel):
+    async def main():
+        futures = [
+            dispatcher.send(channel, PRIORITY_ALERT, content=str(i))
+            for i in range(per_channel) for channel in channels
+        ]
+        await asyncio.gather(*futures)
+        await dispatcher.stop()
+    asyncio.run(main())
+
+def test_global_window_never_exceeds_limit():
+    calls = []
+    dispatcher = Dispatcher()
+    dispatcher.set_limits(route_limit=(10 ** 6, 1.0))
+    run_sends(dispatcher, [FakeChannel(i, calls) for i in range(100)], per_channel=1)
+
+    limit, period = GLOBAL_LIMIT
+    assert len(calls) == 100
+    assert max_in_window(calls, period) <= limit
+    assert limit / period <= 50  # Discord's global limit
+
+def test_route_window_never_exceeds_limit():
+    # Same code path as the 5-per-5.5 s default, on a shorter period to keep the test fast
+    calls = []
+    dispatcher = Dispatcher()
+    dispatcher.set_limits(route_limit=(5, 0.5), global_limit=(10 ** 6, 1.0))
+    run_sends(dispatcher, [FakeChannel(1, calls)], per_channel=17)
+
+    assert len(calls) == 17
+    assert max_in_window(calls, 0.5) <= 5
+    assert ROUTE_LIMIT[0] <= 5 and ROUTE_LIMIT[1] >= 5.0  # Discord's per-channel message limit
+
+def test_sliding_window_has_no_burst_across_boundaries():
+    window = SlidingWindow(5, 1.0)
+    for now in (0.0, 0.1, 0.2, 0.3, 0.9):
+        assert window.delay(now) == 0
+        window.take(now)
+    # A token bucket would allow more requests right away; the window waits for the first to age out
+    assert abs(window.delay(0.95) - 0.05) < 1e-9
+    assert window.delay(1.0) == 0
+
+def test_workers_share_the_global_limit():
+    limit, period = GLOBAL_LIMIT
+    for worker_count in (1, 2, 4, 7):
+        share, share_period = worker_global_limit(worker_count)
+        assert share_period == period
+        assert share * worker_count <= limit
+
+class FakeMessage:
+    def __init__(self, calls):
+        self.id = 1
+        self.channel = FakeChannel(1, calls)
+
+    async def edit(self, content=None, **kwargs):
+        self.channel.calls.append(content)
+
+def test_coalesced_edit_runs_once_after_waiting_on_the_global_window():
+    calls = []
+    dispatcher = Dispatcher()
+    dispatcher.set_limits(route_limit=(10 ** 6, 1.0), global_limit=(1, 0.3))
+    message = FakeMessage(calls)
+
+    async def main():
+        first = dispatcher.edit(message, PRIORITY_ALERT, content="a")
+        await asyncio.sleep(0.05)
+        # Both edits merge into one job; re-queuing it puts a second copy in front of another worker
+        dispatcher.edit(message, PRIORITY_ALERT, content="b")
+        await asyncio.sleep(0.05)
+        merged = dispatcher.edit(message, PRIORITY_ALERT, content="c")
+        await asyncio.gather(first, merged)
+        await asyncio.sleep(0.7)  # Long enough for a duplicate to get through the window
+        await dispatcher.stop()
+
+    asyncio.run(main())
+    assert calls == ["a", "c"]
@@ -0,0 +1,18 @@
+from metrics import Histogram
+
+def histogram_of(values):
+    histogram = Histogram()
+    for value in values:
+        histogram.observe(value)
+    return histogram
+
+def test_percentile_uses_nearest_rank():
+    histogram = histogram_of([5, 3, 1, 4, 2])
+    assert histogram.percentile(50) == 3
+    assert histogram.percentile(95) == 5
+    assert histogram.percentile(0) == 1
+    assert histogram_of([1, 2, 3, 4]).percentile(50) == 2
+    assert histogram_of(range(1, 101)).percentile(99) == 99
+
+def test_percentile_of_nothing():
+    assert Histogram().percentile(50) is None
@@ -0,0 +1,15 @@
+import random
+
+from nexrad_locator import NEXRAD_STATIONS, get_k_nearest_stations, haversine
+
+def test_k_nearest_matches_brute_force():
+    rng = random.Random(7)
+    for _ in range(200):
+        lat, lon = rng.uniform(18, 65), rng.uniform(-165, -65)
+        nearest = get_k_nearest_stations(lat, lon, k=4)
+        expected = sorted(NEXRAD_STATIONS, key=lambda s: haversine(lat, lon, s["lat"], s["lon"]))[:4]
+        assert [station_id for station_id, _ in nearest] == [s["id"] for s in expected]
+
+def test_k_nearest_with_no_stations_requested():
+    assert get_k_nearest_stations(31.46, -100.44, k=0) == []
+    assert get_k_nearest_stations(31.46, -100.44, k=-1) == []